@@ -0,0 +1,173 @@
+"""
+Context Builder - Ranks and trims search passages before the extraction prompt
+
+Splits search results into sentences, scores them with BM25 against the
+query and the analysis' data_needed / key_metrics, boosts sentences that
+carry numbers, drops near-duplicates and keeps the best ones that fit a
+token budget. Kept sentences are re-grouped by source in their original
+order so the prompt still reads as per-source excerpts.
+"""
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.utils.text import STOP_WORDS
+
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+NUMBER_BOOST = 0.5  # score multiplier bonus for sentences with figures
+DUPLICATE_JACCARD = 0.8  # token-set overlap at which a sentence is redundant
+MIN_SENTENCE_TOKENS = 3
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'$€£(])|\n+")
+_TOKEN = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+_NUMBER = re.compile(r"\d")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (about four characters per token for English)"""
+    return math.ceil(len(text) / 4)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word/number tokens without stop words"""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def result_text(result: Dict[str, Any]) -> str:
+    """The text the extraction prompt uses for one search result"""
+    return result.get("snippet", result.get("content", "")) or ""
+
+
+def legacy_context(results: List[Dict[str, Any]]) -> str:
+    """Uncompressed context: every result's full snippet/content"""
+    return "\n\n".join([
+        f"Source {i+1}: {r.get('title', '')} - {result_text(r)}"
+        for i, r in enumerate(results)
+    ])
+
+
+class _Passage:
+    __slots__ = ("source", "position", "text", "tokens", "score")
+
+    def __init__(self, source: int, position: int, text: str, tokens: List[str]):
+        self.source = source
+        self.position = position
+        self.text = text
+        self.tokens = tokens
+        self.score = 0.0
+
+
+def _split_passages(results: List[Dict[str, Any]]) -> List[_Passage]:
+    passages = []
+    for source, result in enumerate(results):
+        for position, sentence in enumerate(_SENTENCE_END.split(result_text(result))):
+            sentence = sentence.strip()
+            tokens = tokenize(sentence)
+            if len(tokens) >= MIN_SENTENCE_TOKENS:
+                passages.append(_Passage(source, position, sentence, tokens))
+    return passages
+
+
+def _bm25(passages: List[_Passage], query_terms: Iterable[str]):
+    """Score passages in place with Okapi BM25"""
+    terms = set(query_terms)
+    if not passages or not terms:
+        return
+
+    count = len(passages)
+    avg_length = sum(len(p.tokens) for p in passages) / count
+    document_frequency = Counter(term for p in passages for term in set(p.tokens) & terms)
+
+    for passage in passages:
+        frequencies = Counter(token for token in passage.tokens if token in terms)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * len(passage.tokens) / avg_length)
+        score = 0.0
+        for term, frequency in frequencies.items():
+            df = document_frequency[term]
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        passage.score = score
+
+
+def _query_terms(query: str, query_analysis: Optional[Dict[str, Any]]) -> List[str]:
+    parts = [query]
+    for field in ("data_needed", "key_metrics"):
+        values = (query_analysis or {}).get(field) or []
+        if isinstance(values, str):
+            values = [values]
+        parts.extend(str(value) for value in values)
+    return tokenize(" ".join(parts))
+
+
+def build_context(
+    query: str,
+    results: List[Dict[str, Any]],
+    query_analysis: Optional[Dict[str, Any]] = None,
+    token_budget: int = 1200
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the search-results section of the extraction prompt
+
+    Args:
+        query: The research question
+        results: Search results (title plus snippet or content)
+        query_analysis: Query analysis; its data_needed and key_metrics
+            join the query as ranking terms
+        token_budget: Maximum estimated tokens for the returned context
+
+    Returns:
+        (context text, stats with original/compressed token estimates and
+        sentence counts)
+    """
+
+    passages = _split_passages(results)
+    _bm25(passages, _query_terms(query, query_analysis))
+    for passage in passages:
+        if _NUMBER.search(passage.text):
+            # Figures are what extraction needs; also lifts unmatched numeric sentences above zero
+            passage.score = (passage.score + 0.1) * (1 + NUMBER_BOOST)
+
+    # Greedy selection by score: skip near-duplicates and whatever no longer fits
+    headers = {i: f"Source {i+1}: {r.get('title', '')} - " for i, r in enumerate(results)}
+    selected: List[_Passage] = []
+    kept_sets: List[set] = []
+    used = 0
+    duplicates = 0
+    # Sentences with no query term and no figure are dropped, unless nothing matched at all
+    candidates = [p for p in passages if p.score > 0] or passages
+    for passage in sorted(candidates, key=lambda p: p.score, reverse=True):
+        token_set = set(passage.tokens)
+        if any(len(token_set & kept) / len(token_set | kept) >= DUPLICATE_JACCARD for kept in kept_sets):
+            duplicates += 1
+            continue
+        header_cost = 0 if any(p.source == passage.source for p in selected) else estimate_tokens(headers[passage.source])
+        cost = estimate_tokens(passage.text) + header_cost + 1
+        if used + cost > token_budget:
+            continue
+        selected.append(passage)
+        kept_sets.append(token_set)
+        used += cost
+
+    by_source: Dict[int, List[_Passage]] = {}
+    for passage in sorted(selected, key=lambda p: (p.source, p.position)):
+        by_source.setdefault(passage.source, []).append(passage)
+    context = "\n\n".join(
+        headers[source] + " ".join(p.text for p in source_passages)
+        for source, source_passages in by_source.items()
+    )
+
+    original_tokens = estimate_tokens(legacy_context(results))
+    compressed_tokens = estimate_tokens(context)
+    stats = {
+        "original_tokens": original_tokens,
+        "compressed_tokens": compressed_tokens,
+        "reduction": round(1 - compressed_tokens / original_tokens, 3) if original_tokens else 0.0,
+        "sentences": len(passages),
+        "kept": len(selected),
+        "duplicates": duplicates,
+        "sources": len(by_source),
+    }
+    return context, stats
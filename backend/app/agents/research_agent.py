@@ -4,56 +4,263 @@ Research Agent - Main research orchestrator with Groq, Serper, and Tavily
 import os
 import asyncio
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Awaitable, Optional, Tuple
 import httpx
-from groq import Groq
 
 from app.core.config import settings
+from app.core.llm import LLMClient
+from app.core.http import get_http_client
+from app.core.cache import cache_key, create_cache
+from app.core.rate_limit import get_rate_limiter
+from app.core.single_flight import SingleFlight
+from app.core.json_stream import Event
+from app.core.metrics import PROVIDER_ERRORS, PROVIDER_TIMEOUTS, STAGE_CUTS, STAGE_SECONDS
+from app.utils.text import normalize_query
+from app.core.deadline import Deadline
+from app.agents.scheduler import StageGraph
+from app.agents.context_builder import build_context, legacy_context
+from app.agents.result_merger import merge_results, result_url
+
+
+# "thorough" runs analysis, extraction and insights as three LLM calls;
+# "fast" gets all three from one combined completion after search
+RESEARCH_MODES = ("fast", "thorough")
+
+# Event type emitted when each pipeline stage completes
+STAGE_EVENTS = {
+    "analysis": "query_analysis",
+    "search": "sources",
+    "extraction": "structured_data",
+    "insights": "insights",
+}
+
+# Relative share of a deadline each stage may use (see StageGraph.budget)
+STAGE_WEIGHTS = {
+    "analysis": 1.0,
+    "search": 1.5,
+    "extraction": 2.0,
+    "insights": 1.5,
+    "synthesis": 3.0,
+}
+
+# JSON shapes the LLM is asked for, shared by the per-stage and combined prompts
+ANALYSIS_SCHEMA = """{
+    "intent": "trend_analysis|comparison|distribution|statistics",
+    "data_needed": ["specific data points to look for"],
+    "visualizations": {
+        "primary": "line_chart|bar_chart|pie_chart|scatter|heatmap",
+        "secondary": ["additional chart types"],
+        "infographic_type": "statistics|timeline|comparison|geographic"
+    },
+    "key_metrics": ["metric1", "metric2", "metric3"]
+}"""
+
+EXTRACTION_SCHEMA = """{
+    "trend_data": [
+        {"year": "2020", "value": 100},
+        {"year": "2021", "value": 150},
+        ...
+    ],
+    "comparison_data": [
+        {"category": "Item1", "value": 50},
+        {"category": "Item2", "value": 75},
+        ...
+    ],
+    "distribution_data": [
+        {"name": "Segment1", "value": 35, "color": "#3B82F6"},
+        {"name": "Segment2", "value": 45, "color": "#8B5CF6"},
+        ...
+    ],
+    "key_statistics": [
+        {"label": "Total Value", "value": "$127B", "icon": "dollar"},
+        {"label": "Growth Rate", "value": "+43%", "icon": "trending_up"},
+        {"label": "Market Size", "value": "2,847", "icon": "users"}
+    ]
+}"""
+
+INSIGHTS_SCHEMA = """{
+    "summary": "2-3 paragraph summary of key findings",
+    "key_insights": [
+        "Insight 1 with specific numbers",
+        "Insight 2 with trends",
+        "Insight 3 with implications"
+    ],
+    "recommendations": ["Recommendation 1", "Recommendation 2"]
+}"""
+
+REAL_NUMBERS_NOTE = (
+    "IMPORTANT: Use real numbers from the search results. If exact numbers "
+    "aren't available, provide reasonable estimates based on the context."
+)
+
+# Search stops collecting this long before its budget ends, so providers
+# that already answered are kept rather than the whole stage being cut
+SEARCH_SALVAGE_MARGIN = 0.05  # seconds
 
 
 class ResearchAgent:
     """Main research agent that orchestrates web search and AI analysis"""
 
     def __init__(self):
-        self.groq_client = Groq(api_key=settings.GROQ_API_KEY)
+        self.llm = LLMClient()
         self.serper_key = settings.SERPER_API_KEY
         self.tavily_key = settings.TAVILY_API_KEY
+        self.search_cache = create_cache("search", settings.SEARCH_CACHE_MAX_ENTRIES)
+        # Identical concurrent searches (same cache key) share one provider call
+        self.search_flight = SingleFlight("search")
 
-    async def research(self, query: str) -> Dict[str, Any]:
+    async def close(self):
+        """Release LLM and cache connections"""
+        await self.llm.close()
+        await self.search_cache.close()
+
+    async def research(
+        self,
+        query: str,
+        on_event: Optional[Callable[[str, Any], Awaitable[None]]] = None,
+        deadline: Optional[Deadline] = None,
+        mode: Optional[str] = None,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
         """
         Conduct comprehensive research on a query
 
         Args:
             query: The research question
+            on_event: Optional coroutine called with (event type, payload) as
+                each stage finishes: query_analysis, sources, structured_data,
+                insights
+            deadline: Optional time limit split into per-stage budgets. Stages
+                that run out are cut and the result has status "partial"
+                with the cut stages listed in "cut_stages".
+            mode: "thorough" (three LLM calls) or "fast" (one combined call);
+                defaults to settings.RESEARCH_MODE
+            on_partial: Optional coroutine called while insights stream in:
+                ("insights_delta", {"field", "text"}) for summary text as it
+                arrives and ("insights_item", {"field", "index", "value"}) as
+                each key_insights / recommendations entry completes
 
         Returns:
             Dict with research results, insights, and visualization data
         """
-        print(f"Starting research for: {query}")
+        mode = mode or settings.RESEARCH_MODE
+        if mode not in RESEARCH_MODES:
+            raise ValueError(f"Unknown research mode: {mode}")
+        print(f"Starting {mode} research for: {query}")
+
+        graph = StageGraph()
+        graph.add(
+            "search",
+            lambda: self._gather_data(query, timeout=self._search_timeout(graph.budget("search"))),
+            weight=STAGE_WEIGHTS["search"],
+            fallback=lambda: {"results": [], "sources": [], "cut": []}
+        )
+        if mode == "fast":
+            self._add_fast_stages(graph, query, on_partial)
+        else:
+            self._add_thorough_stages(graph, query, on_partial)
+
+        async def emit(stage: str, result: Any):
+            if stage == "synthesis":
+                for part in ("analysis", "extraction", "insights"):
+                    await on_event(STAGE_EVENTS[part], result[part])
+                return
+            payload = result.get("sources", []) if stage == "search" else result
+            await on_event(STAGE_EVENTS[stage], payload)
+
+        results = await graph.run(on_complete=emit if on_event else None, deadline=deadline)
+        results.update(results.pop("synthesis", {}))
+
+        for stage, timing in graph.timings.items():
+            # A cut stage's duration is just its budget; it is counted in STAGE_CUTS
+            if stage not in graph.cut:
+                STAGE_SECONDS.labels(stage).observe(timing["duration_ms"] / 1000)
+        cut_stages = graph.cut + results["search"].get("cut", [])
+        for stage in cut_stages:
+            STAGE_CUTS.labels(stage).inc()
+        if cut_stages:
+            print(f"WARNING: Deadline cut stages: {', '.join(cut_stages)}")
 
-        # Step 1: Analyze query and determine what visualizations are needed
-        query_analysis = await self._analyze_query(query)
+        return {
+            "query": query,
+            "mode": mode,
+            "query_analysis": results["analysis"],
+            "structured_data": results["extraction"],
+            "insights": results["insights"],
+            "sources": results["search"].get("sources", []),
+            "timings": graph.report(),
+            "cut_stages": cut_stages,
+            "status": "partial" if cut_stages else "completed"
+        }
 
-        # Step 2: Gather data from multiple sources in parallel
-        search_results = await self._gather_data(query)
+    def _add_thorough_stages(
+        self,
+        graph: StageGraph,
+        query: str,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ):
+        """Analysis (concurrent with search), then extraction, then insights"""
+        graph.add(
+            "analysis",
+            lambda: self._analyze_query(query),
+            weight=STAGE_WEIGHTS["analysis"],
+            fallback=self._default_analysis
+        )
+        graph.add(
+            "extraction",
+            lambda query_analysis, search_results: self._extract_structured_data(
+                query,
+                search_results,
+                query_analysis
+            ),
+            deps=["analysis", "search"],
+            weight=STAGE_WEIGHTS["extraction"],
+            fallback=dict
+        )
+        graph.add(
+            "insights",
+            lambda structured_data: self._generate_insights(query, structured_data, on_partial),
+            deps=["extraction"],
+            weight=STAGE_WEIGHTS["insights"],
+            fallback=lambda: {"summary": "", "key_insights": [], "recommendations": []}
+        )
 
-        # Step 3: Extract and structure data for visualizations
-        structured_data = await self._extract_structured_data(
-            query,
-            search_results,
-            query_analysis
+    def _add_fast_stages(
+        self,
+        graph: StageGraph,
+        query: str,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ):
+        """One combined completion after search, standing in for all three LLM stages"""
+        graph.add(
+            "synthesis",
+            lambda search_results: self._synthesize(query, search_results, on_partial),
+            deps=["search"],
+            weight=STAGE_WEIGHTS["synthesis"],
+            fallback=lambda: {
+                "analysis": self._default_analysis(),
+                "extraction": {},
+                "insights": {"summary": "", "key_insights": [], "recommendations": []},
+            }
         )
 
-        # Step 4: Generate insights and summary
-        insights = await self._generate_insights(query, structured_data)
+    @staticmethod
+    def _search_timeout(budget: Optional[float]) -> Optional[float]:
+        if budget is None:
+            return None
+        return max(0.0, budget - SEARCH_SALVAGE_MARGIN)
 
+    def _default_analysis(self) -> Dict[str, Any]:
+        """Generic analysis used when the LLM call fails or is cut"""
         return {
-            "query": query,
-            "query_analysis": query_analysis,
-            "structured_data": structured_data,
-            "insights": insights,
-            "sources": search_results.get("sources", []),
-            "status": "completed"
+            "intent": "general_research",
+            "data_needed": ["statistics", "trends", "key facts"],
+            "visualizations": {
+                "primary": "bar_chart",
+                "secondary": ["line_chart"],
+                "infographic_type": "statistics"
+            },
+            "key_metrics": ["key statistics"]
         }
 
     async def _analyze_query(self, query: str) -> Dict[str, Any]:
@@ -67,99 +274,128 @@ class ResearchAgent:
 Query: {query}
 
 Respond in JSON format:
-{{
-    "intent": "trend_analysis|comparison|distribution|statistics",
-    "data_needed": ["specific data points to look for"],
-    "visualizations": {{
-        "primary": "line_chart|bar_chart|pie_chart|scatter|heatmap",
-        "secondary": ["additional chart types"],
-        "infographic_type": "statistics|timeline|comparison|geographic"
-    }},
-    "key_metrics": ["metric1", "metric2", "metric3"]
-}}
+{ANALYSIS_SCHEMA}
 """
 
         try:
-            response = self.groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=settings.DEFAULT_LLM_MODEL,
-                temperature=0.2,
-                response_format={"type": "json_object"}
-            )
-
-            analysis = json.loads(response.choices[0].message.content)
+            analysis = await self.llm.complete_json(prompt, temperature=0.2, stage="analysis")
             print(f"Query analysis: {analysis['intent']}")
             return analysis
 
         except Exception as e:
             print(f"WARNING: Query analysis error: {e}")
             # Default fallback
-            return {
-                "intent": "general_research",
-                "data_needed": ["statistics", "trends", "key facts"],
-                "visualizations": {
-                    "primary": "bar_chart",
-                    "secondary": ["line_chart"],
-                    "infographic_type": "statistics"
-                },
-                "key_metrics": ["key statistics"]
-            }
+            return self._default_analysis()
 
-    async def _gather_data(self, query: str) -> Dict[str, Any]:
-        """Gather data from multiple sources in parallel"""
+    async def _gather_data(self, query: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Gather data from multiple sources in parallel
+
+        Args:
+            query: The research question
+            timeout: Seconds to wait for providers; ones still running are
+                cancelled and listed in "cut" (e.g. "search.tavily")
+        """
 
-        async with httpx.AsyncClient() as client:
-            # Run searches in parallel
-            serper_task = self._search_serper(client, query)
-            tavily_task = self._search_tavily(client, query)
+        client = get_http_client()
 
-            serper_results, tavily_results = await asyncio.gather(
-                serper_task,
-                tavily_task,
-                return_exceptions=True
+        # Run searches in parallel over the shared connection pool
+        tasks = {
+            "serper": asyncio.create_task(self._search_serper(client, query)),
+            "tavily": asyncio.create_task(self._search_tavily(client, query)),
+        }
+        try:
+            done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        def outcome(task: asyncio.Task) -> Any:
+            if task not in done:
+                return TimeoutError()
+            return task.exception() or task.result()
+
+        serper_results = outcome(tasks["serper"])
+        tavily_results = outcome(tasks["tavily"])
+        cut = [f"search.{name}" for name, task in tasks.items() if task in pending]
+        for name, task in tasks.items():
+            if task in pending:
+                PROVIDER_TIMEOUTS.labels(name).inc()
+
+        if settings.SEARCH_MERGE_ENABLED:
+            # One ranked list without cross-provider or syndicated duplicates
+            all_results, stats = merge_results(
+                [
+                    ("serper", [] if isinstance(serper_results, Exception) else serper_results.get("organic", [])),
+                    ("tavily", [] if isinstance(tavily_results, Exception) else tavily_results.get("results", [])),
+                ],
+                max_results=settings.SEARCH_MERGE_MAX_RESULTS,
+                duplicate_threshold=settings.SEARCH_DUPLICATE_THRESHOLD
             )
+            sources = [{"title": r.get("title"), "url": result_url(r)} for r in all_results]
+            print(f"Merged {stats['input']} results into {stats['output']} "
+                  f"({stats['url_duplicates']} same URL, {stats['near_duplicates']} near-duplicate)")
+            return {"results": all_results, "sources": sources, "cut": cut}
+
+        # Combine results
+        all_results = []
+        sources = []
+
+        if not isinstance(serper_results, Exception):
+            all_results.extend(serper_results.get("organic", [])[:5])
+            sources.extend([
+                {"title": r.get("title"), "url": r.get("link")}
+                for r in serper_results.get("organic", [])[:5]
+            ])
+
+        if not isinstance(tavily_results, Exception):
+            all_results.extend(tavily_results.get("results", [])[:5])
+            sources.extend([
+                {"title": r.get("title"), "url": r.get("url")}
+                for r in tavily_results.get("results", [])[:5]
+            ])
+
+        print(f"Gathered {len(all_results)} results from {len(sources)} sources")
 
-            # Combine results
-            all_results = []
-            sources = []
-
-            if not isinstance(serper_results, Exception):
-                all_results.extend(serper_results.get("organic", [])[:5])
-                sources.extend([
-                    {"title": r.get("title"), "url": r.get("link")}
-                    for r in serper_results.get("organic", [])[:5]
-                ])
-
-            if not isinstance(tavily_results, Exception):
-                all_results.extend(tavily_results.get("results", [])[:5])
-                sources.extend([
-                    {"title": r.get("title"), "url": r.get("url")}
-                    for r in tavily_results.get("results", [])[:5]
-                ])
-
-            print(f"Gathered {len(all_results)} results from {len(sources)} sources")
-
-            return {
-                "results": all_results,
-                "sources": sources
-            }
+        return {
+            "results": all_results,
+            "sources": sources,
+            "cut": cut
+        }
 
     async def _search_serper(self, client: httpx.AsyncClient, query: str) -> Dict:
         """Search using Serper (Google Search API)"""
 
-        try:
+        params = {"q": query, "num": 10}
+        key = self._search_cache_key("serper", params)
+        cached = await self._cached_search(key)
+        if cached is not None:
+            print("Serper search served from cache")
+            return cached
+
+        async def request() -> httpx.Response:
             response = await client.post(
-                "https://google.serper.dev/search",
+                settings.SERPER_API_URL,
                 headers={
                     "X-API-KEY": self.serper_key,
                     "Content-Type": "application/json"
                 },
-                json={"q": query, "num": 10},
-                timeout=10.0
+                json=params,
+                timeout=settings.SERPER_TIMEOUT
             )
             response.raise_for_status()
+            return response
+
+        async def fetch() -> Dict:
+            response = await self._provider_request("serper", request)
+            results = response.json()
+            await self._store_search(key, results, settings.SERPER_CACHE_TTL)
+            return results
+
+        try:
+            results, _ = await self.search_flight.run(key, fetch)
             print("Serper search completed")
-            return response.json()
+            return results
         except Exception as e:
             print(f"WARNING: Serper search failed: {e}")
             return {"organic": []}
@@ -167,25 +403,81 @@ Respond in JSON format:
     async def _search_tavily(self, client: httpx.AsyncClient, query: str) -> Dict:
         """Search using Tavily (AI Research API)"""
 
-        try:
+        params = {
+            "query": query,
+            "search_depth": "advanced",
+            "max_results": 10
+        }
+        key = self._search_cache_key("tavily", params)
+        cached = await self._cached_search(key)
+        if cached is not None:
+            print("Tavily search served from cache")
+            return cached
+
+        async def request() -> httpx.Response:
             response = await client.post(
-                "https://api.tavily.com/search",
+                settings.TAVILY_API_URL,
                 headers={"Content-Type": "application/json"},
-                json={
-                    "api_key": self.tavily_key,
-                    "query": query,
-                    "search_depth": "advanced",
-                    "max_results": 10
-                },
-                timeout=15.0
+                json={"api_key": self.tavily_key, **params},
+                timeout=settings.TAVILY_TIMEOUT
             )
             response.raise_for_status()
+            return response
+
+        async def fetch() -> Dict:
+            response = await self._provider_request("tavily", request)
+            results = response.json()
+            await self._store_search(key, results, settings.TAVILY_CACHE_TTL)
+            return results
+
+        try:
+            results, _ = await self.search_flight.run(key, fetch)
             print("Tavily search completed")
-            return response.json()
+            return results
         except Exception as e:
             print(f"WARNING: Tavily search failed: {e}")
             return {"results": []}
 
+    @staticmethod
+    async def _provider_request(
+        provider: str,
+        request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a search request through the provider's rate limiter, recording its latency and failures"""
+        latency = STAGE_SECONDS.labels(f"search.{provider}")
+
+        async def timed_request() -> httpx.Response:
+            # Timed inside the limiter so queueing for a token isn't reported as provider latency
+            with latency.time():
+                return await request()
+
+        try:
+            return await get_rate_limiter(provider).call(timed_request)
+        except httpx.TimeoutException:
+            PROVIDER_TIMEOUTS.labels(provider).inc()
+            raise
+        except Exception:
+            PROVIDER_ERRORS.labels(provider).inc()
+            raise
+
+    def _search_cache_key(self, provider: str, params: Dict[str, Any]) -> str:
+        """Cache key from the provider and its request parameters (query normalized)"""
+        normalized = {
+            k: normalize_query(v) if k in ("q", "query") else v
+            for k, v in params.items()
+        }
+        return cache_key(f"search:{provider}", normalized)
+
+    async def _cached_search(self, key: str) -> Any:
+        if not settings.SEARCH_CACHE_ENABLED:
+            return None
+        return await self.search_cache.get(key)
+
+    async def _store_search(self, key: str, results: Dict, ttl: int):
+        # Only successful responses reach here, so failures are never cached
+        if settings.SEARCH_CACHE_ENABLED:
+            await self.search_cache.set(key, results, ttl)
+
     async def _extract_structured_data(
         self,
         query: str,
@@ -194,11 +486,7 @@ Respond in JSON format:
     ) -> Dict[str, Any]:
         """Extract and structure data for visualizations using AI"""
 
-        # Combine all search results into text
-        results_text = "\n\n".join([
-            f"Source {i+1}: {r.get('title', '')} - {r.get('snippet', r.get('content', ''))}"
-            for i, r in enumerate(search_results.get("results", [])[:10])
-        ])
+        results_text = self._results_context(query, search_results, query_analysis)
 
         prompt = f"""Based on this research query and search results, extract structured data for visualizations.
 
@@ -210,41 +498,13 @@ Search Results:
 Extract data for these visualization types: {query_analysis.get('visualizations', {})}
 
 Provide structured data in JSON format:
-{{
-    "trend_data": [
-        {{"year": "2020", "value": 100}},
-        {{"year": "2021", "value": 150}},
-        ...
-    ],
-    "comparison_data": [
-        {{"category": "Item1", "value": 50}},
-        {{"category": "Item2", "value": 75}},
-        ...
-    ],
-    "distribution_data": [
-        {{"name": "Segment1", "value": 35, "color": "#3B82F6"}},
-        {{"name": "Segment2", "value": 45, "color": "#8B5CF6"}},
-        ...
-    ],
-    "key_statistics": [
-        {{"label": "Total Value", "value": "$127B", "icon": "dollar"}},
-        {{"label": "Growth Rate", "value": "+43%", "icon": "trending_up"}},
-        {{"label": "Market Size", "value": "2,847", "icon": "users"}}
-    ]
-}}
+{EXTRACTION_SCHEMA}
 
-IMPORTANT: Use real numbers from the search results. If exact numbers aren't available, provide reasonable estimates based on the context.
+{REAL_NUMBERS_NOTE}
 """
 
         try:
-            response = self.groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=settings.DEFAULT_LLM_MODEL,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-
-            structured_data = json.loads(response.choices[0].message.content)
+            structured_data = await self.llm.complete_json(prompt, temperature=0.3, stage="extraction")
             print(f"Extracted structured data with {len(structured_data)} data sets")
             return structured_data
 
@@ -253,8 +513,13 @@ IMPORTANT: Use real numbers from the search results. If exact numbers aren't ava
             # Return sample data as fallback
             return self._get_sample_data(query)
 
-    async def _generate_insights(self, query: str, structured_data: Dict) -> Dict[str, Any]:
-        """Generate AI insights and summary"""
+    async def _generate_insights(
+        self,
+        query: str,
+        structured_data: Dict,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """Generate AI insights and summary (streamed to on_partial when given)"""
 
         prompt = f"""Based on this research query and extracted data, provide insightful analysis.
 
@@ -263,36 +528,126 @@ Query: {query}
 Data: {json.dumps(structured_data, indent=2)}
 
 Provide analysis in JSON format:
-{{
-    "summary": "2-3 paragraph summary of key findings",
-    "key_insights": [
-        "Insight 1 with specific numbers",
-        "Insight 2 with trends",
-        "Insight 3 with implications"
-    ],
-    "recommendations": ["Recommendation 1", "Recommendation 2"]
-}}
+{INSIGHTS_SCHEMA}
 """
 
         try:
-            response = self.groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=settings.DEFAULT_LLM_MODEL,
+            insights = await self.llm.complete_json(
+                prompt,
                 temperature=0.5,
-                response_format={"type": "json_object"}
+                stage="insights",
+                on_partial=self._insight_forwarder(on_partial)
             )
-
-            insights = json.loads(response.choices[0].message.content)
             print("Generated insights")
             return insights
 
         except Exception as e:
             print(f"WARNING: Insight generation error: {e}")
-            return {
-                "summary": f"Analysis of {query} based on available research data.",
-                "key_insights": ["Data gathered from multiple sources", "Analysis in progress"],
-                "recommendations": ["Further research recommended"]
-            }
+            return self._default_insights(query)
+
+    def _default_insights(self, query: str) -> Dict[str, Any]:
+        """Generic insights used when the LLM call fails"""
+        return {
+            "summary": f"Analysis of {query} based on available research data.",
+            "key_insights": ["Data gathered from multiple sources", "Analysis in progress"],
+            "recommendations": ["Further research recommended"]
+        }
+
+    def _results_context(self, query: str, search_results: Dict, query_analysis: Optional[Dict]) -> str:
+        """Search results as prompt text, ranked and trimmed to the token budget"""
+        results = search_results.get("results", [])[:10]
+        if not settings.CONTEXT_COMPRESSION_ENABLED:
+            return legacy_context(results)
+        results_text, stats = build_context(
+            query, results, query_analysis, settings.CONTEXT_TOKEN_BUDGET
+        )
+        print(f"Context: ~{stats['original_tokens']} -> ~{stats['compressed_tokens']} tokens "
+              f"({stats['kept']}/{stats['sentences']} sentences)")
+        return results_text
+
+    def _insight_forwarder(
+        self,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]],
+        prefix: Tuple[str, ...] = ()
+    ) -> Optional[Callable[[List[Event]], Awaitable[None]]]:
+        """
+        Translate JSON parse events of the insights object into partial events
+
+        Args:
+            on_partial: The research caller's partial-event coroutine
+            prefix: Path of the insights object within the completion
+        """
+
+        if on_partial is None or not settings.INSIGHTS_STREAMING_ENABLED:
+            return None
+
+        async def forward(events: List[Event]):
+            for kind, path, value in events:
+                if path[:len(prefix)] != prefix:
+                    continue
+                path = path[len(prefix):]
+                if kind == "text" and len(path) == 1:
+                    await on_partial("insights_delta", {"field": path[0], "text": value})
+                elif kind == "value" and len(path) == 2:
+                    await on_partial("insights_item", {"field": path[0], "index": path[1], "value": value})
+
+        return forward
+
+    async def _synthesize(
+        self,
+        query: str,
+        search_results: Dict,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fast mode: query analysis, structured data and insights from one completion
+
+        Returns a dict keyed by the thorough-mode stage each part replaces
+        (analysis, extraction, insights); parts missing from the completion
+        fall back as their own stage would.
+        """
+
+        results_text = self._results_context(query, search_results, None)
+
+        prompt = f"""Analyze this research query, extract structured data for visualizations from the search results, and summarize the findings.
+
+Query: {query}
+
+Search Results:
+{results_text}
+
+Respond in JSON format with exactly these keys:
+{{
+    "query_analysis": {ANALYSIS_SCHEMA},
+    "structured_data": {EXTRACTION_SCHEMA},
+    "insights": {INSIGHTS_SCHEMA}
+}}
+
+{REAL_NUMBERS_NOTE} Base the insights on the structured data you extract.
+"""
+
+        try:
+            combined = await self.llm.complete_json(
+                prompt,
+                temperature=0.3,
+                stage="synthesis",
+                on_partial=self._insight_forwarder(on_partial, prefix=("insights",)),
+                partial_depth=3
+            )
+            print("Synthesized analysis, data and insights in one call")
+        except Exception as e:
+            print(f"WARNING: Combined synthesis error: {e}")
+            combined = {}
+
+        def part(key: str) -> Optional[Dict[str, Any]]:
+            value = combined.get(key)
+            return value if isinstance(value, dict) and value else None
+
+        return {
+            "analysis": part("query_analysis") or self._default_analysis(),
+            "extraction": part("structured_data") or self._get_sample_data(query),
+            "insights": part("insights") or self._default_insights(query),
+        }
 
     def _get_sample_data(self, query: str) -> Dict[str, Any]:
         """Fallback sample data if extraction fails"""
@@ -0,0 +1,156 @@
+"""
+Result Merger - Merges provider search results into one de-duplicated ranked list
+
+Serper and Tavily often return the same article, or syndicated copies of
+it under another URL. Results are first keyed by a canonical URL (scheme,
+"www."/"amp." hosts, AMP paths, tracking parameters and trailing slashes
+ignored), then near-duplicate texts are found by word shingling.
+Similarity is containment - the share of the smaller text's shingles
+found in the other - so a Serper snippet matches the longer Tavily
+extract of the same article. Each group keeps its best-ranked member, and groups are ordered
+by reciprocal rank fusion, so a page both providers rank highly comes first.
+"""
+import re
+import zlib
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from app.agents.context_builder import result_text
+
+
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "referrer", "cmpid", "_ga", "_gl", "amp", "outputtype",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "oly_")
+HOST_PREFIXES = ("www.", "amp.", "m.", "mobile.")
+
+SHINGLE_SIZE = 3  # words per shingle
+RRF_K = 60  # reciprocal rank fusion damping
+
+_WORD = re.compile(r"\w+")
+_AMP_SUFFIX = re.compile(r"/amp/?$")
+_AMP_EXTENSION = re.compile(r"\.amp(\.html?)?$")
+
+
+def result_url(result: Dict[str, Any]) -> str:
+    """Serper calls the URL "link", Tavily "url\""""
+    return result.get("url") or result.get("link") or ""
+
+
+def canonical_url(url: str) -> str:
+    """
+    Comparable form of a URL
+
+    Drops the scheme, fragment, tracking parameters, "www."/"amp."/"m."
+    host prefixes, AMP path suffixes and trailing slashes; lowercases the
+    host and sorts the remaining query parameters.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip() if "//" in url else f"//{url.strip()}")
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = _AMP_EXTENSION.sub(r"\1", _AMP_SUFFIX.sub("", parts.path)).rstrip("/")
+    if path.endswith(("/index.html", "/index.htm")):
+        path = path.rsplit("/", 1)[0]
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def shingles(text: str) -> FrozenSet[int]:
+    """Hashed word shingles of the text (empty if it has too few words)"""
+    words = _WORD.findall(text.lower())
+    return frozenset(
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+def containment(first: FrozenSet[int], second: FrozenSet[int]) -> float:
+    """Share of the smaller shingle set found in the other"""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / min(len(first), len(second))
+
+
+def merge_results(
+    ranked_lists: Sequence[Tuple[str, List[Dict[str, Any]]]],
+    max_results: int = 10,
+    duplicate_threshold: float = 0.7
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Merge several providers' ranked results
+
+    Args:
+        ranked_lists: (provider, results best first) pairs
+        max_results: Length of the merged list
+        duplicate_threshold: Shingle containment at which two results
+            count as the same article
+
+    Returns:
+        (merged results, each with "url" and "providers" set; stats with
+        input, URL-duplicate, near-duplicate and output counts)
+    """
+
+    groups: List[Dict[str, Any]] = []
+    by_url: Dict[str, Dict[str, Any]] = {}
+    url_duplicates = 0
+    near_duplicates = 0
+
+    # Visit results rank by rank across providers so a group's first member is its best-ranked
+    depth = max((len(results) for _, results in ranked_lists), default=0)
+    for rank in range(depth):
+        for provider, results in ranked_lists:
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            url = canonical_url(result_url(result))
+            # Titles are left out: they all echo the query
+            signature = shingles(result_text(result) or result.get("title", ""))
+
+            group = by_url.get(url) if url else None
+            if group is not None:
+                url_duplicates += 1
+            elif signature:
+                group = next((
+                    g for g in groups
+                    if containment(g["signature"], signature) >= duplicate_threshold
+                ), None)
+                if group is not None:
+                    near_duplicates += 1
+
+            if group is None:
+                group = {"result": result, "signature": signature, "providers": [], "score": 0.0}
+                groups.append(group)
+            group["score"] += 1 / (RRF_K + rank + 1)
+            if provider not in group["providers"]:
+                group["providers"].append(provider)
+            if url:
+                by_url.setdefault(url, group)
+
+    # Stable sort keeps interleaved provider order between equal scores
+    groups.sort(key=lambda g: g["score"], reverse=True)
+    merged = [
+        {**g["result"], "url": result_url(g["result"]), "providers": g["providers"]}
+        for g in groups[:max_results]
+    ]
+    stats = {
+        "input": sum(len(results) for _, results in ranked_lists),
+        "url_duplicates": url_duplicates,
+        "near_duplicates": near_duplicates,
+        "unique": len(groups),
+        "output": len(merged),
+    }
+    return merged, stats
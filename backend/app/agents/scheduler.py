@@ -0,0 +1,180 @@
+"""
+Stage Scheduler - Runs research pipeline stages as a dependency graph
+"""
+import asyncio
+import time
+from typing import Dict, List, Any, Callable, Awaitable, Optional, Sequence
+
+from app.core.deadline import Deadline
+
+
+class Stage:
+    """A named pipeline step and the stages whose results it consumes"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        deps: Sequence[str] = (),
+        weight: float = 1.0,
+        fallback: Optional[Callable[[], Any]] = None
+    ):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.weight = weight
+        self.fallback = fallback
+
+
+class StageGraph:
+    """
+    Minimal DAG executor for async stages
+
+    Each stage starts as soon as all of its dependencies have finished and
+    receives their results as positional arguments (in `deps` order), so
+    independent stages overlap automatically.
+
+    With a Deadline, each stage gets a budget: the time remaining, split by
+    `weight` between the stage and the heaviest chain of stages after it.
+    Time a stage leaves unused flows to its successors. A stage that runs
+    out of budget is cut - its `fallback()` stands in for its result and
+    its name is recorded in `cut`.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.cut: List[str] = []
+        self.deadline: Optional[Deadline] = None
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        deps: Sequence[str] = (),
+        weight: float = 1.0,
+        fallback: Optional[Callable[[], Any]] = None
+    ) -> "StageGraph":
+        """Register a stage; dependencies must already be registered"""
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        self.stages[name] = Stage(name, func, deps, weight, fallback)
+        return self
+
+    def _tail_weights(self) -> Dict[str, float]:
+        """Weight of the heaviest chain of stages after each stage"""
+        tail = {name: 0.0 for name in self.stages}
+        for stage in reversed(list(self.stages.values())):
+            for dep in stage.deps:
+                tail[dep] = max(tail[dep], stage.weight + tail[stage.name])
+        return tail
+
+    def budget(self, name: str) -> Optional[float]:
+        """Seconds stage `name` may use if it starts now (None without a deadline)"""
+        if self.deadline is None:
+            return None
+        stage = self.stages[name]
+        share = stage.weight / (stage.weight + self._tail_weights()[name])
+        return self.deadline.remaining() * share
+
+    async def run(
+        self,
+        on_complete: Optional[Callable[[str, Any], Awaitable[None]]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute every stage and return their results keyed by stage name
+
+        Registration order is a valid topological order (dependencies must be
+        added first), so tasks can be created in one pass. If any stage fails
+        the remaining stages are cancelled and the error is re-raised.
+
+        Args:
+            on_complete: Optional coroutine called with (stage name, result)
+                as soon as each stage finishes
+            deadline: Optional time limit; stages over budget are cut (see
+                class docstring). Stages without a fallback are never cut.
+        """
+
+        self.timings = {}
+        self.cut = []
+        self.deadline = deadline
+        origin = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage) -> Any:
+            inputs = [await tasks[dep] for dep in stage.deps]
+            start = time.perf_counter()
+            budget = self.budget(stage.name) if stage.fallback is not None else None
+            try:
+                if budget is None:
+                    result = await stage.func(*inputs)
+                elif budget <= 0:
+                    raise asyncio.TimeoutError
+                else:
+                    result = await asyncio.wait_for(stage.func(*inputs), budget)
+            except asyncio.TimeoutError:
+                if budget is None:
+                    raise
+                self.cut.append(stage.name)
+                result = stage.fallback()
+            finally:
+                end = time.perf_counter()
+                self.timings[stage.name] = {
+                    "start_ms": round((start - origin) * 1000, 1),
+                    "end_ms": round((end - origin) * 1000, 1),
+                    "duration_ms": round((end - start) * 1000, 1),
+                }
+            if on_complete is not None:
+                await on_complete(stage.name, result)
+            return result
+
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def critical_path(self) -> List[str]:
+        """Longest chain of dependent stages by measured duration"""
+
+        finish: Dict[str, float] = {}
+        parent: Dict[str, str] = {}
+        for stage in self.stages.values():
+            duration = self.timings.get(stage.name, {}).get("duration_ms", 0.0)
+            best = max(stage.deps, key=lambda d: finish[d], default=None)
+            finish[stage.name] = duration + (finish[best] if best else 0.0)
+            if best:
+                parent[stage.name] = best
+
+        if not finish:
+            return []
+
+        path = [max(finish, key=finish.get)]
+        while path[-1] in parent:
+            path.append(parent[path[-1]])
+        return list(reversed(path))
+
+    def report(self) -> Dict[str, Any]:
+        """Per-stage timings plus the critical path and time saved by overlap"""
+
+        total = max((t["end_ms"] for t in self.timings.values()), default=0.0)
+        sequential = sum(t["duration_ms"] for t in self.timings.values())
+
+        return {
+            "stages": self.timings,
+            "critical_path": self.critical_path(),
+            "total_ms": round(total, 1),
+            "sequential_ms": round(sequential, 1),
+            "saved_ms": round(sequential - total, 1),
+        }
@@ -1,26 +1,55 @@
 """
 Research API Routes
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, List
+import asyncio
+import json
+import time
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple, Union
 
-from app.agents.research_agent import ResearchAgent
-from app.engines.chart_generator import ChartGenerator
+from app.agents.research_agent import RESEARCH_MODES, ResearchAgent
+from app.engines.chart_pool import ChartRenderPool
+from app.engines.chart_export import ChartExportPool
+from app.engines.chart_generator import IMAGE_FORMATS
 from app.engines.infographic_generator import InfographicGenerator
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.cache import cache_key, create_cache
+from app.core.responses import FastJSONResponse, dumps
+from app.core.job_queue import JobQueue
+from app.core.metrics import REQUESTS_IN_FLIGHT, STAGE_CUTS, STAGE_SECONDS
+from app.core.single_flight import SingleFlight
+from app.db.jobs import JobStore
+from app.db.research import ResearchStore
+from app.utils.text import canonical_query
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 # Initialize agents and generators
 research_agent = ResearchAgent()
-chart_generator = ChartGenerator()
+chart_pool = ChartRenderPool()
+chart_export_pool = ChartExportPool()
 infographic_generator = InfographicGenerator()
+result_cache = create_cache("result", settings.RESULT_CACHE_MAX_ENTRIES)
+research_flight = SingleFlight("research")
+research_store = ResearchStore()
+
+INFOGRAPHIC_SECONDS = STAGE_SECONDS.labels("infographic")
 
 
 class ResearchRequest(BaseModel):
     """Research request model"""
     query: str
+    deadline: Optional[float] = None  # seconds; defaults to RESEARCH_TIMEOUT
+    mode: Optional[str] = None  # "fast" or "thorough"; defaults to RESEARCH_MODE
+    cache_control: Optional[str] = None  # "no-cache" or "no-store" to bypass the result cache
+    chart_format: str = "object"  # "string" returns chart data as JSON strings (legacy clients)
+    reuse: bool = False  # answer with the best similar past run when one qualifies
+    reuse_min_score: Optional[float] = None  # defaults to RESEARCH_REUSE_MIN_SCORE
+    reuse_max_age: Optional[float] = None  # seconds; defaults to RESEARCH_REUSE_MAX_AGE
 
 
 class ResearchResponse(BaseModel):
@@ -31,6 +60,7 @@ class ResearchResponse(BaseModel):
     infographics: List[Dict[str, Any]]
     insights: Dict[str, Any]
     sources: List[Dict[str, str]]
+    metadata: Dict[str, Any] = {}
 
 
 @router.post("/", response_model=ResearchResponse)
@@ -38,6 +68,27 @@ async def conduct_research(request: ResearchRequest):
     """
     Conduct comprehensive research with visualizations
 
+    Results are cached under the canonicalized query. Set `cache_control`
+    to "no-cache" to force a fresh run (the result is still stored) or
+    "no-store" to bypass the cache entirely. The X-Research-Cache response
+    header reports HIT, MISS or BYPASS, or COALESCED when the request joined
+    an identical one already in flight.
+
+    Chart `data` is a Plotly figure object, serialized once with the rest of
+    the response by orjson. Set `chart_format` to "string" for the legacy
+    form where each figure is a pre-encoded JSON string.
+
+    `mode` "fast" gets the query analysis, structured data and insights from
+    one combined LLM completion instead of three sequential ones
+    ("thorough"); results are cached per mode.
+
+    With `reuse`, a cache miss first looks for a saved run of a similar
+    query (see /search): the best completed run of the same mode whose
+    query similarity is at least `reuse_min_score` and that is at most
+    `reuse_max_age` seconds old is returned instead of running the
+    pipeline, with X-Research-Cache "REUSED" and the matched run in
+    metadata.reused.
+
     Args:
         request: Research request with query
 
@@ -45,109 +96,296 @@ async def conduct_research(request: ResearchRequest):
         Complete research results with charts and infographics
     """
 
+    reuse = (
+        request.reuse_min_score if request.reuse_min_score is not None else settings.RESEARCH_REUSE_MIN_SCORE,
+        request.reuse_max_age if request.reuse_max_age is not None else settings.RESEARCH_REUSE_MAX_AGE,
+    ) if request.reuse else None
+    with REQUESTS_IN_FLIGHT.labels("research").track():
+        result, cache_status = await cached_research(
+            request.query, request.cache_control, request.deadline, research_mode(request.mode), reuse
+        )
+    return research_json_response(
+        result,
+        request.chart_format,
+        headers={"X-Research-Cache": cache_status}
+    )
+
+
+async def cached_research(
+    query: str,
+    cache_control: Optional[str] = None,
+    deadline: Optional[float] = None,
+    mode: Optional[str] = None,
+    reuse: Optional[Tuple[float, float]] = None
+) -> Tuple[ResearchResponse, str]:
+    """
+    Run the pipeline behind the result cache (keyed by the canonicalized query and mode)
+
+    Args:
+        query: The research question
+        cache_control: "no-cache" or "no-store" to bypass the cache (see conduct_research)
+        deadline: Seconds the pipeline may take (default settings.RESEARCH_TIMEOUT)
+        mode: Pipeline mode, "fast" or "thorough" (default settings.RESEARCH_MODE)
+        reuse: (min score, max age in seconds) to answer a miss with a
+            similar saved run; None to always run the pipeline
+
+    Concurrent misses for the same canonical query share one pipeline run;
+    the joiners report cache status "COALESCED".
+
+    Returns:
+        (research result, cache status - "HIT", "MISS", "BYPASS", "COALESCED" or "REUSED")
+    """
+
+    cache_control = (cache_control or "").lower()
+    read_cache = settings.RESULT_CACHE_ENABLED and cache_control not in ("no-cache", "no-store")
+    write_cache = settings.RESULT_CACHE_ENABLED and cache_control != "no-store"
+    mode = research_mode(mode)
+    key = cache_key("result", {"query": canonical_query(query), "mode": mode})
+
+    if read_cache:
+        cached = await result_cache.get(key)
+        if cached is not None:
+            print(f"Serving cached research for: {query}")
+            cached["query"] = query
+            cached["metadata"] = {**cached.get("metadata", {}), "cache": "hit"}
+            return ResearchResponse(**cached), "HIT"
+
+    if reuse and cache_control not in ("no-cache", "no-store") and research_store.available:
+        reused = await reused_research(query, mode, *reuse)
+        if reused is not None:
+            return reused, "REUSED"
+
+    async def compute() -> ResearchResponse:
+        result = await run_research(query, deadline=deadline, mode=mode)
+        if write_cache and result.status == "completed":
+            await result_cache.set(key, result.model_dump(), settings.RESULT_CACHE_TTL)
+        return result
+
+    # Callers only share runs that store (or don't) and have the same deadline
+    flight_key = f"{key}:{'store' if write_cache else 'no-store'}:{deadline or ''}"
+    result, shared = await research_flight.run(flight_key, compute)
+    if shared:
+        result.query = query
+        result.metadata = {**result.metadata, "coalesced": True}
+        return result, "COALESCED"
+    return result, "MISS" if read_cache else "BYPASS"
+
+
+async def reused_research(
+    query: str,
+    mode: str,
+    min_score: float,
+    max_age: float
+) -> Optional[ResearchResponse]:
+    """The best qualifying saved run (see ResearchStore.best_match) as a response, or None"""
+    try:
+        run = await research_store.best_match(query, mode, min_score, max_age)
+    except Exception as e:
+        print(f"WARNING: Could not search past research: {e}")
+        return None
+    if run is None:
+        return None
+
+    print(f"Reusing research run {run['run_id']} ({run['query']}, score {run['score']}) for: {query}")
+    return ResearchResponse(
+        query=query,
+        status=run["status"],
+        charts=run["charts"],
+        infographics=build_infographics(run["query"], run["structured_data"]),
+        insights=run["insights"],
+        sources=run["sources"],
+        metadata={
+            "timings": run["timings"],
+            "mode": run["mode"],
+            "reused": {
+                "run_id": run["run_id"],
+                "query": run["query"],
+                "score": run["score"],
+                "created_at": run["created_at"],
+            },
+        }
+    )
+
+
+def research_json_response(
+    result: ResearchResponse,
+    chart_format: str = "object",
+    headers: Optional[Dict[str, str]] = None
+) -> FastJSONResponse:
+    """
+    Serialize an already-validated ResearchResponse in a single orjson pass
+
+    Returning a Response directly skips FastAPI's response_model re-encoding,
+    which otherwise walks every nested chart figure in Python.
+    """
+    result = with_chart_format(result, chart_format)
+    return FastJSONResponse(dict(result), headers=headers)
+
+
+def with_chart_format(result: ResearchResponse, chart_format: str) -> ResearchResponse:
+    """Re-encode chart figures as JSON strings when the legacy format is requested"""
+    if chart_format != "string":
+        return result
+    charts = [
+        {**chart, "data": dumps(chart["data"])} if not isinstance(chart["data"], str) else chart
+        for chart in result.charts
+    ]
+    return result.model_copy(update={"charts": charts})
+
+
+# Chart produced for each structured data set: (data key, chart type, title suffix)
+CHART_SPECS = [
+    ("trend_data", "line", "Trend Over Time"),
+    ("comparison_data", "bar", "Comparison"),
+    ("distribution_data", "pie", "Distribution"),
+]
+
+
+def _as_records(value: Any) -> List[Dict]:
+    """Coerce an LLM-provided data set to a list (it is sometimes a JSON string)"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def plan_charts(query: str, structured_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Chart specs (type, title, records) for every data set with valid data"""
+    specs = []
+    for data_key, chart_type, suffix in CHART_SPECS:
+        records = _as_records(structured_data.get(data_key))
+        if records:
+            specs.append({"type": chart_type, "title": f"{query} - {suffix}", "records": records})
+    return specs
+
+
+async def render_chart(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Render one planned chart off the event loop into the response chart format"""
+    print(f"Generating {spec['type']} chart...")
+    with STAGE_SECONDS.labels(f"charts.{spec['type']}").time():
+        figure = await chart_pool.render(spec["type"], spec["records"], spec["title"])
+    chart = {"type": spec["type"], "title": spec["title"], "data": figure}
+    # Large-series mode records original/rendered point counts in layout.meta
+    if figure["layout"].get("meta"):
+        chart["metadata"] = figure["layout"]["meta"]
+    return chart
+
+
+async def render_charts(
+    query: str,
+    structured_data: Dict[str, Any],
+    timeout: Optional[float] = None
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Render all charts for a request concurrently, preserving plan order
+
+    Args:
+        query: The research question
+        structured_data: Extracted data sets
+        timeout: Seconds to wait; charts not ready by then are dropped
+
+    Returns:
+        (rendered charts, cut chart names such as "charts.pie")
+    """
+
+    specs = plan_charts(query, structured_data)
+    if not specs:
+        return [], []
+
+    tasks = [asyncio.create_task(render_chart(spec)) for spec in specs]
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    for task in done:
+        # Render errors propagate as before
+        task.result()
+
+    charts = [task.result() for task in tasks if task in done]
+    cut = [f"charts.{spec['type']}" for spec, task in zip(specs, tasks) if task in pending]
+    for stage in cut:
+        STAGE_CUTS.labels(stage).inc()
+    return charts, cut
+
+
+def build_infographics(query: str, structured_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Infographics for the structured data (statistics cards when available)"""
+    infographics = []
+    if structured_data.get("key_statistics"):
+        print("Generating infographic...")
+        with INFOGRAPHIC_SECONDS.time():
+            infographics.append(infographic_generator.generate_infographic(
+                "statistics",
+                structured_data,
+                f"{query} - Key Insights"
+            ))
+    return infographics
+
+
+def research_deadline(seconds: Optional[float] = None) -> Deadline:
+    """Deadline for one request: the requested seconds, or RESEARCH_TIMEOUT"""
+    return Deadline(seconds if seconds and seconds > 0 else settings.RESEARCH_TIMEOUT)
+
+
+def research_mode(mode: Optional[str] = None) -> str:
+    """Pipeline mode for one request: the requested mode, or RESEARCH_MODE"""
+    mode = (mode or settings.RESEARCH_MODE).lower()
+    if mode not in RESEARCH_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown mode: {mode} (expected one of {', '.join(RESEARCH_MODES)})"
+        )
+    return mode
+
+
+async def run_research(
+    query: str,
+    on_event: Optional[Callable[[str, Any], Awaitable[None]]] = None,
+    deadline: Optional[float] = None,
+    mode: Optional[str] = None
+) -> ResearchResponse:
+    """
+    Run the full research pipeline: agent, charts and infographics
+
+    The deadline is shared by every step: the agent's stages split it after
+    holding back RESEARCH_CHART_BUDGET_SHARE for charts, and charts get
+    whatever is left. Anything cut leaves status "partial" with the cut
+    stages in metadata.cut_stages.
+
+    Args:
+        query: The research question
+        on_event: Optional stage-completion callback passed to the agent
+        deadline: Seconds the whole pipeline may take (default RESEARCH_TIMEOUT)
+        mode: Pipeline mode, "fast" or "thorough" (default RESEARCH_MODE)
+
+    Returns:
+        Complete research results with charts and infographics
+    """
+
+    limit = research_deadline(deadline)
+    mode = research_mode(mode)
+
     try:
         print(f"\n{'='*60}")
-        print(f"NEW RESEARCH REQUEST: {request.query}")
+        print(f"NEW RESEARCH REQUEST: {query}")
         print(f"{'='*60}\n")
 
         # Step 1: Conduct research
-        research_results = await research_agent.research(request.query)
+        research_results = await research_agent.research(
+            query,
+            on_event=on_event,
+            deadline=limit.reserve(limit.seconds * settings.RESEARCH_CHART_BUDGET_SHARE),
+            mode=mode
+        )
+        structured_data = research_results.get("structured_data", {})
 
         # Step 2: Generate charts
-        charts = []
-        structured_data = research_results.get("structured_data", {})
-        query_analysis = research_results.get("query_analysis", {})
-        visualizations = query_analysis.get("visualizations", {})
-
-        # Generate trend chart if we have trend data
-        if structured_data.get("trend_data"):
-            print("Generating line chart...")
-            trend_data = structured_data["trend_data"]
-            # Convert string to list if needed
-            if isinstance(trend_data, str):
-                import json
-                try:
-                    trend_data = json.loads(trend_data)
-                except:
-                    trend_data = []
-            if not isinstance(trend_data, list):
-                trend_data = []
-
-            if trend_data:  # Only generate if we have valid data
-                line_chart = chart_generator.generate_chart(
-                    "line",
-                    trend_data,
-                    f"{request.query} - Trend Over Time"
-                )
-                charts.append({
-                    "type": "line",
-                    "title": f"{request.query} - Trend Over Time",
-                    "data": line_chart
-                })
-
-        # Generate comparison chart if we have comparison data
-        if structured_data.get("comparison_data"):
-            print("Generating bar chart...")
-            comparison_data = structured_data["comparison_data"]
-            # Convert string to list if needed
-            if isinstance(comparison_data, str):
-                import json
-                try:
-                    comparison_data = json.loads(comparison_data)
-                except:
-                    comparison_data = []
-            if not isinstance(comparison_data, list):
-                comparison_data = []
-
-            if comparison_data:
-                bar_chart = chart_generator.generate_chart(
-                    "bar",
-                    comparison_data,
-                    f"{request.query} - Comparison"
-                )
-                charts.append({
-                    "type": "bar",
-                    "title": f"{request.query} - Comparison",
-                    "data": bar_chart
-                })
-
-        # Generate distribution chart if we have distribution data
-        if structured_data.get("distribution_data"):
-            print("Generating pie chart...")
-            distribution_data = structured_data["distribution_data"]
-            # Convert string to list if needed
-            if isinstance(distribution_data, str):
-                import json
-                try:
-                    distribution_data = json.loads(distribution_data)
-                except:
-                    distribution_data = []
-            if not isinstance(distribution_data, list):
-                distribution_data = []
-
-            if distribution_data:
-                pie_chart = chart_generator.generate_chart(
-                    "pie",
-                    distribution_data,
-                    f"{request.query} - Distribution"
-                )
-                charts.append({
-                    "type": "pie",
-                    "title": f"{request.query} - Distribution",
-                    "data": pie_chart
-                })
+        charts, cut_charts = await render_charts(query, structured_data, timeout=limit.remaining())
+        cut_stages = research_results.get("cut_stages", []) + cut_charts
 
         # Step 3: Generate infographics
-        infographics = []
-
-        if structured_data.get("key_statistics"):
-            print("Generating infographic...")
-            stats_infographic = infographic_generator.generate_infographic(
-                "statistics",
-                structured_data,
-                f"{request.query} - Key Insights"
-            )
-            infographics.append(stats_infographic)
+        infographics = build_infographics(query, structured_data)
 
         print(f"\nResearch complete!")
         print(f"   - Generated {len(charts)} charts")
@@ -155,27 +393,457 @@ async def conduct_research(request: ResearchRequest):
         print(f"   - Found {len(research_results.get('sources', []))} sources")
         print(f"{'='*60}\n")
 
-        return ResearchResponse(
-            query=request.query,
-            status="completed",
+        metadata = {
+            "timings": research_results.get("timings", {}),
+            "deadline_s": limit.seconds,
+            "mode": mode
+        }
+        if cut_stages:
+            metadata["cut_stages"] = cut_stages
+
+        response = ResearchResponse(
+            query=query,
+            status="partial" if cut_stages else "completed",
             charts=charts,
             infographics=infographics,
             insights=research_results.get("insights", {}),
-            sources=research_results.get("sources", [])
+            sources=research_results.get("sources", []),
+            metadata=metadata
         )
+        research_store.save_later(query, mode, {**response.model_dump(), "structured_data": structured_data})
+        return response
 
     except Exception as e:
         print(f"ERROR during research: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {dumps(data)}\n\n"
+
+
+@router.post("/stream")
+async def stream_research(request: ResearchRequest):
+    """
+    Stream research results as Server-Sent Events
+
+    Events are emitted as soon as each piece is ready: query_analysis,
+    sources, structured_data, one chart event per chart, infographic,
+    insights and finally done (with timings). Charts render while the
+    insights LLM call is still in flight. While insights stream in,
+    insights_delta events carry summary text as it is generated and
+    insights_item events each key_insights / recommendations entry as it
+    completes; the insights event still follows with the whole object. Failures produce an error event.
+    The request deadline applies as in conduct_research; if anything is cut,
+    done has status "partial" and lists the cut stages.
+
+    Args:
+        request: Research request with query
+
+    Returns:
+        text/event-stream response
+    """
+
+    query = request.query
+    queue: asyncio.Queue = asyncio.Queue()
+    limit = research_deadline(request.deadline)
+    mode = research_mode(request.mode)
+    unrendered: List[str] = []
+    rendered: List[Dict[str, Any]] = []
+
+    async def publish(event: str, data: Any):
+        await queue.put(_sse(event, data))
+
+    async def render_visuals(structured_data: Dict[str, Any]):
+        specs = plan_charts(query, structured_data)
+        unrendered.extend(spec["type"] for spec in specs)
+        pending = [render_chart(spec) for spec in specs]
+        for chart in asyncio.as_completed(pending):
+            chart = await chart
+            unrendered.remove(chart["type"])
+            rendered.append(chart)
+            if request.chart_format == "string":
+                chart = {**chart, "data": dumps(chart["data"])}
+            await publish("chart", chart)
+        for infographic in build_infographics(query, structured_data):
+            await publish("infographic", infographic)
+
+    async def produce():
+        visuals = None
+
+        async def on_event(event: str, data: Any):
+            nonlocal visuals
+            await publish(event, data)
+            if event == "structured_data":
+                visuals = asyncio.create_task(render_visuals(data))
+
+        try:
+            research_results = await research_agent.research(
+                query,
+                on_event=on_event,
+                deadline=limit.reserve(limit.seconds * settings.RESEARCH_CHART_BUDGET_SHARE),
+                mode=mode,
+                on_partial=publish
+            )
+            cut_stages = list(research_results.get("cut_stages", []))
+            if visuals is not None:
+                try:
+                    await asyncio.wait_for(visuals, timeout=limit.remaining())
+                except asyncio.TimeoutError:
+                    cut_charts = [f"charts.{chart_type}" for chart_type in unrendered]
+                    for stage in cut_charts:
+                        STAGE_CUTS.labels(stage).inc()
+                    cut_stages += cut_charts
+
+            metadata = {
+                "timings": research_results.get("timings", {}),
+                "deadline_s": limit.seconds,
+                "mode": mode
+            }
+            if cut_stages:
+                metadata["cut_stages"] = cut_stages
+            status = "partial" if cut_stages else "completed"
+            await publish("done", {"query": query, "status": status, "metadata": metadata})
+            research_store.save_later(query, mode, {
+                "status": status,
+                "charts": rendered,
+                "insights": research_results.get("insights", {}),
+                "sources": research_results.get("sources", []),
+                "structured_data": research_results.get("structured_data", {}),
+                "metadata": metadata,
+            })
+        except Exception as e:
+            print(f"ERROR during streamed research: {e}")
+            await publish("error", {"query": query, "detail": str(e)})
+        finally:
+            if visuals is not None and not visuals.done():
+                visuals.cancel()
+            await queue.put(None)
+
+    async def events():
+        producer = asyncio.create_task(produce())
+        try:
+            with REQUESTS_IN_FLIGHT.labels("stream").track():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    yield item
+        finally:
+            # Client disconnected or stream finished: stop outstanding work
+            producer.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+class BatchResearchRequest(BaseModel):
+    """Batch research request: many queries, run with bounded concurrency"""
+    queries: List[str]
+    concurrency: Optional[int] = None  # defaults to BATCH_CONCURRENCY, capped at BATCH_MAX_CONCURRENCY
+    cache_control: Optional[str] = None
+    chart_format: str = "object"
+    deadline: Optional[float] = None  # seconds per query; defaults to RESEARCH_TIMEOUT
+    mode: Optional[str] = None  # "fast" or "thorough"; defaults to RESEARCH_MODE
+
+
+@router.post("/batch")
+async def batch_research(request: BatchResearchRequest):
+    """
+    Research many queries in one call, streamed as Server-Sent Events
+
+    Queries are deduplicated by their canonical form (the result cache key),
+    so "AI trends 2024" and "ai trends, 2024" run once. Up to `concurrency`
+    pipelines run at a time over the shared agent and HTTP connection pool.
+
+    Events: one `result` per unique query as it finishes (with every
+    submitted query and index it covers, its cache status and duration), an
+    `error` per failed query, and a final `done` with batch throughput.
+
+    Args:
+        request: Batch request with queries
+
+    Returns:
+        text/event-stream response
+    """
+
+    mode = research_mode(request.mode)
+    if len(request.queries) > settings.BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large: {len(request.queries)} queries (max {settings.BATCH_MAX_QUERIES})"
+        )
+
+    # Canonical key -> indices of the submitted queries it covers
+    groups: Dict[str, List[int]] = {}
+    for index, query in enumerate(request.queries):
+        groups.setdefault(canonical_query(query), []).append(index)
+
+    concurrency = max(1, min(
+        request.concurrency or settings.BATCH_CONCURRENCY,
+        settings.BATCH_MAX_CONCURRENCY,
+        len(groups) or 1
+    ))
+
+    async def run_one(indices: List[int]) -> Tuple[bool, str]:
+        query = request.queries[indices[0]]
+        covers = {"indices": indices, "queries": [request.queries[i] for i in indices]}
+        start = time.perf_counter()
+        try:
+            result, cache_status = await cached_research(
+                query, request.cache_control, request.deadline, mode
+            )
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            return False, _sse("error", {"query": query, **covers, "detail": detail})
+        result = with_chart_format(result, request.chart_format)
+        return True, _sse("result", {
+            "query": query,
+            **covers,
+            "cache": cache_status,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "result": dict(result)
+        })
+
+    async def events():
+        start = time.perf_counter()
+        pending: asyncio.Queue = asyncio.Queue()
+        for indices in groups.values():
+            pending.put_nowait(indices)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            while not pending.empty():
+                await finished.put(await run_one(pending.get_nowait()))
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        completed = failed = 0
+        in_flight = REQUESTS_IN_FLIGHT.labels("batch")
+        in_flight.inc()
+        try:
+            for _ in range(len(groups)):
+                ok, event = await finished.get()
+                completed += ok
+                failed += not ok
+                yield event
+
+            elapsed = time.perf_counter() - start
+            yield _sse("done", {
+                "submitted": len(request.queries),
+                "unique": len(groups),
+                "duplicates": len(request.queries) - len(groups),
+                "completed": completed,
+                "failed": failed,
+                "concurrency": concurrency,
+                "elapsed_s": round(elapsed, 3),
+                "queries_per_second": round(len(groups) / elapsed, 3) if elapsed else None
+            })
+        finally:
+            # Client disconnected or batch finished: stop outstanding work
+            in_flight.dec()
+            for task in workers:
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def run_job(job: Dict[str, Any], progress: Callable[[str], Awaitable[None]]) -> Dict[str, Any]:
+    """Job runner: full pipeline with the job's mode and deadline, stage progress reported to the job store"""
+
+    async def on_event(event: str, data: Any):
+        await progress(event)
+
+    result = await run_research(job["query"], on_event=on_event, deadline=job.get("deadline"), mode=job.get("mode"))
+    return result.model_dump()
+
+
+job_queue = JobQueue(JobStore(), run_job, workers=settings.JOB_WORKERS)
+
+
+@router.post("/jobs", status_code=202)
+async def submit_research_job(request: ResearchRequest):
+    """
+    Queue research for background execution
+
+    Returns immediately with a job id; poll GET /jobs/{job_id} for progress
+    and the finished ResearchResponse payload. `mode` and `deadline` apply
+    as in conduct_research. Jobs always run the pipeline and return chart
+    objects, so cache_control, reuse and chart_format are rejected.
+    """
+
+    mode = research_mode(request.mode)
+    unsupported = [
+        name for name, unset in (
+            ("cache_control", request.cache_control is None),
+            ("chart_format", request.chart_format == "object"),
+            ("reuse", not request.reuse),
+            ("reuse_min_score", request.reuse_min_score is None),
+            ("reuse_max_age", request.reuse_max_age is None),
+        ) if not unset
+    ]
+    if unsupported:
+        raise HTTPException(status_code=400, detail=f"Not supported for jobs: {', '.join(unsupported)}")
+
+    if not job_queue.available:
+        raise HTTPException(status_code=503, detail="Job queue unavailable: database not reachable")
+
+    job = await job_queue.submit(request.query, mode=mode, deadline=request.deadline)
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "status_url": f"/api/v1/research/jobs/{job['job_id']}"
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_research_job(job_id: str):
+    """Job status, progress (last completed stage) and result when finished"""
+
+    if not job_queue.available:
+        raise HTTPException(status_code=503, detail="Job queue unavailable: database not reachable")
+
+    job = await job_queue.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@router.get("/history")
+async def research_history(
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = None,
+    query: Optional[str] = None
+):
+    """
+    Past research runs, newest first, one page at a time
+
+    Pagination is keyset-based: pass the returned `next_cursor` to get the
+    following page (it is null on the last page). Pages stay consistent
+    while new runs are saved, and deep pages are as fast as the first.
+
+    Args:
+        limit: Page size (default HISTORY_PAGE_SIZE, max HISTORY_MAX_PAGE_SIZE)
+        cursor: next_cursor from the previous page
+        query: Only runs of this query (matched by its canonical form)
+
+    Returns:
+        {"items": [...], "next_cursor": str or null}
+    """
+
+    if not research_store.available:
+        raise HTTPException(status_code=503, detail="Research history unavailable: database not reachable")
+
+    page_size = min(limit or settings.HISTORY_PAGE_SIZE, settings.HISTORY_MAX_PAGE_SIZE)
+    try:
+        items, next_cursor = await research_store.history(page_size, cursor, query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/search")
+async def search_research(
+    q: str = Query(min_length=1),
+    limit: Optional[int] = Query(default=None, ge=1)
+):
+    """
+    Past research runs matching free text, best first
+
+    Searches the full-text index over saved queries, insights summaries
+    and source titles. Each item carries `score`, the similarity of its
+    query to `q` (0 to 1) - the measure ResearchRequest.reuse thresholds.
+
+    Args:
+        q: Search text
+        limit: Number of results (default SEARCH_PAGE_SIZE, max HISTORY_MAX_PAGE_SIZE)
+
+    Returns:
+        {"items": [...], "took_ms": float}
+    """
+
+    if not research_store.available:
+        raise HTTPException(status_code=503, detail="Research search unavailable: database not reachable")
+
+    start = time.perf_counter()
+    items = await research_store.search(q, min(limit or settings.SEARCH_PAGE_SIZE, settings.HISTORY_MAX_PAGE_SIZE))
+    return {"items": items, "took_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+@router.get("/history/{run_id}")
+async def get_research_run(run_id: int):
+    """A saved research run with its structured data, charts, insights, sources and timings"""
+
+    if not research_store.available:
+        raise HTTPException(status_code=503, detail="Research history unavailable: database not reachable")
+
+    run = await research_store.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Research run not found: {run_id}")
+    return run
+
+
+class ChartExportRequest(BaseModel):
+    """Static chart export request: a figure, or a chart spec to render first"""
+    figure: Optional[Union[Dict[str, Any], str]] = None  # chart "data" from a research response
+    chart_type: Optional[str] = None
+    data: Optional[List[Dict[str, Any]]] = None
+    title: str = ""
+    format: str = "png"  # png or svg
+    width: Optional[int] = Field(None, ge=1, le=settings.CHART_EXPORT_MAX_PX)  # defaults to CHART_WIDTH
+    height: Optional[int] = Field(None, ge=1, le=settings.CHART_EXPORT_MAX_PX)  # defaults to CHART_HEIGHT
+
+
+@router.post("/charts/export")
+async def export_chart(request: ChartExportRequest):
+    """
+    Export a chart as a PNG or SVG image
+
+    Pass either `figure` (a chart's `data` from a research response, as an
+    object or legacy JSON string) or `chart_type` + `data` + `title` to
+    generate one. Images are rendered by warm kaleido workers and cached by
+    figure and size; the X-Chart-Cache header reports HIT or MISS.
+    """
+
+    if not chart_export_pool.available:
+        raise HTTPException(status_code=503, detail="Chart image export unavailable")
+    if request.format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported image format: {request.format}")
+
+    if isinstance(request.figure, str):
+        try:
+            figure = json.loads(request.figure)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="figure is not valid JSON")
+    elif request.figure is not None:
+        figure = request.figure
+    elif request.chart_type:
+        figure = await chart_pool.render(request.chart_type, request.data or [], request.title)
+    else:
+        raise HTTPException(status_code=400, detail="Provide a figure or a chart_type with data")
+
+    image, cached = await chart_export_pool.export(figure, request.format, request.width, request.height)
+    return Response(
+        content=image,
+        media_type=IMAGE_FORMATS[request.format],
+        headers={"X-Chart-Cache": "HIT" if cached else "MISS"}
+    )
+
+
 @router.get("/test")
 async def test_research():
     """Test endpoint to verify research system is working"""
 
     try:
         test_query = "AI market trends 2024"
-        result = await conduct_research(ResearchRequest(query=test_query))
+        result = await run_research(test_query)
         return {
             "status": "success",
             "message": "Research system is working!",
@@ -0,0 +1,244 @@
+"""
+Cache - Two-tier (in-process LRU + Redis/disk) cache for expensive provider calls
+"""
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from app.core.config import settings
+
+
+def cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    """Stable key from a namespace and JSON-serializable parameters"""
+    payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class LRUCache:
+    """Bounded in-process cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TwoTierCache:
+    """
+    In-process LRU in front of a shared Redis (or disk) tier
+
+    Values are stored JSON-encoded in both tiers so callers always receive a
+    fresh copy. The shared tier is optional: pass `redis_client` (anything
+    exposing async `get(key)` and `set(key, value, ex=ttl)`, e.g. a local
+    stand-in or a DiskStore) or a `redis_url`. If it errors, the tier is
+    skipped for `redis_retry_after` seconds and the cache keeps working
+    locally.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        redis_url: Optional[str] = None,
+        redis_client: Any = None,
+        redis_retry_after: float = 30.0,
+        owns_client: bool = False
+    ):
+        self.name = name
+        self.local = LRUCache(max_entries)
+        self.redis_url = redis_url
+        self.redis = redis_client
+        self.redis_retry_after = redis_retry_after
+        self.owns_client = owns_client
+        self._redis_down_until = 0.0
+        self.counters = {"local_hits": 0, "shared_hits": 0, "misses": 0, "sets": 0, "shared_errors": 0}
+
+    def _redis(self):
+        if self._redis_down_until > time.monotonic():
+            return None
+        if self.redis is None and self.redis_url:
+            import redis.asyncio as aioredis
+            self.redis = aioredis.from_url(
+                self.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self.redis
+
+    def _redis_failed(self, error: Exception):
+        self.counters["shared_errors"] += 1
+        self._redis_down_until = time.monotonic() + self.redis_retry_after
+        print(f"WARNING: {self.name} cache shared tier unavailable: {error}")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None on a miss"""
+
+        value = self.local.get(key)
+        if value is not None:
+            self.counters["local_hits"] += 1
+            return json.loads(value)
+
+        redis = self._redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                raw = None
+            if raw is not None:
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+                ttl = await self._remaining_ttl(redis, key)
+                self.local.set(key, raw, ttl)
+                self.counters["shared_hits"] += 1
+                return json.loads(raw)
+
+        self.counters["misses"] += 1
+        return None
+
+    async def _remaining_ttl(self, redis, key: str) -> float:
+        """TTL to use when promoting a shared-tier hit into the local tier"""
+        try:
+            ttl = await redis.ttl(key)
+        except Exception:
+            ttl = -1
+        return float(ttl) if ttl and ttl > 0 else 60.0
+
+    async def set(self, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value in both tiers"""
+
+        raw = json.dumps(value, separators=(",", ":"), default=str)
+        self.local.set(key, raw, ttl)
+        self.counters["sets"] += 1
+
+        redis = self._redis()
+        if redis is not None:
+            try:
+                await redis.set(key, raw, ex=max(1, int(ttl)))
+            except Exception as e:
+                self._redis_failed(e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit ratio"""
+        hits = self.counters["local_hits"] + self.counters["shared_hits"]
+        lookups = hits + self.counters["misses"]
+        return {
+            **self.counters,
+            "entries": len(self.local),
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    async def close(self):
+        """Close the shared-tier connection if this cache opened it"""
+        if self.redis is not None and (self.redis_url or self.owns_client):
+            if hasattr(self.redis, "aclose"):
+                await self.redis.aclose()
+            self.redis = None
+
+
+class DiskStore:
+    """
+    SQLite-file shared tier with the same async interface as redis.asyncio
+
+    Persists entries across restarts for a single host. Queries run in a
+    worker thread so disk I/O never blocks the event loop.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+        )
+        self._conn.commit()
+        self._lock = asyncio.Lock()
+        self._writes = 0
+
+    async def _run(self, sql: str, params: tuple):
+        def execute():
+            rows = self._conn.execute(sql, params).fetchall()
+            self._conn.commit()
+            return rows
+
+        async with self._lock:
+            return await asyncio.to_thread(execute)
+
+    async def get(self, key: str) -> Optional[str]:
+        rows = await self._run(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        )
+        return rows[0][0] if rows else None
+
+    async def ttl(self, key: str) -> int:
+        rows = await self._run("SELECT expires_at FROM cache WHERE key = ?", (key,))
+        return int(rows[0][0] - time.time()) if rows else -2
+
+    async def set(self, key: str, value: str, ex: int):
+        await self._run(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ex),
+        )
+        self._writes += 1
+        if self._writes % 256 == 0:
+            await self._run("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    async def aclose(self):
+        self._conn.close()
+
+
+def create_cache(
+    name: str,
+    max_entries: int,
+    backend: Optional[str] = None,
+    path: Optional[str] = None
+) -> TwoTierCache:
+    """
+    Build a TwoTierCache from settings
+
+    Args:
+        name: Cache name used in logs and stats
+        max_entries: Size bound of the in-process LRU tier
+        backend: Shared tier - "redis", "disk" or "memory" (LRU only).
+            Defaults to "redis" when settings.CACHE_REDIS_ENABLED is set.
+        path: SQLite file for the "disk" backend
+
+    Returns:
+        Configured cache
+    """
+
+    if backend is None:
+        backend = "redis" if settings.CACHE_REDIS_ENABLED else "memory"
+
+    if backend == "redis" and settings.REDIS_URL:
+        return TwoTierCache(name, max_entries=max_entries, redis_url=settings.REDIS_URL)
+    if backend == "disk":
+        store = DiskStore(path or os.path.join(".cache", f"{name}.sqlite3"))
+        return TwoTierCache(name, max_entries=max_entries, redis_client=store, owns_client=True)
+    return TwoTierCache(name, max_entries=max_entries)
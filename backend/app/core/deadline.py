@@ -0,0 +1,35 @@
+"""
+Deadline - Absolute per-request time limit shared by every pipeline stage
+"""
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    A point in time (monotonic clock) a request must finish by
+
+    Pass one object down the pipeline instead of per-call timeouts, so time
+    a stage doesn't use is automatically available to the stages after it.
+    """
+
+    def __init__(self, seconds: float, expires_at: Optional[float] = None):
+        self.seconds = seconds
+        self.expires_at = expires_at if expires_at is not None else time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """A deadline `seconds` earlier, keeping that time back for later work"""
+        return Deadline(max(0.0, self.seconds - seconds), self.expires_at - seconds)
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """Remaining time, optionally capped (e.g. by a provider's own timeout)"""
+        remaining = self.remaining()
+        return remaining if cap is None else min(cap, remaining)
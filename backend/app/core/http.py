@@ -0,0 +1,50 @@
+"""
+HTTP Client - Application-scoped pooled client for outbound provider calls
+"""
+from typing import Optional
+import httpx
+
+from app.core.config import settings
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(**overrides) -> httpx.AsyncClient:
+    """
+    Build an AsyncClient with connection pooling configured from Settings
+
+    Args:
+        overrides: Extra httpx.AsyncClient keyword arguments (e.g. verify)
+
+    Returns:
+        A new pooled client
+    """
+
+    options = {
+        "limits": httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "http2": settings.HTTP2_ENABLED,
+        "timeout": settings.HTTP_TIMEOUT,
+    }
+    options.update(overrides)
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it if the lifespan hasn't yet"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client and release pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
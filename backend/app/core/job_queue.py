@@ -0,0 +1,92 @@
+"""
+Job Queue - Bounded worker pool that runs research jobs in the background
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.db.jobs import JobStore
+
+
+# Runner signature: (job record, progress callback) -> JSON-serializable result.
+# The record carries the request's query, mode and deadline.
+JobRunner = Callable[[Dict[str, Any], Callable[[str], Awaitable[None]]], Awaitable[Dict[str, Any]]]
+
+
+class JobQueue:
+    """
+    Persistent job queue drained by a fixed number of async workers
+
+    Jobs are written to the JobStore before being queued, so anything left
+    queued or running when the process stopped is picked up again on start.
+    """
+
+    def __init__(self, store: JobStore, runner: JobRunner, workers: int):
+        self.store = store
+        self.runner = runner
+        self.worker_count = workers
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.workers: List[asyncio.Task] = []
+        self.available = False
+
+    async def start(self):
+        """Spawn workers and resume unfinished jobs"""
+        self.queue = asyncio.Queue()
+        for job in await self.store.unfinished():
+            await self.store.update(job["job_id"], status="queued", progress=None)
+            self.queue.put_nowait(job)
+        self.workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.worker_count)
+        ]
+        self.available = True
+        print(f"Job queue started with {self.worker_count} workers ({self.queue.qsize()} resumed)")
+
+    async def stop(self):
+        """Cancel workers; in-flight jobs stay 'running' and resume on next start"""
+        self.available = False
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def submit(
+        self,
+        query: str,
+        mode: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Persist a new job and queue it; returns the job record"""
+        job = await self.store.create(query, mode=mode, deadline=deadline)
+        self.queue.put_nowait(job)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": len(self.workers), "queued": self.queue.qsize()}
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self.queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self.queue.task_done()
+
+    async def _run(self, job: Dict[str, Any]):
+        job_id = job["job_id"]
+        print(f"Job {job_id} started: {job['query']}")
+        await self.store.update(job_id, status="running", progress="started")
+
+        async def progress(stage: str):
+            await self.store.update(job_id, progress=stage)
+
+        try:
+            result = await self.runner(job, progress)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            detail = getattr(e, "detail", None) or str(e)
+            print(f"ERROR: Job {job_id} failed: {detail}")
+            await self.store.update(job_id, status="failed", error=str(detail))
+            return
+
+        await self.store.update(job_id, status="completed", progress="done", result=result)
+        print(f"Job {job_id} completed")
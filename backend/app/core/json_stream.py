@@ -0,0 +1,161 @@
+"""
+JSON Stream - Incremental parser for JSON objects arriving in chunks
+
+Lets a caller act on parts of a streamed LLM completion before the whole
+object has arrived: text inside string values is reported as it streams,
+and values near the top of the document are reported as soon as they
+close.
+"""
+import json
+import re
+from typing import Any, List, Optional, Tuple, Union
+
+
+Path = Tuple[Union[str, int], ...]
+
+# ("text", path, fragment) for string content as it arrives;
+# ("value", path, value) when a value at depth <= emit_depth closes
+Event = Tuple[str, Path, Any]
+
+_WHITESPACE = " \t\r\n"
+# A trailing high surrogate escape may be half of a pair split across chunks
+_TRAILING_HIGH_SURROGATE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}$")
+
+
+class _Frame:
+    __slots__ = ("kind", "path", "start", "key", "index")
+
+    def __init__(self, kind: str, path: Path, start: int):
+        self.kind = kind  # "object" or "array"
+        self.path = path
+        self.start = start
+        self.key: Optional[str] = None
+        self.index = -1
+
+
+class JSONStreamParser:
+    """
+    Feed chunks of one JSON document; get events for the parts that are ready
+
+    Paths are tuples of object keys and array indices from the root, so
+    {"summary": "...", "key_insights": ["a", "b"]} reports text for
+    ("summary",) and values for ("summary",), ("key_insights", 0),
+    ("key_insights", 1) and ("key_insights",).
+
+    Only a syntactically valid document is supported; malformed input is
+    not diagnosed until close(), which parses the full text with json.loads.
+    """
+
+    def __init__(self, emit_depth: int = 2):
+        self.emit_depth = emit_depth
+        self.text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        # String state
+        self._in_string = False
+        self._string_is_key = False
+        self._string_start = 0
+        self._string_path: Path = ()
+        self._escape_start: Optional[int] = None
+        self._unicode_left = 0
+        self._text_from = 0
+        # Number / true / false / null state
+        self._scalar_start: Optional[int] = None
+        self._scalar_path: Path = ()
+
+    def feed(self, chunk: str) -> List[Event]:
+        """Consume a chunk and return the events it completes"""
+
+        self.text += chunk
+        text = self.text
+        events: List[Event] = []
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._unicode_left:
+                    self._unicode_left -= 1
+                    if not self._unicode_left:
+                        self._escape_start = None
+                elif self._escape_start is not None:
+                    if char == "u":
+                        self._unicode_left = 4
+                    else:
+                        self._escape_start = None
+                elif char == "\\":
+                    self._escape_start = i
+                elif char == '"':
+                    self._end_string(i, events)
+                continue
+
+            if self._scalar_start is not None:
+                if char not in ",]}" and char not in _WHITESPACE:
+                    continue
+                self._end_value(self._scalar_path, self._scalar_start, i, events)
+                self._scalar_start = None
+
+            if char in _WHITESPACE or char == ":":
+                continue
+            if char == ",":
+                continue
+            if char in "}]":
+                frame = self._stack.pop()
+                self._end_value(frame.path, frame.start, i + 1, events)
+            elif char == '"':
+                frame = self._stack[-1] if self._stack else None
+                self._in_string = True
+                self._string_start = i
+                self._text_from = i + 1
+                self._string_is_key = (
+                    frame is not None and frame.kind == "object" and frame.key is None
+                )
+                if not self._string_is_key:
+                    self._string_path = self._child_path()
+            elif char in "{[":
+                self._stack.append(_Frame("object" if char == "{" else "array", self._child_path(), i))
+            else:
+                self._scalar_start = i
+                self._scalar_path = self._child_path()
+
+        self._pos = len(text)
+        if self._in_string and not self._string_is_key:
+            self._flush_text(self._escape_start if self._escape_start is not None else len(text), events)
+        return events
+
+    def close(self) -> Any:
+        """Parse and return the complete document"""
+        return json.loads(self.text)
+
+    def _child_path(self) -> Path:
+        """Path of a value starting now (claims the next key/index of the enclosing container)"""
+        if not self._stack:
+            return ()
+        frame = self._stack[-1]
+        if frame.kind == "object":
+            key, frame.key = frame.key, None
+            return frame.path + (key,)
+        frame.index += 1
+        return frame.path + (frame.index,)
+
+    def _end_string(self, end: int, events: List[Event]):
+        self._in_string = False
+        raw = self.text[self._string_start:end + 1]
+        if self._string_is_key:
+            self._stack[-1].key = json.loads(raw)
+            return
+        self._flush_text(end, events)
+        self._end_value(self._string_path, self._string_start, end + 1, events)
+
+    def _flush_text(self, end: int, events: List[Event]):
+        raw = self.text[self._text_from:end]
+        held = _TRAILING_HIGH_SURROGATE.search(raw)
+        if held:
+            raw = raw[:held.start()]
+        if raw:
+            events.append(("text", self._string_path, json.loads(f'"{raw}"')))
+            self._text_from += len(raw)
+
+    def _end_value(self, path: Path, start: int, end: int, events: List[Event]):
+        if 0 < len(path) <= self.emit_depth:
+            events.append(("value", path, json.loads(self.text[start:end])))
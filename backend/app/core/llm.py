@@ -0,0 +1,201 @@
+"""
+LLM Client - Non-blocking chat completion layer used by the research pipeline
+"""
+import json
+from typing import Dict, Any, Awaitable, Callable, List, Optional
+from groq import APIStatusError, APITimeoutError, AsyncGroq
+
+from app.core.config import settings
+from app.core.cache import cache_key, create_cache
+from app.core.rate_limit import get_rate_limiter, retry_after_seconds
+from app.core.single_flight import SingleFlight
+from app.core.json_stream import Event, JSONStreamParser
+from app.core.metrics import PROVIDER_ERRORS, PROVIDER_TIMEOUTS
+
+
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Statuses meaning the provider won't stream this request (e.g. no JSON mode with stream)
+STREAM_REJECTED_STATUSES = (400, 422)
+
+
+class LLMClient:
+    """Async wrapper around the Groq chat completions API"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        self.client = AsyncGroq(
+            api_key=api_key if api_key is not None else settings.GROQ_API_KEY,
+            base_url=base_url or settings.GROQ_BASE_URL or None,
+            timeout=timeout or settings.LLM_TIMEOUT,
+            # 429s are retried by the rate limiter, which also paces later calls
+            max_retries=0 if settings.RATE_LIMIT_ENABLED else 2,
+        )
+        self.limiter = get_rate_limiter("groq")
+        # Token usage reported by the API for uncached completions
+        self.usage = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self.flight = SingleFlight("llm")
+        # Models that rejected a streamed JSON-mode request; they are only called buffered
+        self.unstreamable_models = set()
+        self.cache = create_cache(
+            "llm",
+            settings.LLM_CACHE_MAX_ENTRIES,
+            backend=settings.LLM_CACHE_BACKEND,
+            path=settings.LLM_CACHE_PATH,
+        )
+
+    async def complete_json(
+        self,
+        prompt: str,
+        temperature: float,
+        model: Optional[str] = None,
+        stage: Optional[str] = None,
+        on_partial: Optional[Callable[[List[Event]], Awaitable[None]]] = None,
+        partial_depth: int = 2
+    ) -> Dict[str, Any]:
+        """
+        Run a JSON-mode chat completion without blocking the event loop
+
+        Identical (prompt, model, temperature, response_format) requests are
+        served from the completion cache unless caching is disabled or the
+        stage is listed in settings.LLM_CACHE_BYPASS_STAGES. Uncached calls
+        go through the "groq" rate limiter, and concurrent identical requests
+        share one call.
+
+        With `on_partial`, the completion is streamed and parsed
+        incrementally; the callback receives JSONStreamParser events (string
+        text as it arrives, values up to `partial_depth` as they close).
+        Cached and coalesced results replay the same events in one batch.
+        Streamed and non-streamed calls share cache entries. If the stream
+        is rejected or breaks off, the call is retried once unstreamed and
+        its result replayed (events then restart from the beginning of the
+        document); a model that rejects streaming is not streamed again.
+
+        Args:
+            prompt: User prompt text
+            temperature: Sampling temperature
+            model: Model name (defaults to settings.DEFAULT_LLM_MODEL)
+            stage: Pipeline stage name, used for the cache bypass switch
+            on_partial: Optional coroutine called with each batch of parse events
+            partial_depth: Deepest path reported by "value" events
+
+        Returns:
+            Parsed JSON object from the completion
+        """
+
+        model = model or settings.DEFAULT_LLM_MODEL
+        use_cache = settings.LLM_CACHE_ENABLED and stage not in settings.llm_cache_bypass_stages
+
+        key = cache_key("llm", {
+            "prompt": prompt,
+            "model": model,
+            "temperature": temperature,
+            "response_format": JSON_RESPONSE_FORMAT,
+        })
+        async def replay(result: Dict[str, Any]) -> Dict[str, Any]:
+            if on_partial is not None:
+                await on_partial(JSONStreamParser(partial_depth).feed(json.dumps(result)))
+            return result
+
+        if use_cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return await replay(cached)
+
+        def create(stream: bool):
+            return self.limiter.call(lambda: self.client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=model,
+                temperature=temperature,
+                response_format=JSON_RESPONSE_FORMAT,
+                stream=stream
+            ))
+
+        async def buffered() -> Dict[str, Any]:
+            response = await create(stream=False)
+            self._record_usage(response.usage)
+            return json.loads(response.choices[0].message.content)
+
+        async def streamed() -> Dict[str, Any]:
+            if model not in self.unstreamable_models:
+                try:
+                    return await self._stream(await create(stream=True), on_partial, partial_depth)
+                except Exception as e:
+                    if not self._stream_failed(model, e):
+                        raise
+            return await replay(await buffered())
+
+        async def complete() -> Dict[str, Any]:
+            try:
+                result = await (buffered() if on_partial is None else streamed())
+            except APITimeoutError:
+                PROVIDER_TIMEOUTS.labels("groq").inc()
+                raise
+            except Exception:
+                PROVIDER_ERRORS.labels("groq").inc()
+                raise
+            if use_cache:
+                await self.cache.set(key, result, settings.LLM_CACHE_TTL)
+            return result
+
+        # Bypassed stages still coalesce, but only with other bypassed calls.
+        # Streaming callers coalesce separately: a joiner only gets the final result.
+        flight_key = key if use_cache else f"{key}:nocache"
+        if on_partial is not None:
+            flight_key += ":stream"
+        result, shared = await self.flight.run(flight_key, complete)
+        return await replay(result) if shared else result
+
+    async def _stream(
+        self,
+        stream: Any,
+        on_partial: Callable[[List[Event]], Awaitable[None]],
+        partial_depth: int
+    ) -> Dict[str, Any]:
+        """Consume a streamed completion, reporting parse events as chunks arrive"""
+        parser = JSONStreamParser(partial_depth)
+        try:
+            async for chunk in stream:
+                if chunk.x_groq is not None and chunk.x_groq.usage is not None:
+                    self._record_usage(chunk.x_groq.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    events = parser.feed(chunk.choices[0].delta.content)
+                    if events:
+                        await on_partial(events)
+        finally:
+            # Release the connection if the stage is cut or cancelled mid-stream
+            await stream.response.aclose()
+        return parser.close()
+
+    def _stream_failed(self, model: str, error: Exception) -> bool:
+        """
+        Record a failed streamed call; True if it should be retried unstreamed
+
+        Timeouts and exhausted 429 retries are not retried: an unstreamed
+        call would meet the same limit.
+        """
+
+        if isinstance(error, APITimeoutError) or retry_after_seconds(error) is not None:
+            return False
+        PROVIDER_ERRORS.labels("groq").inc()
+        if isinstance(error, APIStatusError) and error.status_code in STREAM_REJECTED_STATUSES:
+            self.unstreamable_models.add(model)
+            print(f"WARNING: {model} rejected a streamed completion, no longer streaming it: {error}")
+        else:
+            print(f"WARNING: Streamed completion failed, retrying unstreamed: {error}")
+        return True
+
+    def _record_usage(self, usage: Any):
+        if usage is not None:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += usage.prompt_tokens or 0
+            self.usage["completion_tokens"] += usage.completion_tokens or 0
+
+    async def close(self):
+        """Close the underlying HTTP connection pool and cache"""
+        await self.client.close()
+        await self.cache.close()
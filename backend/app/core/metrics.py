@@ -0,0 +1,311 @@
+"""
+Metrics - Counters, gauges and histograms rendered in the Prometheus text format
+
+Recording is a couple of attribute updates on a pre-resolved child
+(`metric.labels(...)` once, then `.inc()` / `.observe()`), cheap enough
+for the request path. Updates are not locked: they happen on the event
+loop thread (chart workers are processes and report back through it).
+Values owned by other components - cache counters, rate limiter
+in-flight calls - are read at scrape time through callbacks instead of
+being mirrored on every update.
+"""
+import math
+from abc import ABC, abstractmethod
+from asyncio import CancelledError
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+# Seconds; wide enough for cached lookups through multi-second LLM stages
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Registry:
+    """Named metrics and scrape-time callbacks, rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Union["_Metric", "Callback"]] = {}
+
+    def register(self, metric: Union["_Metric", "Callback"]):
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[Registry] = REGISTRY
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        if registry is not None:
+            registry.register(self)
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values: str):
+        """The child for these label values (look it up once and keep it on hot paths)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """A fresh child holding one label combination's value"""
+
+    def samples(self) -> Iterable[str]:
+        for values, child in self._children.items():
+            yield f"{self.name}{_labels_text(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (errors, timeouts, cuts)"""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._default.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def track(self) -> "_GaugeChild":
+        """`with gauge.track():` counts the block as in progress"""
+        return self
+
+    # The child is its own tracker, so tracking allocates nothing
+    def __enter__(self):
+        self.value += 1
+
+    def __exit__(self, *exc):
+        self.value -= 1
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (requests in flight)"""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1):
+        self._default.value += amount
+
+    def dec(self, amount: float = 1):
+        self._default.value -= amount
+
+    def set(self, value: float):
+        self._default.value = value
+
+    def track(self) -> _GaugeChild:
+        return self._default
+
+
+class _Timer:
+    """Context manager observing the block's duration in seconds (not if it is cancelled)"""
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: "_HistogramChild"):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None and issubclass(exc_type, CancelledError):
+            return  # cut by a deadline or disconnect; counted elsewhere, not a latency
+        # observe() inlined: this runs on every timed block
+        histogram = self.histogram
+        value = perf_counter() - self.start
+        histogram.counts[bisect_left(histogram.upper, value)] += 1
+        histogram.sum += value
+
+
+class _HistogramChild:
+    __slots__ = ("upper", "counts", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.upper = buckets
+        # counts[i]: observations in (upper[i-1], upper[i]]; made cumulative when rendered
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.upper, value)] += 1
+        self.sum += value
+
+    def time(self) -> _Timer:
+        """`with histogram.time():` observes how long the block took"""
+        return _Timer(self)
+
+
+class Histogram(_Metric):
+    """Distribution of observations (durations) in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional[Registry] = REGISTRY
+    ):
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, help, labelnames, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return _Timer(self._default)
+
+    def samples(self) -> Iterable[str]:
+        names = self.labelnames + ("le",)
+        for values, child in self._children.items():
+            cumulative = 0
+            for upper, count in zip(child.upper, child.counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels_text(names, values + (_format_value(upper),))} {cumulative}"
+            labels = _labels_text(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Callback:
+    """
+    Metric whose samples are read from another component when scraped
+
+    `callback()` returns {label values: value}; it costs nothing until
+    /metrics is requested. It has no children to update.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+        registry: Optional[Registry] = REGISTRY
+    ):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        if registry is not None:
+            registry.register(self)
+
+    def samples(self) -> Iterable[str]:
+        for values, value in self.callback().items():
+            yield f"{self.name}{_labels_text(self.labelnames, values)} {_format_value(value)}"
+
+
+# Pipeline metrics. Stage names match metadata.cut_stages: analysis, search,
+# extraction, insights, synthesis, search.<provider>, charts.<type>, infographic.
+STAGE_SECONDS = Histogram(
+    "research_stage_duration_seconds",
+    "Duration of each research pipeline stage",
+    ["stage"],
+)
+STAGE_CUTS = Counter(
+    "research_stage_cuts_total",
+    "Stages cut short by the request deadline",
+    ["stage"],
+)
+PROVIDER_ERRORS = Counter(
+    "provider_errors_total",
+    "Failed calls to external providers (serper, tavily, groq), excluding timeouts",
+    ["provider"],
+)
+PROVIDER_TIMEOUTS = Counter(
+    "provider_timeouts_total",
+    "Provider calls that timed out or were cut by the request deadline",
+    ["provider"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "research_requests_in_flight",
+    "Research requests being handled, by endpoint",
+    ["endpoint"],
+)
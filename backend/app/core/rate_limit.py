@@ -0,0 +1,200 @@
+"""
+Rate Limit - Per-provider token bucket, in-flight cap and adaptive 429 backoff
+"""
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+
+
+T = TypeVar("T")
+
+# Floor for the adaptive rate, as a fraction of the configured rate
+MIN_RATE_FACTOR = 1 / 16
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Seconds to wait if `error` is a 429 response, else None
+
+    Works for httpx.HTTPStatusError and the Groq SDK's APIStatusError (both
+    carry the httpx response). Returns 0.0 when no Retry-After is given.
+    """
+
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+
+    header = response.headers.get("retry-after")
+    if not header:
+        return 0.0
+    try:
+        return max(0.0, float(header))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(header).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class RateLimiter:
+    """
+    Governs calls to one outbound provider
+
+    Each call takes an in-flight slot, then a token from a bucket refilled at
+    `rate_per_minute` (up to `burst` saved). Calls wait in line rather than
+    fail. A 429 pauses the provider for its Retry-After (or an exponential
+    backoff), halves the refill rate and retries the call; successes restore
+    the rate gradually.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: float,
+        burst: int,
+        max_in_flight: int,
+        max_retries: int,
+        max_backoff: float,
+        enabled: bool = True
+    ):
+        self.name = name
+        self.rate = rate_per_minute / 60
+        self.current_rate = self.rate
+        self.capacity = max(1, burst)
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.enabled = enabled and self.rate > 0
+
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._bucket = asyncio.Lock()  # waiters take tokens in arrival order
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+        self.counters = {"calls": 0, "waited": 0, "throttled": 0, "retries": 0, "failed": 0}
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `func()` under the limits, retrying 429s
+
+        Args:
+            func: Zero-argument coroutine factory making the provider request
+
+        Returns:
+            The result of func()
+        """
+
+        if not self.enabled:
+            return await func()
+
+        attempt = 0
+        while True:
+            queued_at = time.monotonic()
+            async with self._slots:
+                await self._take_token()
+                self._record_wait(time.monotonic() - queued_at)
+                self._in_flight += 1
+                try:
+                    result = await func()
+                except Exception as e:
+                    retry_after = retry_after_seconds(e)
+                    if retry_after is None:
+                        self.counters["failed"] += 1
+                        raise
+                    self._throttle(retry_after, attempt)
+                    if attempt >= self.max_retries:
+                        self.counters["failed"] += 1
+                        raise
+                    attempt += 1
+                    self.counters["retries"] += 1
+                    continue
+                finally:
+                    self._in_flight -= 1
+
+            # Additive recovery towards the configured rate
+            self.current_rate = min(self.rate, self.current_rate + self.rate / 10)
+            return result
+
+    async def _take_token(self):
+        async with self._bucket:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.current_rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.current_rate)
+
+    def _throttle(self, retry_after: float, attempt: int):
+        """Pause the provider and cut the refill rate after a 429"""
+        self.counters["throttled"] += 1
+        delay = retry_after or min(self.max_backoff, (2 ** attempt) * (1 + random.random()))
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self.current_rate = max(self.rate * MIN_RATE_FACTOR, self.current_rate / 2)
+        # One call may go when the pause ends; saved burst would just draw more 429s
+        self.tokens = 1.0
+        self._updated = self._paused_until
+        print(f"WARNING: {self.name} rate limited, backing off {delay:.1f}s")
+
+    def _record_wait(self, waited: float):
+        self.counters["calls"] += 1
+        if waited > 0.001:
+            self.counters["waited"] += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.counters["calls"]
+        return {
+            **self.counters,
+            "enabled": self.enabled,
+            "in_flight": self._in_flight,
+            "rate_per_minute": round(self.current_rate * 60, 2),
+            "configured_per_minute": round(self.rate * 60, 2),
+            "wait_total_s": round(self.wait_total, 3),
+            "wait_avg_ms": round(self.wait_total / calls * 1000, 2) if calls else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 2),
+        }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+# Per-provider rate overrides; 0 falls back to RATE_LIMIT_PER_MINUTE
+PROVIDER_RATES = {
+    "groq": "GROQ_RATE_LIMIT_PER_MINUTE",
+    "serper": "SERPER_RATE_LIMIT_PER_MINUTE",
+    "tavily": "TAVILY_RATE_LIMIT_PER_MINUTE",
+}
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Return the process-wide limiter for a provider, creating it from Settings"""
+    if provider not in _limiters:
+        rate = getattr(settings, PROVIDER_RATES.get(provider, ""), 0) or settings.RATE_LIMIT_PER_MINUTE
+        _limiters[provider] = RateLimiter(
+            provider,
+            rate_per_minute=rate,
+            burst=settings.RATE_LIMIT_BURST,
+            max_in_flight=settings.RATE_LIMIT_MAX_IN_FLIGHT,
+            max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+            max_backoff=settings.RATE_LIMIT_MAX_BACKOFF,
+            enabled=settings.RATE_LIMIT_ENABLED,
+        )
+    return _limiters[provider]
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Wait and throttle metrics for every provider limiter in use"""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
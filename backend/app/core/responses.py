@@ -0,0 +1,27 @@
+"""
+Responses - Fast JSON encoding for large API payloads
+"""
+import json
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def dumps(content: Any) -> str:
+    """Serialize to a JSON string with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(content, default=str)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (falls back to the stdlib encoder)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+        return super().render(content)
@@ -0,0 +1,86 @@
+"""
+Single Flight - Coalesces concurrent identical calls into one in-flight computation
+"""
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+from app.core.config import settings
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    """One shared computation and the number of callers awaiting it"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one `func()` per key at a time; concurrent callers share it
+
+    Errors propagate to every waiting caller. A cancelled caller stops
+    waiting without disturbing the others; the shared computation is only
+    cancelled once no caller is left waiting for it. Nothing is remembered
+    after completion - this coalesces in-flight work, it is not a cache.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[str, _Call] = {}
+        self.counters = {"calls": 0, "coalesced": 0, "errors": 0, "abandoned": 0}
+
+    async def run(self, key: str, func: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Await the in-flight call for `key`, starting `func()` if there is none
+
+        Args:
+            key: Identity of the computation (e.g. a cache key)
+            func: Zero-argument coroutine factory
+
+        Returns:
+            (result, shared) - shared is True when this caller joined a call
+            started by another; it then receives a deep copy of the result
+        """
+
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return await func(), False
+
+        self.counters["calls"] += 1
+        call = self._calls.get(key)
+        shared = call is not None
+        if shared:
+            self.counters["coalesced"] += 1
+        else:
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._finished(key, call))
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller gave up: stop the work and let the next caller start afresh
+                self.counters["abandoned"] += 1
+                self._forget(key, call)
+                call.task.cancel()
+
+        return (copy.deepcopy(result) if shared else result), shared
+
+    def _finished(self, key: str, call: _Call):
+        self._forget(key, call)
+        if not call.task.cancelled() and call.task.exception() is not None:
+            self.counters["errors"] += 1
+
+    def _forget(self, key: str, call: _Call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "in_flight": len(self._calls)}
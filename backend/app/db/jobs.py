@@ -0,0 +1,52 @@
+"""
+Job Store - Persistence for background research jobs
+"""
+import uuid
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, update
+
+from app.db.session import get_sessionmaker
+from app.db.models import ResearchJob, utcnow
+
+
+class JobStore:
+    """CRUD for ResearchJob rows in the DATABASE_URL store"""
+
+    async def create(
+        self,
+        query: str,
+        mode: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Insert a queued job and return it"""
+        job = ResearchJob(id=uuid.uuid4().hex, query=query, mode=mode, deadline=deadline, status="queued")
+        async with get_sessionmaker()() as session:
+            session.add(job)
+            await session.commit()
+        return job.to_dict()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a job by id"""
+        async with get_sessionmaker()() as session:
+            job = await session.get(ResearchJob, job_id)
+            return job.to_dict() if job else None
+
+    async def update(self, job_id: str, **fields):
+        """Update status/progress/result/error on a job"""
+        async with get_sessionmaker()() as session:
+            await session.execute(
+                update(ResearchJob)
+                .where(ResearchJob.id == job_id)
+                .values(updated_at=utcnow(), **fields)
+            )
+            await session.commit()
+
+    async def unfinished(self) -> List[Dict[str, Any]]:
+        """Jobs left queued or running (e.g. by a restart), oldest first"""
+        async with get_sessionmaker()() as session:
+            rows = await session.execute(
+                select(ResearchJob)
+                .where(ResearchJob.status.in_(["queued", "running"]))
+                .order_by(ResearchJob.created_at)
+            )
+            return [job.to_dict() for job in rows.scalars()]
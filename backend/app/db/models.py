@@ -0,0 +1,94 @@
+"""
+Database Models - Tables for persisted research data
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import JSON, BigInteger, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ResearchJob(Base):
+    """A research request queued for background execution"""
+
+    __tablename__ = "research_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    query: Mapped[str] = mapped_column(Text)
+    mode: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)  # None runs RESEARCH_MODE
+    deadline: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # seconds; None runs RESEARCH_TIMEOUT
+    status: Mapped[str] = mapped_column(String(16), default="queued")
+    progress: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    result: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+
+    __table_args__ = (Index("ix_research_jobs_status", "status"),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "query": self.query,
+            "mode": self.mode,
+            "deadline": self.deadline,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class ResearchRun(Base):
+    """A finished research pipeline run (completed or partial)"""
+
+    __tablename__ = "research_runs"
+
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    query: Mapped[str] = mapped_column(Text)
+    query_key: Mapped[str] = mapped_column(String(512))  # canonical_query(query)
+    mode: Mapped[str] = mapped_column(String(16))
+    status: Mapped[str] = mapped_column(String(16))
+    summary: Mapped[str] = mapped_column(Text, default="")  # insights summary, for listings
+    source_titles: Mapped[str] = mapped_column(Text, default="")  # newline-separated, for full-text search
+    structured_data: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    charts: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, default=list)
+    insights: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    sources: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, default=list)
+    timings: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    # (created_at, id) is the history sort and keyset cursor, globally and per query
+    __table_args__ = (
+        Index("ix_research_runs_created", "created_at", "id"),
+        Index("ix_research_runs_query_key_created", "query_key", "created_at", "id"),
+    )
+
+    def to_dict(self, full: bool = True) -> Dict[str, Any]:
+        """Full record, or (full=False) the listing fields only - the JSON payloads may be deferred"""
+        record = {
+            "run_id": self.id,
+            "query": self.query,
+            "query_key": self.query_key,
+            "mode": self.mode,
+            "status": self.status,
+            "summary": self.summary,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+        if full:
+            record.update(
+                structured_data=self.structured_data,
+                charts=self.charts,
+                insights=self.insights,
+                sources=self.sources,
+                timings=self.timings,
+            )
+        return record
@@ -0,0 +1,217 @@
+"""
+Research Store - Persistence and keyset-paginated history of research runs
+"""
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import load_only
+
+from app.db.session import get_sessionmaker
+from app.db.models import ResearchRun
+from app.db.search import query_similarity, search_run_ids
+from app.utils.text import canonical_query
+
+
+LISTING_COLUMNS = (
+    ResearchRun.id, ResearchRun.query, ResearchRun.query_key, ResearchRun.mode,
+    ResearchRun.status, ResearchRun.summary, ResearchRun.created_at,
+)
+
+
+def encode_cursor(run: ResearchRun) -> str:
+    """Opaque cursor for the position after `run` in history order"""
+    position = json.dumps([run.created_at.isoformat(), run.id])
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """(created_at, id) from a cursor; ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, run_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(run_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class ResearchStore:
+    """
+    Saves finished research runs and pages through them newest first
+
+    History uses keyset pagination on (created_at, id): each page is one
+    index range scan starting after the cursor, so page 1000 costs the same
+    as page 1 (OFFSET would read and discard every earlier row).
+    """
+
+    def __init__(self):
+        self.available = False
+        self._pending: Set[asyncio.Task] = set()
+
+    async def save(self, query: str, mode: str, result: Dict[str, Any]) -> int:
+        """
+        Insert a run and return its id
+
+        Args:
+            query: The research question as asked
+            mode: Pipeline mode ("fast" or "thorough")
+            result: ResearchResponse fields (status, charts, insights,
+                sources, metadata) plus structured_data
+        """
+
+        insights = result.get("insights") or {}
+        sources = result.get("sources") or []
+        run = ResearchRun(
+            query=query,
+            query_key=canonical_query(query),
+            mode=mode,
+            status=result.get("status", "completed"),
+            summary=insights.get("summary", "") if isinstance(insights, dict) else "",
+            structured_data=result.get("structured_data") or {},
+            charts=result.get("charts") or [],
+            insights=insights,
+            source_titles="\n".join(source.get("title") or "" for source in sources),
+            sources=sources,
+            timings=(result.get("metadata") or {}).get("timings", {}),
+        )
+        async with get_sessionmaker()() as session:
+            session.add(run)
+            await session.commit()
+        return run.id
+
+    def save_later(self, query: str, mode: str, result: Dict[str, Any]):
+        """Save in the background so the response isn't held up; failures are logged"""
+        if not self.available:
+            return
+
+        async def save():
+            try:
+                run_id = await self.save(query, mode, result)
+                print(f"Saved research run {run_id}: {query}")
+            except Exception as e:
+                print(f"WARNING: Could not save research run: {e}")
+
+        task = asyncio.create_task(save())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def get(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch one run with all of its data"""
+        async with get_sessionmaker()() as session:
+            run = await session.get(ResearchRun, run_id)
+            return run.to_dict() if run else None
+
+    async def history(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of runs, newest first
+
+        Args:
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first)
+            query: Only runs whose canonical query matches this one's
+
+        Returns:
+            (listing records, cursor for the next page or None at the end)
+        """
+
+        statement = (
+            select(ResearchRun)
+            .options(load_only(*LISTING_COLUMNS))
+            .order_by(ResearchRun.created_at.desc(), ResearchRun.id.desc())
+            .limit(limit + 1)
+        )
+        if query:
+            statement = statement.where(ResearchRun.query_key == canonical_query(query))
+        if cursor:
+            created_at, run_id = decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(ResearchRun.created_at, ResearchRun.id) < tuple_(created_at, run_id)
+            )
+
+        async with get_sessionmaker()() as session:
+            runs = list((await session.execute(statement)).scalars())
+
+        # One extra row tells whether another page exists
+        next_cursor = encode_cursor(runs[limit - 1]) if len(runs) > limit else None
+        return [run.to_dict(full=False) for run in runs[:limit]], next_cursor
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Runs matching a free-text query through the full-text index, best first
+
+        Runs containing every term come first; if there are none, runs
+        containing any term. Each listing record gets a "score": the query
+        similarity of the run's question to this one (see query_similarity).
+        """
+
+        ranked = await self._search_runs(query, limit, full=False)
+        if not ranked:
+            ranked = await self._search_runs(query, limit, full=False, match_all=False)
+        return [{**run.to_dict(full=False), "score": round(score, 3)} for run, score in ranked]
+
+    async def best_match(
+        self,
+        query: str,
+        mode: str,
+        min_score: float,
+        max_age: float,
+        candidates: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        """
+        The most similar completed run of this mode, if one is close and recent enough
+
+        Args:
+            query: The new research question
+            mode: Pipeline mode the result must have been produced by
+            min_score: Lowest query similarity accepted
+            max_age: Oldest run accepted, in seconds
+            candidates: Top full-text hits to consider
+
+        Returns:
+            Full run record plus "score", or None
+        """
+
+        since = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+        # Runs with every term are few and cheap to rank; a close match may still lack one term
+        for match_all in (True, False):
+            ranked = await self._search_runs(
+                query, candidates, full=True, match_all=match_all, since=since, status="completed", mode=mode
+            )
+            run, score = max(ranked, key=lambda pair: pair[1], default=(None, 0.0))
+            if run is not None and score >= min_score:
+                return {**run.to_dict(), "score": round(score, 3)}
+        return None
+
+    async def _search_runs(
+        self,
+        query: str,
+        limit: int,
+        full: bool,
+        **filters: Any
+    ) -> List[Tuple[ResearchRun, float]]:
+        """(run, query similarity) for the full-text hits (search_run_ids filters), in index order"""
+        async with get_sessionmaker()() as session:
+            hits = await search_run_ids(session, query, limit, **filters)
+            if not hits:
+                return []
+            statement = select(ResearchRun).where(ResearchRun.id.in_([run_id for run_id, _ in hits]))
+            if not full:
+                statement = statement.options(load_only(*LISTING_COLUMNS))
+            runs = {run.id: run for run in (await session.execute(statement)).scalars()}
+        return [
+            (runs[run_id], query_similarity(query, runs[run_id].query))
+            for run_id, _ in hits if run_id in runs
+        ]
+
+    async def close(self):
+        """Wait for background saves to finish"""
+        self.available = False
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
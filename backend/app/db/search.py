@@ -0,0 +1,175 @@
+"""
+Research Search - Full-text index over saved research runs
+
+SQLite uses an external-content FTS5 table kept in sync by triggers;
+Postgres uses a stored generated tsvector column with a GIN index. Both
+index the query (weighted highest), the insights summary and the source
+titles, and both return run ids best match first.
+"""
+import re
+from datetime import datetime
+from typing import FrozenSet, List, Optional, Tuple
+from sqlalchemy import column, func, inspect, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.db.models import ResearchRun
+from app.utils.text import STOP_WORDS, canonical_query
+
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS research_runs_fts USING fts5(
+        query, summary, source_titles,
+        content='research_runs', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS research_runs_fts_insert AFTER INSERT ON research_runs BEGIN
+        INSERT INTO research_runs_fts(rowid, query, summary, source_titles)
+        VALUES (new.id, new.query, new.summary, new.source_titles);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS research_runs_fts_delete AFTER DELETE ON research_runs BEGIN
+        INSERT INTO research_runs_fts(research_runs_fts, rowid, query, summary, source_titles)
+        VALUES ('delete', old.id, old.query, old.summary, old.source_titles);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS research_runs_fts_update AFTER UPDATE ON research_runs BEGIN
+        INSERT INTO research_runs_fts(research_runs_fts, rowid, query, summary, source_titles)
+        VALUES ('delete', old.id, old.query, old.summary, old.source_titles);
+        INSERT INTO research_runs_fts(rowid, query, summary, source_titles)
+        VALUES (new.id, new.query, new.summary, new.source_titles);
+    END""",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE research_runs ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(query, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(summary, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(source_titles, '')), 'C')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_research_runs_search ON research_runs USING GIN (search_vector)",
+]
+
+# Column weights for SQLite's bm25(): query, summary, source titles
+SQLITE_WEIGHTS = (10.0, 2.0, 1.0)
+
+_TERM = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    """Distinct lowercase terms without stop words (all terms if nothing else is left)"""
+    terms = _TERM.findall(query.lower())
+    content = [term for term in terms if term not in STOP_WORDS] or terms
+    return list(dict.fromkeys(content))
+
+
+def _stem(term: str) -> str:
+    """Fold plurals so "market" and "markets" count as the same term"""
+    if len(term) > 4 and term.endswith("ies"):
+        return term[:-3] + "y"
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+
+def query_terms(query: str) -> FrozenSet[str]:
+    """Stemmed terms of a query's canonical form (question and comparison words kept)"""
+    return frozenset(_stem(term) for term in canonical_query(query).split())
+
+
+def query_similarity(first: str, second: str) -> float:
+    """
+    Jaccard similarity of two queries' stemmed content terms (0 to 1)
+
+    Unlike FTS relevance it is comparable across searches, so it can be
+    held to a fixed threshold when deciding whether a past run answers a
+    new query.
+    """
+    a, b = query_terms(first), query_terms(second)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+async def init_search_index(conn: AsyncConnection):
+    """Create the full-text index for the connection's dialect (idempotent)"""
+    dialect = conn.dialect.name
+    # research_runs tables created before the index have no source_titles column
+    columns = await conn.run_sync(lambda sync: inspect(sync).get_columns("research_runs"))
+    if "source_titles" not in {c["name"] for c in columns}:
+        await conn.execute(text("ALTER TABLE research_runs ADD COLUMN source_titles TEXT DEFAULT ''"))
+
+    if dialect == "sqlite":
+        existed = (await conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE name = 'research_runs_fts'"
+        ))).first() is not None
+        for statement in SQLITE_DDL:
+            await conn.execute(text(statement))
+        if not existed:
+            # Index runs saved before the index existed
+            await conn.execute(text("INSERT INTO research_runs_fts(research_runs_fts) VALUES ('rebuild')"))
+    elif dialect == "postgresql":
+        for statement in POSTGRES_DDL:
+            await conn.execute(text(statement))
+
+
+async def search_run_ids(
+    session: AsyncSession,
+    query: str,
+    limit: int,
+    match_all: bool = True,
+    since: Optional[datetime] = None,
+    status: Optional[str] = None,
+    mode: Optional[str] = None
+) -> List[Tuple[int, float]]:
+    """
+    Ids of runs matching the query's terms, best first
+
+    Args:
+        session: Session to query with
+        query: Free text; stop words and punctuation are ignored
+        limit: Number of ids
+        match_all: Require every term (otherwise any term)
+        since: Only runs created at or after this time
+        status: Only runs with this status
+        mode: Only runs of this pipeline mode
+
+    Returns:
+        (run id, relevance) pairs; relevance is backend-specific (negated
+        bm25 on SQLite, ts_rank_cd on Postgres) and only orders results
+    """
+
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    runs = ResearchRun.__table__
+    if session.bind.dialect.name == "postgresql":
+        tsquery = func.to_tsquery("english", (" & " if match_all else " | ").join(terms))
+        vector = literal_column("research_runs.search_vector")  # generated column, not mapped
+        rank = func.ts_rank_cd(vector, tsquery)
+        statement = (
+            select(runs.c.id, rank.label("rank"))
+            .where(vector.op("@@")(tsquery))
+            .order_by(rank.desc(), runs.c.id.desc())
+        )
+        sign = 1.0
+    else:
+        # Quoted terms are literal FTS5 strings, so user text can't inject query syntax
+        match = (" AND " if match_all else " OR ").join(f'"{term}"' for term in terms)
+        fts = table("research_runs_fts", column("rowid"))
+        rank = func.bm25(literal_column("research_runs_fts"), *SQLITE_WEIGHTS)
+        statement = (
+            select(runs.c.id, rank.label("rank"))
+            .select_from(fts.join(runs, runs.c.id == fts.c.rowid))
+            .where(text("research_runs_fts MATCH :match").bindparams(match=match))
+            .order_by(rank, runs.c.id.desc())
+        )
+        sign = -1.0
+
+    if since is not None:
+        statement = statement.where(runs.c.created_at >= since)
+    if status is not None:
+        statement = statement.where(runs.c.status == status)
+    if mode is not None:
+        statement = statement.where(runs.c.mode == mode)
+
+    rows = await session.execute(statement.limit(limit))
+    return [(row.id, sign * float(row.rank)) for row in rows]
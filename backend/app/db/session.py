@@ -0,0 +1,83 @@
+"""
+Database - Async SQLAlchemy engine for DATABASE_URL (Postgres or SQLite)
+"""
+from typing import Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.core.config import settings
+
+
+class Base(DeclarativeBase):
+    """Declarative base for all tables"""
+
+
+_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: str) -> str:
+    """Map sync-style URLs onto async drivers (asyncpg / aiosqlite)"""
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+def get_engine() -> AsyncEngine:
+    """Return the shared engine, creating it on first use"""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(async_database_url(settings.DATABASE_URL), pool_pre_ping=True)
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker:
+    """Session factory bound to the shared engine"""
+    global _sessionmaker
+    if _sessionmaker is None:
+        _sessionmaker = async_sessionmaker(get_engine(), expire_on_commit=False)
+    return _sessionmaker
+
+
+def _add_missing_columns(sync_conn):
+    """
+    Add nullable model columns that tables created by an older version lack
+
+    create_all only creates missing tables. Non-nullable columns need a
+    backfill value and are added by the code that owns them.
+    """
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                column_type = column.type.compile(dialect=sync_conn.dialect)
+                sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+
+async def init_db():
+    """Create tables and the full-text search index that don't exist yet"""
+    # Import models so they register on Base.metadata
+    from app.db import models  # noqa: F401
+    from app.db.search import init_search_index
+
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await init_search_index(conn)
+
+
+async def close_db():
+    """Dispose of pooled database connections"""
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
@@ -0,0 +1,274 @@
+"""
+Chart Data - Extracts plot-ready series from structured research data
+
+Shared by the plotly.graph_objects path and the fast JSON path so both
+interpret LLM-provided records identically.
+"""
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+
+
+def line_series(data: List[Dict]) -> Tuple[List[Any], List[Any]]:
+    """x (year/date/x) and y (value/y) values for a line chart"""
+    x_values = [item.get("year", item.get("date", item.get("x", i)))
+                for i, item in enumerate(data)]
+    y_values = [item.get("value", item.get("y", 0)) for item in data]
+    return x_values, y_values
+
+
+def bar_series(data: List[Dict]) -> Tuple[List[Any], List[Any]]:
+    """Categories and values for a bar chart"""
+    categories = [item.get("category", item.get("country", item.get("name", f"Item {i+1}")))
+                  for i, item in enumerate(data)]
+    values = [item.get("value", item.get("funding", 0)) for item in data]
+    return categories, values
+
+
+def pie_series(data: List[Dict], color_scale: List[str]) -> Tuple[List[Any], List[Any], List[str]]:
+    """Labels, values and colors (custom or from the palette) for a pie chart"""
+    labels = [item.get("name", item.get("label", f"Segment {i+1}"))
+              for i, item in enumerate(data)]
+    values = [item.get("value", 0) for item in data]
+    colors = [item.get("color", color_scale[i % len(color_scale)])
+              for i, item in enumerate(data)]
+    return labels, values, colors
+
+
+def scatter_series(data: List[Dict]) -> Tuple[List[Any], List[Any]]:
+    """x and y values for a scatter plot"""
+    x_values = [item.get("x", i) for i, item in enumerate(data)]
+    y_values = [item.get("y", item.get("value", 0)) for item in data]
+    return x_values, y_values
+
+
+def fit_series(
+    x_values: List[Any],
+    y_values: List[Any],
+    point_budget: int,
+    webgl_threshold: int,
+    sort_by_x: bool = False
+) -> Tuple[List[Any], List[Any], Dict[str, Any]]:
+    """
+    Downsample a long x/y series to a point budget for large-series mode
+
+    Uses Largest-Triangle-Three-Buckets, which keeps the visual shape
+    (peaks, troughs) far better than striding. Line charts keep their point
+    order (x is used as the LTTB axis only when numeric and non-decreasing);
+    scatter plots pass sort_by_x. Non-numeric y values fall back to even
+    striding.
+
+    Args:
+        x_values: x values
+        y_values: y values
+        point_budget: Maximum points to render
+        webgl_threshold: Rendered point count above which WebGL should be used
+        sort_by_x: Order points by numeric x before bucketing
+
+    Returns:
+        (x values, y values, metadata with original/rendered point counts)
+    """
+
+    count = len(x_values)
+    meta = {
+        "original_points": count,
+        "rendered_points": count,
+        "webgl": count > webgl_threshold,
+    }
+    if count <= max(point_budget, 2):
+        return x_values, y_values, meta
+
+    x_numeric = _numeric_axis(x_values)
+    order = np.arange(count)
+    if sort_by_x and x_numeric is not None:
+        order = np.argsort(x_numeric, kind="stable")
+        axis = x_numeric[order]
+    elif x_numeric is not None and bool(np.all(np.diff(x_numeric) >= 0)):
+        axis = x_numeric
+    else:
+        axis = order.astype(np.float64)
+
+    try:
+        y_numeric = np.asarray(y_values, dtype=np.float64)[order]
+    except (TypeError, ValueError):
+        y_numeric = None
+
+    if y_numeric is None:
+        picked = order[np.linspace(0, count - 1, point_budget).astype(np.int64)]
+        meta["downsampling"] = "stride"
+    else:
+        picked = order[lttb_indices(axis, y_numeric, point_budget)]
+        meta["downsampling"] = "lttb"
+
+    meta["rendered_points"] = len(picked)
+    meta["webgl"] = len(picked) > webgl_threshold
+    return [x_values[i] for i in picked], [y_values[i] for i in picked], meta
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets"""
+
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # Bucket b spans [edges[b], edges[b + 1]); the first and last points stand alone
+    every = (count - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges[-1] = count - 1
+
+    # The third triangle vertex for bucket b is the mean of bucket b + 1
+    sizes = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:count - 1], edges[:-1])[1:] / sizes[1:], x[count - 1])
+    avg_y = np.append(np.add.reduceat(y[:count - 1], edges[:-1])[1:] / sizes[1:], y[count - 1])
+
+    # The anchor chains bucket to bucket, so the walk is sequential. Small
+    # buckets are cheaper in plain Python than as per-bucket NumPy calls.
+    vectorized = every > 48
+    xs, ys = (x, y) if vectorized else (x.tolist(), y.tolist())
+    bounds, avg_xs, avg_ys = edges.tolist(), avg_x.tolist(), avg_y.tolist()
+
+    picked = [0]
+    anchor_x, anchor_y = xs[0], ys[0]
+    for bucket in range(threshold - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        dx = anchor_x - avg_xs[bucket]
+        dy = avg_ys[bucket] - anchor_y
+        if vectorized:
+            area = np.abs(dx * (y[start:end] - anchor_y) - (anchor_x - x[start:end]) * dy)
+            best = start + int(np.argmax(area))
+        else:
+            best, best_area = start, -1.0
+            for i in range(start, end):
+                area = abs(dx * (ys[i] - anchor_y) - (anchor_x - xs[i]) * dy)
+                if area > best_area:
+                    best, best_area = i, area
+        picked.append(best)
+        anchor_x, anchor_y = xs[best], ys[best]
+
+    picked.append(count - 1)
+    return np.asarray(picked, dtype=np.int64)
+
+
+def _numeric_axis(values: List[Any]) -> Optional[np.ndarray]:
+    """x values as floats (numbers, numeric strings or ISO dates), else None"""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return np.asarray(values, dtype="datetime64[ns]").astype(np.int64).astype(np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+HEATMAP_AGGREGATIONS = ("last", "sum", "mean")
+
+
+def heatmap_grid(
+    data: List[Dict],
+    aggregation: str = "last",
+    max_cells: Optional[int] = None
+) -> Tuple[List[Any], List[Any], List[List[Any]]]:
+    """
+    Sorted x/y axes and the value matrix for [{x, y, value}, ...] records
+
+    Cells are located with a NumPy pivot (np.unique inverse indices), so the
+    cost is O(n log n) rather than a list.index() scan per point.
+
+    Args:
+        data: Records with x, y and value keys
+        aggregation: How duplicate (x, y) cells combine - "last" (later
+            records win), "sum" or "mean"
+        max_cells: If the grid has more cells than this, adjacent axis
+            values are binned together (labelled by each bin's first value)
+            until it fits
+
+    Returns:
+        (x axis values, y axis values, matrix indexed [y][x]); empty cells are 0
+    """
+
+    if aggregation not in HEATMAP_AGGREGATIONS:
+        raise ValueError(f"Unknown heatmap aggregation: {aggregation}")
+    if not data:
+        return [], [], []
+
+    x_keys = [item.get("x", 0) for item in data]
+    y_keys = [item.get("y", 0) for item in data]
+    raw_values = [item.get("value", 0) for item in data]
+
+    x_values, x_idx = _axis_index(x_keys)
+    y_values, y_idx = _axis_index(y_keys)
+
+    try:
+        values = np.asarray(raw_values)
+        if values.dtype.kind not in "iufb":
+            raise TypeError
+    except (TypeError, ValueError):
+        # Non-numeric values can't be aggregated; place them as-is, last wins
+        return _object_grid(x_values, y_values, x_idx, y_idx, raw_values)
+
+    if max_cells and len(x_values) * len(y_values) > max_cells:
+        scale = (max_cells / (len(x_values) * len(y_values))) ** 0.5
+        x_values, x_idx = _bin_axis(x_values, x_idx, max(1, int(len(x_values) * scale)))
+        y_values, y_idx = _bin_axis(y_values, y_idx, max(1, int(len(y_values) * scale)))
+
+    width, height = len(x_values), len(y_values)
+    flat = y_idx * width + x_idx
+
+    if aggregation == "last":
+        # Index of the last occurrence of each cell
+        reversed_cells, first_in_reversed = np.unique(flat[::-1], return_index=True)
+        last = len(flat) - 1 - first_in_reversed
+        dtype = values.dtype if values.dtype.kind in "iu" else np.float64
+        grid = np.zeros(width * height, dtype=dtype)
+        grid[reversed_cells] = values[last]
+    else:
+        sums = np.bincount(flat, weights=values.astype(np.float64), minlength=width * height)
+        if aggregation == "sum":
+            grid = sums.astype(np.int64) if values.dtype.kind in "iub" else sums
+        else:
+            counts = np.bincount(flat, minlength=width * height)
+            grid = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    return x_values, y_values, grid.reshape(height, width).tolist()
+
+
+def _axis_index(keys: List[Any]) -> Tuple[List[Any], np.ndarray]:
+    """Sorted distinct axis values and each key's position among them"""
+    try:
+        array = np.asarray(keys)
+        # NumPy silently stringifies mixed str/number keys; keep those as objects
+        homogeneous = array.dtype.kind in "iuf" or (
+            array.dtype.kind == "U" and all(isinstance(key, str) for key in keys)
+        )
+        if homogeneous:
+            unique, inverse = np.unique(array, return_inverse=True)
+            return unique.tolist(), inverse.reshape(-1)
+    except (TypeError, ValueError):
+        pass
+    # Objects NumPy can't order natively: fall back to a dict lookup
+    axis = sorted(set(keys))
+    position = {key: i for i, key in enumerate(axis)}
+    return axis, np.fromiter((position[key] for key in keys), dtype=np.int64, count=len(keys))
+
+
+def _bin_axis(axis: List[Any], index: np.ndarray, bins: int) -> Tuple[List[Any], np.ndarray]:
+    """Merge adjacent axis positions into `bins` groups"""
+    if bins >= len(axis):
+        return axis, index
+    edges = np.arange(len(axis)) * bins // len(axis)
+    labels = [axis[i] for i in np.searchsorted(edges, np.arange(bins))]
+    return labels, edges[index]
+
+
+def _object_grid(
+    x_values: List[Any],
+    y_values: List[Any],
+    x_idx: np.ndarray,
+    y_idx: np.ndarray,
+    values: List[Any]
+) -> Tuple[List[Any], List[Any], List[List[Any]]]:
+    matrix = [[0] * len(x_values) for _ in range(len(y_values))]
+    for x, y, value in zip(x_idx.tolist(), y_idx.tolist(), values):
+        matrix[y][x] = value
+    return x_values, y_values, matrix
@@ -0,0 +1,130 @@
+"""
+Chart Export - Static PNG/SVG chart images from a warm kaleido process pool
+
+Kaleido drives a headless Chromium that takes seconds to boot. Each worker
+process keeps its own Chromium alive between exports, and rendered images
+are cached by a hash of the figure JSON, format and size.
+"""
+import asyncio
+import base64
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.cache import cache_key, create_cache
+from app.core.config import settings
+from app.engines.chart_generator import ChartGenerator, IMAGE_FORMATS
+
+
+# One generator (and kaleido Chromium) per worker process
+_generator: Optional[ChartGenerator] = None
+
+
+def _export(figure: Dict[str, Any], image_format: str, width: int, height: int) -> bytes:
+    """Worker entry point: render one figure to image bytes"""
+    global _generator
+    if _generator is None:
+        _generator = ChartGenerator()
+    return _generator.export_image(figure, image_format, width, height)
+
+
+def _warm_up() -> bool:
+    """Boot kaleido's Chromium so the first real export is fast"""
+    _export({"data": [{"type": "bar", "y": [1]}], "layout": {}}, "png", 10, 10)
+    return True
+
+
+class ChartExportPool:
+    """
+    Persistent renderer processes for static chart export
+
+    If kaleido can't start (missing package or Chromium dependencies), the
+    pool is marked unavailable instead of failing app start-up.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or settings.CHART_EXPORT_WORKERS
+        self.cache = create_cache("chart_image", settings.CHART_IMAGE_CACHE_MAX_ENTRIES)
+        self.available = False
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def start(self):
+        """Create the pool and boot a renderer in every worker"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(*[
+                loop.run_in_executor(executor, _warm_up) for _ in range(self.workers)
+            ])
+        except Exception as e:
+            print(f"WARNING: Chart image export unavailable: {e}")
+            self.shutdown()
+            return
+        self.available = True
+        print(f"Chart export pool ready ({self.workers} kaleido workers)")
+
+    async def export(
+        self,
+        figure: Dict[str, Any],
+        image_format: str = "png",
+        width: Optional[int] = None,
+        height: Optional[int] = None
+    ) -> Tuple[bytes, bool]:
+        """
+        Render a figure to PNG/SVG bytes, serving repeats from the image cache
+
+        Args:
+            figure: Plotly figure dict
+            image_format: "png" or "svg"
+            width: Image width in pixels (default settings.CHART_WIDTH)
+            height: Image height in pixels (default settings.CHART_HEIGHT)
+
+        Returns:
+            (image bytes, whether it came from the cache)
+        """
+
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        width = width or settings.CHART_WIDTH
+        height = height or settings.CHART_HEIGHT
+
+        key = cache_key("chart_image", {
+            "figure": figure,
+            "format": image_format,
+            "width": width,
+            "height": height,
+        })
+        if settings.CHART_IMAGE_CACHE_ENABLED:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return base64.b64decode(cached), True
+
+        loop = asyncio.get_running_loop()
+        image = await loop.run_in_executor(
+            self._get_executor(), _export, figure, image_format, width, height
+        )
+
+        if settings.CHART_IMAGE_CACHE_ENABLED:
+            # Both cache tiers hold JSON, so images are stored base64-encoded
+            await self.cache.set(key, base64.b64encode(image).decode("ascii"), settings.CHART_IMAGE_CACHE_TTL)
+        return image, False
+
+    def shutdown(self):
+        """Stop renderer processes (and their Chromium instances)"""
+        self.available = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def close(self):
+        """Stop the pool and release the image cache"""
+        self.shutdown()
+        await self.cache.close()
@@ -3,14 +3,25 @@ Chart Generator - Creates beautiful, professional charts using Plotly
 """
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, List, Any
+import plotly.io as pio
+from typing import Dict, List, Any, Optional
 import json
 
+from app.core.config import settings
+from app.engines.chart_data import (
+    line_series, bar_series, pie_series, scatter_series, heatmap_grid, fit_series
+)
+from app.engines.fast_charts import FastChartBuilder
+
+
+# Static export formats and their media types
+IMAGE_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
 
 class ChartGenerator:
     """Generates professional charts from structured data"""
 
-    def __init__(self):
+    def __init__(self, fast_path: Optional[bool] = None, large_series: Optional[bool] = None):
         # Professional color palette
         self.colors = {
             "primary": "#3B82F6",  # Blue
@@ -27,6 +38,16 @@ class ChartGenerator:
             "#EC4899", "#14B8A6", "#F97316"
         ]
 
+        # Build figure JSON directly instead of via validated go.Figure objects
+        self.fast_path = settings.CHART_FAST_PATH if fast_path is None else fast_path
+
+        # Large-series mode: downsample line/scatter data and switch to WebGL
+        self.large_series = settings.CHART_LARGE_SERIES if large_series is None else large_series
+        self.point_budget = settings.CHART_POINT_BUDGET
+        self.webgl_threshold = settings.CHART_WEBGL_THRESHOLD
+
+        self.fast_builder = FastChartBuilder(self.colors, self.color_scale, self._fit_series)
+
     def generate_chart(self, chart_type: str, data: List[Dict], title: str) -> str:
         """
         Generate a chart and return as JSON (Plotly JSON format)
@@ -40,6 +61,85 @@ class ChartGenerator:
             JSON string of Plotly figure
         """
 
+        if self.fast_path:
+            return self.fast_builder.to_json(chart_type, data, title)
+
+        # Convert to JSON
+        return self._create_figure(chart_type, data, title).to_json()
+
+    def generate_figure(self, chart_type: str, data: List[Dict], title: str) -> Dict[str, Any]:
+        """
+        Generate a chart as a Plotly figure dict ({"data": [...], "layout": {...}})
+
+        Lets callers embed the figure in a larger response and serialize it
+        once, instead of nesting a pre-encoded JSON string.
+
+        Args:
+            chart_type: Type of chart (line, bar, pie, scatter, heatmap)
+            data: Data for the chart
+            title: Chart title
+
+        Returns:
+            Plotly figure dict
+        """
+
+        if self.fast_path:
+            figure = self.fast_builder.build(chart_type, data, title)
+            figure["layout"]["template"] = self.fast_builder.template()
+            return figure
+
+        return json.loads(self._create_figure(chart_type, data, title).to_json())
+
+    def export_image(
+        self,
+        figure: Dict[str, Any],
+        image_format: str = "png",
+        width: Optional[int] = None,
+        height: Optional[int] = None
+    ) -> bytes:
+        """
+        Render a Plotly figure dict to a static image with kaleido
+
+        Kaleido keeps one headless Chromium per process, so the first export
+        in a process is slow and later ones reuse it; see ChartExportPool.
+
+        Args:
+            figure: Plotly figure dict (e.g. from generate_figure)
+            image_format: "png" or "svg"
+            width: Image width in pixels (default settings.CHART_WIDTH)
+            height: Image height in pixels (default settings.CHART_HEIGHT)
+
+        Returns:
+            Image bytes
+        """
+
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+
+        return pio.to_image(
+            figure,
+            format=image_format,
+            width=width or settings.CHART_WIDTH,
+            height=height or settings.CHART_HEIGHT,
+            engine="kaleido"
+        )
+
+    def _fit_series(self, x_values: List[Any], y_values: List[Any], sort_by_x: bool = False):
+        """
+        Apply large-series mode to a line/scatter series
+
+        Returns:
+            (x values, y values, metadata) - metadata (original/rendered point
+            counts, downsampling method, WebGL) is None when the mode is off
+        """
+
+        if not self.large_series:
+            return x_values, y_values, None
+        return fit_series(x_values, y_values, self.point_budget, self.webgl_threshold, sort_by_x)
+
+    def _create_figure(self, chart_type: str, data: List[Dict], title: str) -> go.Figure:
+        """Build the validated go.Figure for a chart type"""
+
         if chart_type == "line" or chart_type == "line_chart":
             fig = self._create_line_chart(data, title)
         elif chart_type == "bar" or chart_type == "bar_chart":
@@ -54,20 +154,18 @@ class ChartGenerator:
             # Default to bar chart
             fig = self._create_bar_chart(data, title)
 
-        # Convert to JSON
-        return fig.to_json()
+        return fig
 
     def _create_line_chart(self, data: List[Dict], title: str) -> go.Figure:
         """Create a beautiful line chart"""
 
         # Extract x and y values
-        x_values = [item.get("year", item.get("date", item.get("x", i)))
-                    for i, item in enumerate(data)]
-        y_values = [item.get("value", item.get("y", 0)) for item in data]
+        x_values, y_values, meta = self._fit_series(*line_series(data))
+        scatter = go.Scattergl if meta and meta["webgl"] else go.Scatter
 
         fig = go.Figure()
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=x_values,
             y=y_values,
             mode='lines+markers',
@@ -97,15 +195,16 @@ class ChartGenerator:
             font=dict(family="Inter, sans-serif", size=12, color='#374151')
         )
 
+        if meta:
+            fig.update_layout(meta=meta)
+
         return fig
 
     def _create_bar_chart(self, data: List[Dict], title: str) -> go.Figure:
         """Create a beautiful bar chart"""
 
         # Extract categories and values
-        categories = [item.get("category", item.get("country", item.get("name", f"Item {i+1}")))
-                      for i, item in enumerate(data)]
-        values = [item.get("value", item.get("funding", 0)) for item in data]
+        categories, values = bar_series(data)
 
         fig = go.Figure()
 
@@ -144,14 +243,8 @@ class ChartGenerator:
     def _create_pie_chart(self, data: List[Dict], title: str) -> go.Figure:
         """Create a beautiful pie chart"""
 
-        # Extract labels and values
-        labels = [item.get("name", item.get("label", f"Segment {i+1}"))
-                  for i, item in enumerate(data)]
-        values = [item.get("value", 0) for item in data]
-
-        # Use custom colors if provided, otherwise use color scale
-        colors = [item.get("color", self.color_scale[i % len(self.color_scale)])
-                  for i, item in enumerate(data)]
+        # Extract labels and values; use custom colors if provided, otherwise the color scale
+        labels, values, colors = pie_series(data, self.color_scale)
 
         fig = go.Figure()
 
@@ -184,12 +277,12 @@ class ChartGenerator:
     def _create_scatter_plot(self, data: List[Dict], title: str) -> go.Figure:
         """Create a beautiful scatter plot"""
 
-        x_values = [item.get("x", i) for i, item in enumerate(data)]
-        y_values = [item.get("y", item.get("value", 0)) for item in data]
+        x_values, y_values, meta = self._fit_series(*scatter_series(data), sort_by_x=True)
+        scatter = go.Scattergl if meta and meta["webgl"] else go.Scatter
 
         fig = go.Figure()
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=x_values,
             y=y_values,
             mode='markers',
@@ -221,6 +314,9 @@ class ChartGenerator:
             font=dict(family="Inter, sans-serif", size=12, color='#374151')
         )
 
+        if meta:
+            fig.update_layout(meta=meta)
+
         return fig
 
     def _create_heatmap(self, data: List[Dict], title: str) -> go.Figure:
@@ -228,16 +324,11 @@ class ChartGenerator:
 
         # Assuming data is in format [{x, y, value}, ...]
         # Group by x and y to create matrix
-        x_values = sorted(set(item.get("x", 0) for item in data))
-        y_values = sorted(set(item.get("y", 0) for item in data))
-
-        # Create matrix
-        matrix = [[0] * len(x_values) for _ in range(len(y_values))]
-
-        for item in data:
-            x_idx = x_values.index(item.get("x", 0))
-            y_idx = y_values.index(item.get("y", 0))
-            matrix[y_idx][x_idx] = item.get("value", 0)
+        x_values, y_values, matrix = heatmap_grid(
+            data,
+            aggregation=settings.HEATMAP_AGGREGATION,
+            max_cells=settings.HEATMAP_MAX_CELLS
+        )
 
         fig = go.Figure()
 
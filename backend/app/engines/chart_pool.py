@@ -0,0 +1,77 @@
+"""
+Chart Pool - Renders charts on a worker pool so CPU work stays off the event loop
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.engines.chart_generator import ChartGenerator
+
+
+# One generator per worker process (or shared by threads; it is stateless)
+_generator: Optional[ChartGenerator] = None
+
+
+def _render(chart_type: str, data: List[Dict], title: str) -> Dict[str, Any]:
+    """Worker entry point: build one chart as a Plotly figure dict"""
+    global _generator
+    if _generator is None:
+        _generator = ChartGenerator()
+    return _generator.generate_figure(chart_type, data, title)
+
+
+def _warm_up() -> bool:
+    """Import plotly and build a throwaway figure so the first real chart is fast"""
+    _render("bar", [{"category": "warm-up", "value": 1}], "warm-up")
+    return True
+
+
+class ChartRenderPool:
+    """
+    Persistent executor for chart rendering
+
+    "process" mode gives true parallelism across requests (figure building
+    is pure-Python CPU work); "thread" mode avoids the process start-up and
+    pickling cost but still contends for the GIL.
+    """
+
+    def __init__(self, workers: Optional[int] = None, mode: Optional[str] = None):
+        self.workers = workers or settings.CHART_RENDER_WORKERS
+        self.mode = mode or settings.CHART_RENDER_MODE
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="chart-render",
+                )
+        return self._executor
+
+    async def start(self):
+        """Create the pool and warm every worker"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(executor, _warm_up) for _ in range(self.workers)
+        ])
+        print(f"Chart render pool ready ({self.workers} {self.mode} workers)")
+
+    async def render(self, chart_type: str, data: List[Dict], title: str) -> Dict[str, Any]:
+        """Render a chart in the pool and return the Plotly figure dict"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _render, chart_type, data, title)
+
+    def shutdown(self):
+        """Stop worker threads/processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
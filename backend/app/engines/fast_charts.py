@@ -0,0 +1,215 @@
+"""
+Fast Charts - Builds Plotly figure JSON directly from precompiled templates
+
+Produces the same figure JSON as ChartGenerator's plotly.graph_objects path
+without constructing validated go.Figure objects. The static trace styling,
+layout and Plotly theme template are compiled once per process; each chart
+only fills in its data and title.
+"""
+import json
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+from app.engines.chart_data import (
+    line_series, bar_series, pie_series, scatter_series, heatmap_grid
+)
+
+
+TITLE_FONT = {"size": 20, "color": "#1F2937"}
+BASE_FONT = {"family": "Inter, sans-serif", "size": 12, "color": "#374151"}
+GRID_AXIS = {"showgrid": True, "gridcolor": "#E5E7EB", "linecolor": "#9CA3AF"}
+
+# Plotly's "Blues" sequential scale, as go.Heatmap expands colorscale='Blues'
+BLUES = [
+    "rgb(247,251,255)", "rgb(222,235,247)", "rgb(198,219,239)",
+    "rgb(158,202,225)", "rgb(107,174,214)", "rgb(66,146,198)",
+    "rgb(33,113,181)", "rgb(8,81,156)", "rgb(8,48,107)",
+]
+BLUES_COLORSCALE = [[i / (len(BLUES) - 1), color] for i, color in enumerate(BLUES)]
+
+CHART_TYPES = {
+    "line": "line", "line_chart": "line",
+    "bar": "bar", "bar_chart": "bar",
+    "pie": "pie", "pie_chart": "pie",
+    "scatter": "scatter", "scatter_plot": "scatter",
+    "heatmap": "heatmap",
+}
+
+
+def _theme_template_json() -> str:
+    """Serialized default Plotly theme that go.Figure embeds in layout.template"""
+    import plotly.io as pio
+    from plotly.utils import PlotlyJSONEncoder
+
+    template = pio.templates[pio.templates.default]
+    return json.dumps(template.to_plotly_json(), cls=PlotlyJSONEncoder)
+
+
+SeriesFitter = Callable[..., Tuple[List[Any], List[Any], Optional[Dict[str, Any]]]]
+
+
+class FastChartBuilder:
+    """Plotly-compatible figure JSON without graph_objects validation"""
+
+    _template_json: str = ""
+    _template: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        colors: Dict[str, str],
+        color_scale: List[str],
+        fit_series: Optional[SeriesFitter] = None
+    ):
+        self.colors = colors
+        self.color_scale = color_scale
+        # ChartGenerator's large-series hook: (x, y, sort_by_x) -> (x, y, meta)
+        self.fit_series = fit_series or (lambda x, y, sort_by_x=False: (x, y, None))
+        self.builders: Dict[str, Callable[[List[Dict]], Dict[str, Any]]] = {
+            "line": self._line,
+            "bar": self._bar,
+            "pie": self._pie,
+            "scatter": self._scatter,
+            "heatmap": self._heatmap,
+        }
+
+        primary = colors["primary"]
+
+        # Precompiled static trace styling per chart type
+        self.trace_templates = {
+            "line": {
+                "hovertemplate": "<b>%{x}</b><br>Value: %{y}<extra></extra>",
+                "line": {"color": primary, "width": 3},
+                "marker": {"color": primary, "size": 10},
+                "mode": "lines+markers",
+                "name": "Trend",
+                "type": "scatter",
+            },
+            "bar": {
+                "hovertemplate": "<b>%{x}</b><br>Value: %{y}<extra></extra>",
+                "type": "bar",
+            },
+            "pie": {
+                "hovertemplate": "<b>%{label}</b><br>Value: %{value}<br>Percentage: %{percent}<extra></extra>",
+                "textinfo": "label+percent",
+                "textposition": "auto",
+                "type": "pie",
+            },
+            "scatter": {
+                "hovertemplate": "<b>X: %{x}</b><br>Y: %{y}<extra></extra>",
+                "marker": {"color": primary, "line": {"color": "white", "width": 2}, "opacity": 0.7, "size": 12},
+                "mode": "markers",
+                "type": "scatter",
+            },
+            "heatmap": {
+                "colorscale": BLUES_COLORSCALE,
+                "hovertemplate": "X: %{x}<br>Y: %{y}<br>Value: %{z}<extra></extra>",
+                "type": "heatmap",
+            },
+        }
+
+        # Precompiled static layout per chart type (title text filled per chart)
+        common = {"font": BASE_FONT, "plot_bgcolor": "white", "paper_bgcolor": "white"}
+        self.layout_templates = {
+            "line": {
+                "xaxis": {"title": {"text": ""}, **GRID_AXIS},
+                "yaxis": {"title": {"text": "Value"}, **GRID_AXIS},
+                "hovermode": "x unified",
+                **common,
+            },
+            "bar": {
+                "xaxis": {"title": {"text": ""}, "showgrid": False, "linecolor": "#9CA3AF"},
+                "yaxis": {"title": {"text": "Value"}, **GRID_AXIS},
+                "showlegend": False,
+                **common,
+            },
+            "pie": {
+                "legend": {"orientation": "v", "yanchor": "middle", "y": 0.5, "xanchor": "left", "x": 1.05},
+                "showlegend": True,
+                **common,
+            },
+            "scatter": {
+                "xaxis": {"title": {"text": "X Axis"}, **GRID_AXIS},
+                "yaxis": {"title": {"text": "Y Axis"}, **GRID_AXIS},
+                **common,
+            },
+            "heatmap": {
+                "xaxis": {"title": {"text": "X Axis"}},
+                "yaxis": {"title": {"text": "Y Axis"}},
+                **common,
+            },
+        }
+
+    @classmethod
+    def template_json(cls) -> str:
+        if not cls._template_json:
+            cls._template_json = _theme_template_json()
+        return cls._template_json
+
+    @classmethod
+    def template(cls) -> Dict[str, Any]:
+        """Parsed theme template; shared, so treat it as read-only"""
+        if not cls._template:
+            cls._template = json.loads(cls.template_json())
+        return cls._template
+
+    def build(self, chart_type: str, data: List[Dict], title: str) -> Dict[str, Any]:
+        """
+        Build a figure dict ({"data": [...], "layout": {...}}) without the theme
+
+        Args:
+            chart_type: Type of chart (line, bar, pie, scatter, heatmap)
+            data: Data for the chart
+            title: Chart title
+
+        Returns:
+            Figure dict; unknown chart types fall back to bar like ChartGenerator
+        """
+
+        kind = CHART_TYPES.get(chart_type, "bar")
+        trace = {**self.trace_templates[kind], **self.builders[kind](data)}
+        meta = trace.pop("meta", None)
+        layout = {"title": {"font": TITLE_FONT, "text": title}, **self.layout_templates[kind]}
+        if meta:
+            layout["meta"] = meta
+            if meta["webgl"]:
+                trace["type"] = "scattergl"
+        return {"data": [trace], "layout": layout}
+
+    def to_json(self, chart_type: str, data: List[Dict], title: str) -> str:
+        """Figure JSON string equivalent to go.Figure.to_json()"""
+        figure = self.build(chart_type, data, title)
+        layout = json.dumps(figure["layout"])
+        return (
+            f'{{"data": {json.dumps(figure["data"])}, '
+            f'"layout": {layout[:-1]}, "template": {self.template_json()}}}}}'
+        )
+
+    def _line(self, data: List[Dict]) -> Dict[str, Any]:
+        x_values, y_values, meta = self.fit_series(*line_series(data))
+        return {"meta": meta, "x": x_values, "y": y_values}
+
+    def _bar(self, data: List[Dict]) -> Dict[str, Any]:
+        categories, values = bar_series(data)
+        marker = {
+            "color": values,
+            "colorscale": [[0, self.colors["primary"]], [1, self.colors["secondary"]]],
+            "line": {"width": 0},
+        }
+        return {"marker": marker, "x": categories, "y": values}
+
+    def _pie(self, data: List[Dict]) -> Dict[str, Any]:
+        labels, values, colors = pie_series(data, self.color_scale)
+        marker = {"colors": colors, "line": {"color": "white", "width": 2}}
+        return {"labels": labels, "marker": marker, "values": values}
+
+    def _scatter(self, data: List[Dict]) -> Dict[str, Any]:
+        x_values, y_values, meta = self.fit_series(*scatter_series(data), sort_by_x=True)
+        return {"meta": meta, "x": x_values, "y": y_values}
+
+    def _heatmap(self, data: List[Dict]) -> Dict[str, Any]:
+        x_values, y_values, matrix = heatmap_grid(
+            data,
+            aggregation=settings.HEATMAP_AGGREGATION,
+            max_cells=settings.HEATMAP_MAX_CELLS
+        )
+        return {"x": x_values, "y": y_values, "z": matrix}
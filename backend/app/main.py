@@ -4,11 +4,15 @@ The most sophisticated research agent with automatic visualizations
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 import uvicorn
 
 from app.core.config import settings
+from app.core.http import get_http_client, close_http_client
+from app.core import metrics
+from app.core.rate_limit import rate_limit_stats
+from app.db.session import init_db, close_db
 
 # Import routes
 from app.api.routes import research
@@ -25,10 +29,35 @@ async def lifespan(app: FastAPI):
     print(f"  - Serper: {'YES' if settings.SERPER_API_KEY else 'NO'}")
     print(f"  - Tavily: {'YES' if settings.TAVILY_API_KEY else 'NO'}")
 
+    # Shared outbound connection pool for search providers
+    get_http_client()
+
+    # Warm chart render workers so the first request doesn't pay plotly start-up
+    await research.chart_pool.start()
+
+    # Static image export boots Chromium per worker; runs degraded without it
+    await research.chart_export_pool.start()
+
+    # Background job workers need the database; run degraded without it
+    try:
+        await init_db()
+        research.research_store.available = settings.RESEARCH_STORE_ENABLED
+        await research.job_queue.start()
+    except Exception as e:
+        print(f"WARNING: Database unavailable, background jobs and history disabled: {e}")
+
     yield
 
     # Shutdown
     print(f"Shutting down {settings.APP_NAME}")
+    await research.job_queue.stop()
+    await research.research_store.close()
+    await research.research_agent.close()
+    await research.result_cache.close()
+    await close_http_client()
+    await close_db()
+    research.chart_pool.shutdown()
+    await research.chart_export_pool.close()
 
 
 # Create FastAPI app
@@ -77,10 +106,103 @@ async def health_check():
     return {
         "status": "healthy" if all_keys_configured else "degraded",
         "api_keys": api_keys_status,
+        "cache": {name: cache.stats() for name, cache in app_caches().items()},
+        "rate_limits": rate_limit_stats(),
+        "llm_usage": research.research_agent.llm.usage,
+        "single_flight": {
+            "research": research.research_flight.stats(),
+            "llm": research.research_agent.llm.flight.stats(),
+            "search": research.research_agent.search_flight.stats(),
+        },
         "environment": settings.ENVIRONMENT,
     }
 
 
+def app_caches():
+    """Every cache the app serves from, by name"""
+    return {
+        "search": research.research_agent.search_cache,
+        "llm": research.research_agent.llm.cache,
+        "result": research.result_cache,
+        "chart_image": research.chart_export_pool.cache,
+    }
+
+
+# Read from their owners at scrape time rather than mirrored on every update
+metrics.Callback(
+    "cache_lookups_total",
+    "Cache lookups by cache and result (hit or miss)",
+    "counter",
+    ["cache", "result"],
+    lambda: {
+        (name, result): value
+        for name, cache in app_caches().items()
+        for result, value in (
+            ("hit", cache.counters["local_hits"] + cache.counters["shared_hits"]),
+            ("miss", cache.counters["misses"]),
+        )
+    },
+)
+metrics.Callback(
+    "cache_hit_ratio",
+    "Share of cache lookups served from the cache",
+    "gauge",
+    ["cache"],
+    lambda: {(name,): cache.stats()["hit_ratio"] for name, cache in app_caches().items()},
+)
+metrics.Callback(
+    "provider_requests_in_flight",
+    "Provider calls holding a rate limiter slot",
+    "gauge",
+    ["provider"],
+    lambda: {(name,): stats["in_flight"] for name, stats in rate_limit_stats().items()},
+)
+metrics.Callback(
+    "rate_limit_wait_seconds",
+    "Time provider calls spent queued for a rate limiter slot or token",
+    "counter",
+    ["provider"],
+    lambda: {(name,): stats["wait_total_s"] for name, stats in rate_limit_stats().items()},
+)
+metrics.Callback(
+    "rate_limit_waited_total",
+    "Provider calls that had to queue for a rate limiter slot or token",
+    "counter",
+    ["provider"],
+    lambda: {(name,): stats["waited"] for name, stats in rate_limit_stats().items()},
+)
+metrics.Callback(
+    "rate_limit_throttled_total",
+    "429 responses that paused a provider and cut its rate",
+    "counter",
+    ["provider"],
+    lambda: {(name,): stats["throttled"] for name, stats in rate_limit_stats().items()},
+)
+metrics.Callback(
+    "rate_limit_retries_total",
+    "Provider calls retried after a 429",
+    "counter",
+    ["provider"],
+    lambda: {(name,): stats["retries"] for name, stats in rate_limit_stats().items()},
+)
+metrics.Callback(
+    "llm_tokens_total",
+    "Tokens used by uncached LLM completions",
+    "counter",
+    ["kind"],
+    lambda: {
+        (kind,): research.research_agent.llm.usage[f"{kind}_tokens"]
+        for kind in ("prompt", "completion")
+    },
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Stage latency histograms, provider error/timeout counters, in-flight gauges, cache hit ratios and rate limiter waits"""
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # Test endpoint for quick research
 @app.post("/api/v1/research/quick")
 async def quick_research(query: str):
@@ -0,0 +1,42 @@
+"""
+Text utilities - Query normalization shared by caches and stores
+"""
+import re
+
+
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries match"""
+    return _WHITESPACE.sub(" ", query).strip().lower()
+
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "in", "into", "is", "it", "of", "on", "or", "over", "than", "that",
+    "the", "their", "this", "to", "vs", "versus", "was", "what", "when",
+    "where", "which", "who", "why", "with",
+})
+
+# Dropped from cache keys: articles and prepositions that don't change the
+# question. Interrogatives, comparison words and direction ("from", "to")
+# stay, as they do.
+KEY_STOP_WORDS = frozenset({
+    "a", "an", "the", "about", "at", "by", "for", "in", "of", "on", "with",
+})
+
+
+def canonical_query(query: str) -> str:
+    """
+    Canonical form of a research query, used as its cache and history key
+
+    Lowercases, strips punctuation and drops articles and prepositions,
+    keeping token order, so "AI market trends in 2024" and "ai market
+    trends 2024?" share a key while "why did X beat Y" and "how did Y beat
+    X" do not. Falls back to all tokens if nothing else is left.
+    """
+    tokens = _PUNCTUATION.sub(" ", query.lower()).split()
+    content = [token for token in tokens if token not in KEY_STOP_WORDS] or tokens
+    return " ".join(content)
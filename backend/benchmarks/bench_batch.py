@@ -0,0 +1,113 @@
+"""
+Benchmark: nightly batch as serialized single-query calls vs POST /batch
+
+Runs the app under uvicorn against stub LLM and search servers, with the
+result and LLM caches disabled so every pipeline does its full set of
+round trips. "serial" posts each query to /api/v1/research/ one after
+another, as the nightly script does; "batch" sends them all to /batch,
+which deduplicates and fans out with bounded concurrency.
+
+Usage (from backend/):
+    python benchmarks/bench_batch.py --queries 40 --duplicates 0.25 --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app, search_stub_app  # noqa: E402
+
+
+def make_queries(count: int, duplicate_share: float):
+    unique = max(1, round(count * (1 - duplicate_share)))
+    queries = [f"Batch topic {i} market trends 2024" for i in range(unique)]
+    # Duplicates differ only in case, spacing and punctuation
+    queries += [f"  batch TOPIC {i % unique}, market trends 2024?" for i in range(count - unique)]
+    return queries
+
+
+async def run_serial(base_url: str, queries) -> float:
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        start = time.perf_counter()
+        for query in queries:
+            response = await client.post("/api/v1/research/", json={"query": query})
+            response.raise_for_status()
+        return time.perf_counter() - start
+
+
+async def run_batch(base_url: str, queries, concurrency: int):
+    import httpx
+
+    first_result = None
+    done = {}
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        start = time.perf_counter()
+        payload = {"queries": queries, "concurrency": concurrency}
+        async with client.stream("POST", "/api/v1/research/batch", json=payload) as response:
+            event = None
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    if event == "result" and first_result is None:
+                        first_result = time.perf_counter() - start
+                    elif event == "done":
+                        done = json.loads(line[len("data: "):])
+        return time.perf_counter() - start, first_result, done
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=40)
+    parser.add_argument("--duplicates", type=float, default=0.25, help="Share of duplicate queries")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--search-latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    queries = make_queries(args.queries, args.duplicates)
+
+    with StubServer(llm_stub_app(args.llm_latency)) as llm, \
+            StubServer(search_stub_app(args.search_latency)) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "SERPER_API_KEY": "stub",
+            "TAVILY_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "TAVILY_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "LLM_CACHE_ENABLED": "false",
+            "RESULT_CACHE_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        from app.main import app
+        from app.api.routes import research
+
+        asyncio.run(research.chart_pool.start())
+        with StubServer(app, lifespan="off") as server:
+            base_url = f"http://127.0.0.1:{server.port}"
+            pipeline = 3 * args.llm_latency + args.search_latency
+            print(f"{len(queries)} queries ({args.duplicates:.0%} near-duplicates), "
+                  f"stub pipeline ~{pipeline:.2f}s, batch concurrency {args.concurrency}")
+
+            serial = asyncio.run(run_serial(base_url, queries))
+            batch, first, done = asyncio.run(run_batch(base_url, queries, args.concurrency))
+
+        research.chart_pool.shutdown()
+
+    print(f"  serial  {serial:7.2f}s  {len(queries) / serial:6.2f} queries/s")
+    print(f"  batch   {batch:7.2f}s  {len(queries) / batch:6.2f} queries/s  "
+          f"(first result after {first:.2f}s)")
+    print(f"  batch report: {done}")
+
+
+if __name__ == "__main__":
+    main()
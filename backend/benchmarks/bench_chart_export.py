@@ -0,0 +1,104 @@
+"""
+Benchmark: static chart export, cold renderer per image vs warm pool vs cache
+
+"cold" starts a fresh Python process per image, as a script or digest job
+calling plotly's to_image would, paying kaleido's Chromium boot every time.
+"warm" sends images to ChartExportPool workers that keep Chromium running;
+"cached" repeats the same exports and is served from the image cache.
+
+Usage (from backend/):
+    python benchmarks/bench_chart_export.py --images 8 --format png
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engines.chart_export import ChartExportPool  # noqa: E402
+from app.engines.chart_generator import ChartGenerator  # noqa: E402
+
+COLD_SCRIPT = """
+import json, sys
+import plotly.io as pio
+figure = json.loads(sys.stdin.read())
+sys.stdout.buffer.write(pio.to_image(figure, format=sys.argv[1], width=800, height=500))
+"""
+
+
+def make_figures(count: int):
+    generator = ChartGenerator()
+    return [
+        generator.generate_figure(
+            "line",
+            [{"year": str(2010 + j), "value": (i + 1) * j} for j in range(12)],
+            f"Export benchmark {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def cold_export(figure, image_format: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPT, image_format],
+        input=json.dumps(figure).encode(),
+        capture_output=True,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+async def pool_exports(pool: ChartExportPool, figures, image_format: str):
+    latencies, hits, sizes = [], 0, []
+    for figure in figures:
+        start = time.perf_counter()
+        image, cached = await pool.export(figure, image_format)
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += cached
+        sizes.append(len(image))
+    return latencies, hits, sizes
+
+
+async def run_pool(figures, image_format: str, workers: int):
+    pool = ChartExportPool(workers=workers)
+    start = time.perf_counter()
+    await pool.start()
+    startup_ms = (time.perf_counter() - start) * 1000
+    try:
+        warm = await pool_exports(pool, figures, image_format)
+        cached = await pool_exports(pool, figures, image_format)
+        return startup_ms, warm, cached
+    finally:
+        await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=8)
+    parser.add_argument("--format", default="png", choices=["png", "svg"])
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    figures = make_figures(args.images)
+
+    cold = [cold_export(figure, args.format) for figure in figures]
+    startup_ms, (warm, _, sizes), (cached, hits, _) = asyncio.run(
+        run_pool(figures, args.format, args.workers)
+    )
+
+    print(f"{args.images} {args.format} exports at 800x500 (mean image {statistics.mean(sizes) / 1024:.1f} KB)")
+    print(f"  pool start-up (one-off): {startup_ms:.0f} ms")
+    print(f"  {'mode':<7} {'p50 ms':>8} {'mean ms':>8}")
+    for mode, latencies in (("cold", cold), ("warm", warm), ("cached", cached)):
+        print(f"  {mode:<7} {statistics.median(latencies):8.1f} {statistics.mean(latencies):8.1f}")
+    print(f"  cache hits on repeat: {hits}/{args.images}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark: per-chart render time, go.Figure path vs the fast JSON path
+
+Before timing, checks that both paths produce identical figure JSON for a
+set of fixtures covering every chart type, the type aliases, missing keys
+and custom colors, and for long series in large-series mode. Exits non-zero
+on any parity mismatch. Also reports payload size and render time for long
+series with large-series mode (LTTB + scattergl) off and on.
+
+Usage (from backend/):
+    python benchmarks/bench_chart_render.py --iterations 200
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engines.chart_generator import ChartGenerator  # noqa: E402
+
+
+TREND = [{"year": str(2015 + i), "value": 20 + i * 7.5} for i in range(10)]
+COMPARISON = [{"category": f"Category {c}", "value": v} for c, v in zip("ABCDEF", [45, 28, 18, 15, 9, 4])]
+DISTRIBUTION = [
+    {"name": "Segment 1", "value": 35, "color": "#3B82F6"},
+    {"name": "Segment 2", "value": 28},
+    {"label": "Segment 3", "value": 22},
+    {"value": 15},
+]
+SCATTER = [{"x": i * 0.5, "y": (i * 37) % 11} for i in range(50)]
+HEATMAP = [{"x": x, "y": y, "value": x * y} for x in range(8) for y in range(6)]
+
+PARITY_FIXTURES = [
+    ("line", TREND),
+    ("line_chart", [{"date": "2024-01", "y": 3}, {"x": 7}, {}]),
+    ("bar", COMPARISON),
+    ("bar_chart", [{"country": "France", "funding": 12.5}, {"name": "Spain"}, {}]),
+    ("pie", DISTRIBUTION),
+    ("pie_chart", [{"name": "Only", "value": 1}]),
+    ("scatter", SCATTER),
+    ("scatter_plot", [{"value": 3}, {"x": "a", "y": 1}]),
+    ("heatmap", HEATMAP),
+    ("unknown", COMPARISON),
+    ("line", []),
+]
+
+LONG_TREND = [
+    {"date": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}", "value": math.sin(i / 500) * 100 + (i % 97)}
+    for i in range(3600)
+]
+LONG_SCATTER = [{"x": (i * 7919) % 50000 / 10, "y": math.cos(i / 300) * 50} for i in range(50000)]
+
+LARGE_PARITY_FIXTURES = [
+    ("line", TREND),
+    ("line", LONG_TREND),
+    ("line", [{"value": i % 13} for i in range(5000)]),
+    ("line", [{"x": f"label {i}", "y": "n/a"} for i in range(3000)]),
+    ("scatter", SCATTER),
+    ("scatter", LONG_SCATTER),
+]
+
+LARGE_BENCH_FIXTURES = [
+    ("line", LONG_TREND),
+    ("scatter", LONG_SCATTER),
+]
+
+BENCH_FIXTURES = [
+    ("line", TREND),
+    ("bar", COMPARISON),
+    ("pie", DISTRIBUTION),
+    ("scatter", SCATTER),
+    ("heatmap", HEATMAP),
+]
+
+
+def check_parity(legacy: ChartGenerator, fast: ChartGenerator, fixtures) -> int:
+    failures = 0
+    for chart_type, data in fixtures:
+        title = f"Parity – {chart_type} “quoted” title"
+        expected = json.loads(legacy.generate_chart(chart_type, data, title))
+        actual = json.loads(fast.generate_chart(chart_type, data, title))
+        status = "ok" if expected == actual else "MISMATCH"
+        if expected != actual:
+            failures += 1
+        print(f"  parity {chart_type:<13} {status}")
+    return failures
+
+
+def time_render(generator: ChartGenerator, chart_type: str, data, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        generator.generate_chart(chart_type, data, "Benchmark")
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    legacy = ChartGenerator(fast_path=False)
+    fast = ChartGenerator(fast_path=True)
+
+    print("Parity (go.Figure vs fast path):")
+    failures = check_parity(legacy, fast, PARITY_FIXTURES)
+
+    print("\nParity in large-series mode:")
+    failures += check_parity(
+        ChartGenerator(fast_path=False, large_series=True),
+        ChartGenerator(fast_path=True, large_series=True),
+        LARGE_PARITY_FIXTURES,
+    )
+
+    print(f"\nPer-chart render time ({args.iterations} iterations):")
+    print(f"  {'chart':<8} {'go.Figure us':>13} {'fast us':>9} {'speedup':>8}")
+    for chart_type, data in BENCH_FIXTURES:
+        before = time_render(legacy, chart_type, data, args.iterations)
+        after = time_render(fast, chart_type, data, args.iterations)
+        print(f"  {chart_type:<8} {before:13.1f} {after:9.1f} {before / after:7.1f}x")
+
+    full = ChartGenerator(fast_path=True, large_series=False)
+    large = ChartGenerator(fast_path=True, large_series=True)
+    iterations = max(1, args.iterations // 20)
+    print(f"\nLong series, fast path ({iterations} iterations):")
+    print(f"  {'chart':<8} {'points':>7} {'rendered':>9} {'full KB':>8} {'large KB':>9} "
+          f"{'full ms':>8} {'large ms':>9} {'trace':>10}")
+    for chart_type, data in LARGE_BENCH_FIXTURES:
+        full_json = full.generate_chart(chart_type, data, "Benchmark")
+        large_json = large.generate_chart(chart_type, data, "Benchmark")
+        meta = json.loads(large_json)["layout"]["meta"]
+        full_ms = time_render(full, chart_type, data, iterations) / 1000
+        large_ms = time_render(large, chart_type, data, iterations) / 1000
+        print(f"  {chart_type:<8} {meta['original_points']:7d} {meta['rendered_points']:9d} "
+              f"{len(full_json) / 1024:8.1f} {len(large_json) / 1024:9.1f} "
+              f"{full_ms:8.2f} {large_ms:9.2f} {json.loads(large_json)['data'][0]['type']:>10}")
+
+    if failures:
+        print(f"\n{failures} parity mismatches")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Benchmark: extraction prompt size and latency with and without context compression
+
+Builds a fixture corpus of search results per query - short Serper
+snippets plus long Tavily page extracts padded with navigation, cookie
+and newsletter boilerplate, and syndicated copies of the same facts -
+then compares the legacy context (every snippet in full) with the
+BM25-ranked, token-budgeted one. Reports estimated prompt tokens, how
+many of the corpus' figures survive, compression CPU time and the
+extraction call latency against a stub LLM whose latency grows with
+prompt size.
+
+Usage (from backend/):
+    python benchmarks/bench_context.py --budget 1200 --iterations 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app  # noqa: E402
+
+
+BOILERPLATE = [
+    "We use cookies to improve your experience on our site.",
+    "By continuing to browse you agree to our privacy policy and terms of service.",
+    "Subscribe to our newsletter to get the latest stories delivered to your inbox.",
+    "Share this article on Twitter, LinkedIn or Facebook.",
+    "Home > News > Technology > Analysis",
+    "Sign in or create an account to save articles for later reading.",
+    "Related articles you might also enjoy are listed below.",
+    "Advertisement - continue reading below.",
+    "Our editorial team is independent and reader supported.",
+    "Read more of our coverage in the archive section.",
+]
+
+TOPICS = {
+    "AI startup funding trends in Europe 2024": {
+        "analysis": {"data_needed": ["funding amount", "deal count", "country"],
+                     "key_metrics": ["total funding", "growth rate"]},
+        "facts": [
+            "European AI startups raised $13.7B in 2024, up 27% from 2023.",
+            "The UK led AI funding with $4.5B across 310 deals.",
+            "France followed with $3.2B, driven by Mistral's $640M round.",
+            "Germany's AI startups raised $2.1B, a 19% increase year over year.",
+            "Deal count across Europe fell 8% to 1,540 while average round size grew.",
+            "Generative AI accounted for 41% of all European AI funding in 2024.",
+            "Seed-stage AI funding in Europe reached $1.3B in 2024.",
+        ],
+        "context": [
+            "Investors continued to favour AI companies over other sectors in Europe.",
+            "Analysts expect funding to stay concentrated in a handful of large rounds.",
+            "Founders say access to compute remains the main constraint on growth.",
+            "Several governments announced programmes to support AI startups.",
+        ],
+    },
+    "Global electric vehicle sales growth": {
+        "analysis": {"data_needed": ["sales volume", "market share", "region"],
+                     "key_metrics": ["EV sales", "growth rate"]},
+        "facts": [
+            "Global electric vehicle sales reached 17.1 million units in 2024, up 25%.",
+            "China accounted for 11.3 million EV sales, about 66% of the global total.",
+            "European EV sales were flat at 3.2 million units in 2024.",
+            "US electric vehicle sales grew 9% to 1.6 million units.",
+            "EVs made up 22% of new car sales worldwide in 2024, up from 18%.",
+            "Plug-in hybrid sales grew 46% globally while battery EV sales grew 17%.",
+            "Average battery pack prices fell 20% to $115 per kWh.",
+        ],
+        "context": [
+            "Electric vehicle adoption varies widely between regions and price segments.",
+            "Charging infrastructure is expanding but unevenly across markets.",
+            "Carmakers are shifting strategies as subsidies change in several countries.",
+            "Consumers cite range and price as the biggest purchase considerations.",
+        ],
+    },
+    "Cloud computing market share by provider": {
+        "analysis": {"data_needed": ["market share", "revenue", "provider"],
+                     "key_metrics": ["market share"]},
+        "facts": [
+            "AWS held 31% of the cloud infrastructure market in Q4 2024.",
+            "Microsoft Azure's market share rose to 25% in Q4 2024.",
+            "Google Cloud reached 11% market share with revenue of $12B in the quarter.",
+            "Cloud infrastructure spending grew 22% to $91B in Q4 2024.",
+            "Alibaba Cloud held 4% of the global market.",
+            "The top three providers together controlled 67% of the cloud market.",
+        ],
+        "context": [
+            "Cloud providers are investing heavily in AI infrastructure and data centres.",
+            "Enterprises increasingly adopt multi-cloud strategies to avoid lock-in.",
+            "Pricing competition among providers has intensified over the last year.",
+            "Regional providers compete on data sovereignty requirements.",
+        ],
+    },
+}
+
+
+def fixture_corpus(results_per_query: int = 10):
+    """[(query, query_analysis, results)] with Serper-style and Tavily-style results"""
+    corpus = []
+    for query, topic in TOPICS.items():
+        rng = random.Random(query)
+        results = []
+        for i in range(results_per_query):
+            facts = rng.sample(topic["facts"], k=min(len(topic["facts"]), rng.randint(2, 4)))
+            context = rng.sample(topic["context"], k=2)
+            if i % 2 == 0:
+                # Serper: a short snippet
+                results.append({
+                    "title": f"{query} - report {i + 1}",
+                    "url": f"https://news{i}.example.com/{i}",
+                    "snippet": " ".join(facts[:2] + context[:1]),
+                })
+            else:
+                # Tavily: a long page extract wrapped in boilerplate
+                body = rng.sample(BOILERPLATE, k=5) + facts + context + rng.sample(BOILERPLATE, k=4)
+                results.append({
+                    "title": f"{query} - analysis {i + 1}",
+                    "url": f"https://blog{i}.example.com/{i}",
+                    "content": " ".join(body),
+                })
+        corpus.append((query, topic["analysis"], results))
+    return corpus
+
+
+_FIGURE = re.compile(r"\$?\d[\d,.]*%?")
+
+
+def figures(text: str) -> set:
+    return set(_FIGURE.findall(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=int, default=1200)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--results", type=int, default=10)
+    parser.add_argument("--llm-latency", type=float, default=0.1)
+    parser.add_argument("--per-token-ms", type=float, default=0.4)
+    args = parser.parse_args()
+
+    llm_app = llm_stub_app(args.llm_latency, per_token_latency=args.per_token_ms / 1000)
+    with StubServer(llm_app) as llm:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "CACHE_REDIS_ENABLED": "false",
+            "LLM_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+            "SINGLE_FLIGHT_ENABLED": "false",
+            "CONTEXT_TOKEN_BUDGET": str(args.budget),
+        })
+
+        from app.agents.context_builder import build_context, estimate_tokens, legacy_context, result_text
+        from app.agents.research_agent import ResearchAgent
+        from app.core.config import settings
+
+        corpus = fixture_corpus(args.results)
+
+        print(f"Fixture corpus: {len(corpus)} queries x {args.results} results, budget {args.budget} tokens")
+        print(f"  {'query':<42} {'legacy tok':>10} {'ctx tok':>8} {'reduction':>9} "
+              f"{'figures kept':>12} {'dupes':>5} {'build ms':>8}")
+        for query, analysis, results in corpus:
+            legacy = legacy_context(results)
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                context, stats = build_context(query, results, analysis, args.budget)
+                timings.append((time.perf_counter() - start) * 1000)
+            corpus_figures = figures(" ".join(result_text(r) for r in results))
+            kept = len(figures(context) & corpus_figures)
+            print(f"  {query[:42]:<42} {estimate_tokens(legacy):10d} {stats['compressed_tokens']:8d} "
+                  f"{stats['reduction']:9.1%} {kept:5d}/{len(corpus_figures):<6d} "
+                  f"{stats['duplicates']:5d} {statistics.median(timings):8.2f}")
+
+        async def extraction_latency():
+            agent = ResearchAgent()
+            rows = {}
+            for enabled in (False, True):
+                settings.CONTEXT_COMPRESSION_ENABLED = enabled
+                samples = []
+                for _ in range(args.iterations):
+                    for query, analysis, results in corpus:
+                        start = time.perf_counter()
+                        await agent._extract_structured_data(query, {"results": results}, analysis)
+                        samples.append((time.perf_counter() - start) * 1000)
+                rows["compressed" if enabled else "legacy"] = samples
+            await agent.close()
+            return rows
+
+        rows = asyncio.run(extraction_latency())
+        print(f"\nExtraction call latency (stub LLM {args.llm_latency * 1000:.0f} ms "
+              f"+ {args.per_token_ms} ms per prompt token)")
+        print(f"  {'context':<11} {'p50 ms':>8} {'mean ms':>8}")
+        for mode, samples in rows.items():
+            print(f"  {mode:<11} {statistics.median(samples):8.1f} {statistics.mean(samples):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
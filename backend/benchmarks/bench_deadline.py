@@ -0,0 +1,106 @@
+"""
+Benchmark: research latency tail with and without a request deadline
+
+The stub LLM answers most calls quickly but a share of them very slowly
+(a heavy tail). Slow calls are picked by prompt, so both deadlines face
+the same ones. Without an effective deadline a request waits out every
+slow call; with one, over-budget stages are cut and the request returns
+"partial" within its SLO. Reports latency percentiles, the slow calls
+made, the partial rate and which stages were cut.
+
+Usage (from backend/):
+    python benchmarks/bench_deadline.py --requests 40 --deadline 2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app, search_stub_app  # noqa: E402
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_requests(app, count: int, concurrency: int, deadline: float):
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, statuses, cut = [], Counter(), Counter()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def one(i: int):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/api/v1/research/", json={
+                    "query": f"deadline benchmark query {i}",
+                    "deadline": deadline,
+                })
+                latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+            body = response.json()
+            statuses[body["status"]] += 1
+            cut.update(body["metadata"].get("cut_stages", []))
+
+        await asyncio.gather(*[one(i) for i in range(count)])
+    return latencies, statuses, cut
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--deadline", type=float, default=2.0)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--slow-share", type=float, default=0.1)
+    parser.add_argument("--slow-latency", type=float, default=6.0)
+    args = parser.parse_args()
+
+    llm_app = llm_stub_app(args.llm_latency, slow_share=args.slow_share, slow_latency=args.slow_latency)
+    with StubServer(llm_app) as llm, StubServer(search_stub_app(0.1)) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "SERPER_API_KEY": "stub",
+            "TAVILY_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "TAVILY_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "CACHE_REDIS_ENABLED": "false",
+            "LLM_CACHE_ENABLED": "false",
+            "RESULT_CACHE_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        from app.main import app
+        from app.api.routes import research
+
+        asyncio.run(research.chart_pool.start())
+
+        print(f"{args.requests} requests (concurrency {args.concurrency}); LLM {args.llm_latency}s, "
+              f"{args.slow_share:.0%} of calls {args.slow_latency}s")
+        print(f"  {'deadline':<9} {'p50 s':>6} {'p95 s':>6} {'p99 s':>6} {'max s':>6} {'slow':>5}  "
+              f"statuses / cut stages")
+
+        async def compare():
+            for deadline in (60.0, args.deadline):
+                llm_app.state.slow_calls = 0
+                latencies, statuses, cut = await run_requests(app, args.requests, args.concurrency, deadline)
+                print(f"  {deadline:<9.1f} {percentile(latencies, 50):6.2f} {percentile(latencies, 95):6.2f} "
+                      f"{percentile(latencies, 99):6.2f} {max(latencies):6.2f} {llm_app.state.slow_calls:5d}  "
+                      f"{dict(statuses)} {dict(cut)}")
+
+        asyncio.run(compare())
+        research.chart_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: heatmap pivot scaling, list.index() loop vs the NumPy pivot
+
+Points lie on a sqrt(n) x sqrt(n) grid with duplicates. The legacy
+quadratic pivot is only timed up to --legacy-limit points; beyond that it
+takes minutes. Results are checked against the legacy pivot wherever both
+run (aggregation "last", no binning).
+
+Usage (from backend/):
+    python benchmarks/bench_heatmap.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engines.chart_data import heatmap_grid  # noqa: E402
+
+
+def legacy_grid(data):
+    """The pre-NumPy implementation from ChartGenerator._create_heatmap"""
+    x_values = sorted(set(item.get("x", 0) for item in data))
+    y_values = sorted(set(item.get("y", 0) for item in data))
+    matrix = [[0] * len(x_values) for _ in range(len(y_values))]
+    for item in data:
+        x_idx = x_values.index(item.get("x", 0))
+        y_idx = y_values.index(item.get("y", 0))
+        matrix[y_idx][x_idx] = item.get("value", 0)
+    return x_values, y_values, matrix
+
+
+def make_points(count: int):
+    rng = random.Random(count)
+    side = max(1, int(count ** 0.5))
+    return [
+        {"x": rng.randrange(side), "y": rng.randrange(side), "value": rng.randrange(100)}
+        for _ in range(count)
+    ]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--legacy-limit", type=int, default=100000)
+    parser.add_argument("--max-cells", type=int, default=40000)
+    args = parser.parse_args()
+
+    print(f"  {'points':>9} {'legacy ms':>10} {'numpy ms':>9} {'binned ms':>10} "
+          f"{'mean ms':>8} {'grid':>11} {'binned grid':>12}")
+    for count in args.sizes:
+        data = make_points(count)
+
+        legacy_ms = float("nan")
+        exact, numpy_ms = timed(heatmap_grid, data)
+        if count <= args.legacy_limit:
+            expected, legacy_ms = timed(legacy_grid, data)
+            if expected != exact:
+                print(f"  MISMATCH against legacy pivot at {count} points")
+                sys.exit(1)
+
+        binned, binned_ms = timed(heatmap_grid, data, max_cells=args.max_cells)
+        _, mean_ms = timed(heatmap_grid, data, aggregation="mean", max_cells=args.max_cells)
+
+        grid = f"{len(exact[0])}x{len(exact[1])}"
+        binned_grid = f"{len(binned[0])}x{len(binned[1])}"
+        print(f"  {count:9d} {legacy_ms:10.1f} {numpy_ms:9.1f} {binned_ms:10.1f} "
+              f"{mean_ms:8.1f} {grid:>11} {binned_grid:>12}")
+
+
+if __name__ == "__main__":
+    main()
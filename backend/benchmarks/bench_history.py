@@ -0,0 +1,151 @@
+"""
+Benchmark: history paging, OFFSET vs keyset, at increasing depth
+
+Seeds a research_runs table (fresh SQLite file by default; pass
+--database-url for Postgres, where existing runs are kept and counted)
+with runs spread over several months, then times fetching one page at
+increasing depths both ways. OFFSET reads and discards every row before
+the page; the keyset query used by ResearchStore.history seeks straight
+to the cursor through the (created_at, id) index. Also prints the
+database's plan for the keyset query.
+
+Usage (from backend/):
+    python benchmarks/bench_history.py --rows 200000 --page-size 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def seed(rows: int):
+    from sqlalchemy import func, insert, select
+    from app.db.models import ResearchRun
+    from app.db.session import get_sessionmaker
+
+    async with get_sessionmaker()() as session:
+        existing = (await session.execute(select(func.count()).select_from(ResearchRun))).scalar()
+        rng = random.Random(0)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for offset in range(existing, rows, 5000):
+            await session.execute(insert(ResearchRun), [
+                {
+                    "query": f"research topic {rng.randrange(5000)}",
+                    "query_key": f"research topic {i % 5000}",
+                    "mode": "thorough",
+                    "status": "completed",
+                    "summary": "Summary of findings. " * 10,
+                    "structured_data": {"trend_data": [{"year": "2024", "value": i}]},
+                    "charts": [{"type": "bar", "data": {"data": [{"y": list(range(20))}]}}],
+                    "insights": {"summary": "Summary of findings. " * 10},
+                    "sources": [{"title": f"Source {j}", "url": f"https://example.com/{j}"} for j in range(5)],
+                    "timings": {},
+                    "created_at": start + timedelta(seconds=i * 60 + rng.random()),
+                }
+                for i in range(offset, min(rows, offset + 5000))
+            ])
+        await session.commit()
+        return (await session.execute(select(func.count()).select_from(ResearchRun))).scalar()
+
+
+async def offset_page(page: int, page_size: int):
+    from sqlalchemy import select
+    from sqlalchemy.orm import load_only
+    from app.db.models import ResearchRun
+    from app.db.research import LISTING_COLUMNS
+    from app.db.session import get_sessionmaker
+
+    statement = (
+        select(ResearchRun)
+        .options(load_only(*LISTING_COLUMNS))
+        .order_by(ResearchRun.created_at.desc(), ResearchRun.id.desc())
+        .offset(page * page_size)
+        .limit(page_size)
+    )
+    async with get_sessionmaker()() as session:
+        return list((await session.execute(statement)).scalars())
+
+
+async def keyset_plan(store, page_size: int):
+    from sqlalchemy import text
+    from app.db.session import get_engine
+
+    _, cursor = await store.history(page_size)
+    if not get_engine().url.get_backend_name() == "sqlite":
+        return []
+    async with get_engine().connect() as conn:
+        rows = await conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM research_runs "
+            "WHERE (created_at, id) < ('2026-03-01', 1) ORDER BY created_at DESC, id DESC LIMIT 21"
+        ))
+        return [row[-1] for row in rows]
+
+
+def timed_ms(samples):
+    return statistics.median(samples) * 1000
+
+
+async def run(args):
+    from app.db.research import ResearchStore, encode_cursor
+    from app.db.session import close_db, init_db
+
+    await init_db()
+    rows = await seed(args.rows)
+    store = ResearchStore()
+    print(f"{rows} runs; page size {args.page_size}; median of {args.repeat}")
+
+    for step in await keyset_plan(store, args.page_size):
+        print(f"  plan: {step}")
+
+    print(f"  {'page':>7} {'offset ms':>10} {'keyset ms':>10}")
+    for page in args.pages:
+        if page * args.page_size >= rows:
+            continue
+        # Cursor for the same page: the run just before it in history order
+        previous = await offset_page(page * args.page_size - 1, 1) if page else []
+        cursor = encode_cursor(previous[0]) if previous else None
+
+        offset_times, keyset_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            by_offset = await offset_page(page, args.page_size)
+            offset_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            by_keyset, _ = await store.history(args.page_size, cursor)
+            keyset_times.append(time.perf_counter() - start)
+        if [run.id for run in by_offset] != [item["run_id"] for item in by_keyset]:
+            print(f"  MISMATCH at page {page}")
+            sys.exit(1)
+        print(f"  {page:7d} {timed_ms(offset_times):10.2f} {timed_ms(keyset_times):10.2f}")
+
+    await close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--pages", type=int, nargs="+", default=[0, 10, 100, 1000, 5000, 9999])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        path = f"{tempfile.gettempdir()}/bench_history.db"
+        if os.path.exists(path):
+            os.remove(path)
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
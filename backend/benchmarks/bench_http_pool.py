@@ -0,0 +1,88 @@
+"""
+Benchmark: per-request AsyncClient vs the shared pooled client over TLS
+
+Runs Serper-style searches against a local HTTPS stub. The "fresh" mode
+reproduces the old behaviour (new client, new TCP + TLS handshake per
+research request); "pooled" reuses the application-scoped client.
+
+Usage (from backend/):
+    python benchmarks/bench_http_pool.py --requests 200 --concurrency 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, search_stub_app, self_signed_cert  # noqa: E402
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_mode(mode: str, agent, certfile: str, count: int, concurrency: int):
+    from app.core.http import create_http_client
+
+    semaphore = asyncio.Semaphore(concurrency)
+    shared = create_http_client(verify=certfile) if mode == "pooled" else None
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            if shared is not None:
+                await agent._search_serper(shared, f"query {i}")
+            else:
+                async with create_http_client(verify=certfile) as client:
+                    await agent._search_serper(client, f"query {i}")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*[one(i) for i in range(count)])
+    if shared is not None:
+        await shared.aclose()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub server latency (s)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        certfile, keyfile = self_signed_cert(tmp)
+        server = StubServer(
+            search_stub_app(args.latency),
+            ssl_certfile=certfile,
+            ssl_keyfile=keyfile,
+        )
+        with server:
+            os.environ["SERPER_API_URL"] = f"https://127.0.0.1:{server.port}/search"
+            os.environ["RATE_LIMIT_ENABLED"] = "false"
+            # Repeated queries would otherwise be cache hits that never reach the stub
+            os.environ["SEARCH_CACHE_ENABLED"] = "false"
+            os.environ["CACHE_REDIS_ENABLED"] = "false"
+
+            from app.agents.research_agent import ResearchAgent
+            agent = ResearchAgent()
+
+            print(f"{args.requests} searches, concurrency {args.concurrency}")
+            print(f"  {'mode':<7} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+            for mode in ("fresh", "pooled"):
+                latencies = asyncio.run(
+                    run_mode(mode, agent, certfile, args.requests, args.concurrency)
+                )
+                print(f"  {mode:<7} {percentile(latencies, 50):8.2f} "
+                      f"{percentile(latencies, 99):8.2f} {statistics.mean(latencies):8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Benchmark: when the insight panel gets its first text, buffered vs streamed insights
+
+Runs /research/stream, served by uvicorn (an in-process ASGI transport
+would buffer the whole event stream), against stub LLM and search servers. The stub
+decodes completions at a fixed time per token, and the insights answer is
+a realistic three-paragraph summary with five key insights. Buffered
+insights reach the client only with the insights event after the whole
+completion. Streamed insights send summary text (insights_delta) from the
+first tokens and each key insight (insights_item) as it closes. Reports,
+from request start, the first summary text, first key insight, full
+insights event and done, per pipeline mode. Then checks that real
+insights still arrive when the stub rejects streamed requests or drops a
+stream halfway, through the unstreamed retry.
+
+Usage (from backend/):
+    python benchmarks/bench_insights_stream.py --requests 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app, search_stub_app  # noqa: E402
+
+
+SUMMARY = (
+    "Global electric vehicle sales reached 17.1 million units in 2024, up 25% on the previous year, "
+    "with China accounting for roughly two thirds of the total. Growth in Europe stalled as subsidies "
+    "were withdrawn in several markets, while the US grew more slowly than forecast.\n\n"
+    "Plug-in hybrids outpaced battery electric vehicles for the first time since 2020, reflecting "
+    "buyers' concerns about charging access and range. Falling battery prices narrowed the price gap "
+    "with combustion cars, particularly in the compact segment.\n\n"
+    "Looking ahead, analysts expect another year of double-digit growth, led by affordable models "
+    "from Chinese manufacturers and an expanding fast-charging network."
+)
+INSIGHTS = {
+    "summary": SUMMARY,
+    "key_insights": [
+        "EV sales grew 25% to 17.1 million units in 2024",
+        "China's 11.3 million sales made up about 66% of the global market",
+        "European EV sales were flat at 3.2 million units after subsidy cuts",
+        "Plug-in hybrid sales grew 46% versus 17% for battery EVs",
+        "Battery pack prices fell 20% to $115 per kWh",
+    ],
+    "recommendations": [
+        "Track subsidy changes in Europe as a leading indicator",
+        "Watch affordable Chinese models entering export markets",
+    ],
+}
+COMBINED_KEYS = ("intent", "data_needed", "visualizations", "key_metrics")
+
+
+async def run_requests(base_url: str, mode: str, count: int):
+    import httpx
+
+    marks = {"first text": [], "first item": [], "insights": [], "done": []}
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        for i in range(count):
+            seen = {}
+            start = time.perf_counter()
+            async with client.stream("POST", "/api/v1/research/stream", json={
+                "query": f"electric vehicle sales {2000 + i}",
+                "mode": mode,
+            }) as response:
+                event = None
+                async for line in response.aiter_lines():
+                    if line.startswith("event: "):
+                        event = line[len("event: "):]
+                    elif line.startswith("data: "):
+                        name = {
+                            "insights_delta": "first text",
+                            "insights_item": "first item",
+                            "insights": "insights",
+                            "done": "done",
+                        }.get(event)
+                        if event == "insights_item" and json.loads(line[6:])["field"] != "key_insights":
+                            name = None
+                        if name and name not in seen:
+                            seen[name] = time.perf_counter() - start
+            # Without streaming, the first text and items arrive with the insights event
+            for name in marks:
+                marks[name].append(seen.get(name, seen["insights"]))
+    return {name: statistics.median(values) for name, values in marks.items()}
+
+
+async def check_fallback(base_url: str, llm_app) -> int:
+    """Streamed insights survive a provider that rejects or drops streams"""
+    import httpx
+
+    failures = 0
+
+    async def insights_events(query: str):
+        events = {}
+        async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+            async with client.stream("POST", "/api/v1/research/stream", json={"query": query}) as response:
+                event = None
+                async for line in response.aiter_lines():
+                    if line.startswith("event: "):
+                        event = line[len("event: "):]
+                    elif line.startswith("data: "):
+                        events.setdefault(event, []).append(json.loads(line[6:]))
+        return events
+
+    def report(name, ok):
+        nonlocal failures
+        failures += not ok
+        print(f"  {name:<52} {'ok' if ok else 'FAIL'}")
+
+    for error in ("drop", "reject"):
+        llm_app.state.stream_error = error
+        llm_app.state.stream_calls = 0
+        events = await insights_events(f"electric vehicle sales fallback {error}")
+        insights = events.get("insights", [{}])[0]
+        text = "".join(e["text"] for e in events.get("insights_delta", []) if e["field"] == "summary")
+        report(f"{error}: insights event has the real summary", insights.get("summary") == SUMMARY)
+        report(f"{error}: summary replayed as insights_delta", text.endswith(SUMMARY))
+
+    llm_app.state.stream_calls = 0
+    events = await insights_events("electric vehicle sales fallback again")
+    report("reject: model no longer streamed afterwards", llm_app.state.stream_calls == 0
+           and events.get("insights", [{}])[0].get("summary") == SUMMARY)
+    llm_app.state.stream_error = None
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--decode-ms", type=float, default=3.0, help="per completion token")
+    args = parser.parse_args()
+
+    stage_content = {"insights": INSIGHTS}
+    llm_app = llm_stub_app(args.llm_latency, output_token_latency=args.decode_ms / 1000, stage_content=stage_content)
+    with StubServer(llm_app) as llm, StubServer(search_stub_app(0.1)) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "SERPER_API_KEY": "stub",
+            "TAVILY_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "TAVILY_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "CACHE_REDIS_ENABLED": "false",
+            "LLM_CACHE_ENABLED": "false",
+            "RESULT_CACHE_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        from app.main import app
+        from app.api.routes import research
+        from app.core.config import settings
+
+        asyncio.run(research.chart_pool.start())
+        with StubServer(app, lifespan="off") as server:
+            base_url = f"http://127.0.0.1:{server.port}"
+
+            async def compare():
+                rows = []
+                for mode in ("thorough", "fast"):
+                    for streaming in (False, True):
+                        settings.INSIGHTS_STREAMING_ENABLED = streaming
+                        rows.append((mode, streaming, await run_requests(base_url, mode, args.requests)))
+                return rows
+
+            rows = asyncio.run(compare())
+
+            print("Streaming fallback:")
+            settings.INSIGHTS_STREAMING_ENABLED = True
+            failures = asyncio.run(check_fallback(base_url, llm_app))
+        research.chart_pool.shutdown()
+
+    print(f"{args.requests} streamed requests per row; stub LLM {args.llm_latency * 1000:.0f} ms/call "
+          f"+ {args.decode_ms} ms/completion token (p50 seconds from request start)")
+    print(f"  {'mode':<9} {'insights':<9} {'first text':>10} {'first item':>10} {'insights':>9} {'done':>6}")
+    for mode, streaming, marks in rows:
+        print(f"  {mode:<9} {'streamed' if streaming else 'buffered':<9} {marks['first text']:10.2f} "
+              f"{marks['first item']:10.2f} {marks['insights']:9.2f} {marks['done']:6.2f}")
+
+    if failures:
+        print(f"\n{failures} fallback checks failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: N concurrent /api/v1/research/ requests against a stub LLM server
+
+Compares the legacy blocking Groq client with the async LLMClient layer.
+With a non-blocking client, N requests should finish in roughly one
+pipeline latency (3 LLM round trips) instead of N of them.
+
+Usage (from backend/):
+    python benchmarks/bench_llm_concurrency.py --requests 10 --latency 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app  # noqa: E402
+
+
+async def run_requests(app, count: int) -> float:
+    """Fire `count` research requests concurrently and return wall-clock seconds"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/api/v1/research/", json={"query": f"benchmark query {i}"})
+            for i in range(count)
+        ])
+        elapsed = time.perf_counter() - start
+
+    failed = [r.status_code for r in responses if r.status_code != 200]
+    if failed:
+        raise RuntimeError(f"{len(failed)} requests failed: {failed[:5]}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.5, help="Stub LLM latency (s)")
+    args = parser.parse_args()
+
+    with StubServer(llm_stub_app(args.latency)) as stub:
+        os.environ["GROQ_API_KEY"] = "stub"
+        os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{stub.port}"
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+        os.environ["RESULT_CACHE_ENABLED"] = "false"
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+        from groq import Groq
+        from app.core.config import settings
+        from app.main import app
+        from app.api.routes import research
+
+        agent = research.research_agent
+        asyncio.run(research.chart_pool.start())
+
+        # Isolate LLM latency: searches return immediately
+        async def no_search(client, query):
+            return {}
+        agent._search_serper = no_search
+        agent._search_tavily = no_search
+
+        async_complete = agent.llm.complete_json
+        sync_client = Groq(api_key="stub", base_url=settings.GROQ_BASE_URL)
+
+        async def blocking_complete(prompt, temperature, model=None, stage=None, on_partial=None, partial_depth=2):
+            # Legacy behaviour: synchronous client called from the event loop
+            response = sync_client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=model or settings.DEFAULT_LLM_MODEL,
+                temperature=temperature,
+                response_format={"type": "json_object"}
+            )
+            return json.loads(response.choices[0].message.content)
+
+        pipeline_latency = 3 * args.latency
+        print(f"{args.requests} concurrent requests, stub LLM latency {args.latency:.2f}s "
+              f"(ideal pipeline latency {pipeline_latency:.2f}s)")
+
+        for label, complete in [("blocking", blocking_complete), ("async", async_complete)]:
+            agent.llm.complete_json = complete
+            elapsed = asyncio.run(run_requests(app, args.requests))
+            print(f"  {label:<9} {elapsed:7.2f}s  ({elapsed / pipeline_latency:5.1f}x pipeline latency)")
+
+
+if __name__ == "__main__":
+    main()
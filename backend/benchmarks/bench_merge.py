@@ -0,0 +1,121 @@
+"""
+Benchmark: cross-provider result merging vs concatenating both top-5 lists
+
+Fixture provider responses overlap the way real ones do. Serper and
+Tavily return many of the same articles under URL variants (tracking
+parameters, http/https, "www."/"amp." hosts, AMP paths, trailing
+slashes). Some articles also appear again as syndicated copies on other
+domains. Reports how many results, distinct articles and duplicate
+sources each approach passes on, the extraction context size and the
+merge CPU time.
+
+Usage (from backend/):
+    python benchmarks/bench_merge.py --iterations 200
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_context import BOILERPLATE, TOPICS  # noqa: E402
+from app.agents.context_builder import estimate_tokens, legacy_context  # noqa: E402
+from app.agents.result_merger import merge_results  # noqa: E402
+
+
+SERPER_VARIANTS = [
+    "https://www.{host}/{path}",
+    "https://{host}/{path}/?utm_source=google&utm_medium=organic",
+    "https://{host}/{path}",
+]
+TAVILY_VARIANTS = [
+    "http://{host}/{path}/",
+    "https://amp.{host}/{path}/amp/",
+    "https://{host}/{path}?ref=tavily#top",
+]
+
+
+def provider_responses(query, topic, syndicated: int, seed: int):
+    """Serper "organic" and Tavily "results" lists (10 each) over a shared article pool"""
+    rng = random.Random(f"{query}:{seed}")
+    pool = []
+    count = len(topic["facts"])
+    for i in range(count):
+        # One article per fact, each also citing the next fact
+        facts = [topic["facts"][i], topic["facts"][(i + 1) % count]]
+        pool.append({
+            "article": i,
+            "host": f"site{i}.example.com",
+            "path": f"news/{query.lower().replace(' ', '-')}-{i}",
+            "title": f"{query}: {facts[0].split(',')[0]}",
+            "facts": facts,
+            "body": facts + rng.sample(topic["context"], k=2),
+        })
+    # Syndicated copies: the same article on another domain
+    for j in range(syndicated):
+        original = pool[j]
+        pool.append({**original, "host": f"wire{j}.example.net", "path": f"syndication/{j}"})
+
+    def serper_item(article):
+        url = rng.choice(SERPER_VARIANTS).format(**article)
+        return {"title": article["title"], "link": url, "article": article["article"],
+                "snippet": " ".join(article["facts"][:2])}
+
+    def tavily_item(article):
+        url = rng.choice(TAVILY_VARIANTS).format(**article)
+        # The same article body inside each site's own page chrome
+        chrome = rng.sample(BOILERPLATE, k=4)
+        body = chrome[:2] + article["body"] + chrome[2:]
+        return {"title": article["title"], "url": url, "article": article["article"],
+                "content": " ".join(body)}
+
+    # Both providers favour the same pages, in somewhat different orders
+    serper = [serper_item(a) for a in sorted(pool, key=lambda a: a["article"] + rng.random() * 4)[:10]]
+    tavily = [tavily_item(a) for a in sorted(pool, key=lambda a: a["article"] + rng.random() * 4)[:10]]
+    return serper, tavily
+
+
+def legacy_gather(serper, tavily):
+    """The previous _gather_data combination: both top-5 lists concatenated"""
+    results = serper[:5] + tavily[:5]
+    sources = [{"url": r.get("link") or r.get("url")} for r in results]
+    return results, sources
+
+
+def describe(results):
+    articles = [r["article"] for r in results]
+    return len(results), len(set(articles)), len(articles) - len(set(articles))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--syndicated", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"One article per fixture fact + {args.syndicated} syndicated copies per query; 10 results per provider")
+    print(f"  {'query':<42} {'mode':<7} {'results':>7} {'articles':>8} {'dupes':>5} {'ctx tok':>8} {'merge ms':>9}")
+    for query, topic in TOPICS.items():
+        serper, tavily = provider_responses(query, topic, args.syndicated, seed=0)
+
+        legacy, _ = legacy_gather(serper, tavily)
+        count, distinct, dupes = describe(legacy)
+        print(f"  {query[:42]:<42} {'legacy':<7} {count:7d} {distinct:8d} {dupes:5d} "
+              f"{estimate_tokens(legacy_context(legacy)):8d} {'-':>9}")
+
+        timings = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            merged, stats = merge_results([("serper", serper), ("tavily", tavily)], max_results=10)
+            timings.append((time.perf_counter() - start) * 1000)
+        count, distinct, dupes = describe(merged)
+        print(f"  {'':<42} {'merged':<7} {count:7d} {distinct:8d} {dupes:5d} "
+              f"{estimate_tokens(legacy_context(merged)):8d} {statistics.median(timings):9.2f}"
+              f"   ({stats['url_duplicates']} same URL, {stats['near_duplicates']} near-duplicate)")
+
+
+if __name__ == "__main__":
+    main()
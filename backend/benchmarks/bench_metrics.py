@@ -0,0 +1,125 @@
+"""
+Benchmark: per-call cost of metric updates on the request path, and scrape cost
+
+Times each recording operation the pipeline uses - counter increments,
+in-flight gauge tracking, histogram observations and timers, with and
+without a per-call label lookup - net of an empty loop. Any operation
+over the per-call budget fails the run. Then renders a registry
+populated like a busy server (every stage, provider and cache label) to
+show what one /metrics scrape costs.
+
+Usage (from backend/):
+    python benchmarks/bench_metrics.py --iterations 1000000 --budget-ns 1000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.metrics import Callback, Counter, Gauge, Histogram, Registry  # noqa: E402
+
+
+STAGES = [
+    "analysis", "search", "extraction", "insights", "synthesis", "search.serper", "search.tavily",
+    "charts.line", "charts.bar", "charts.pie", "infographic",
+]
+PROVIDERS = ["serper", "tavily", "groq"]
+
+
+def build_registry():
+    registry = Registry()
+    metrics = {
+        "stage": Histogram("stage_seconds", "Stage duration", ["stage"], registry=registry),
+        "errors": Counter("provider_errors_total", "Provider errors", ["provider"], registry=registry),
+        "in_flight": Gauge("requests_in_flight", "Requests in flight", ["endpoint"], registry=registry),
+    }
+    Callback("cache_hit_ratio", "Cache hit ratio", "gauge", ["cache"],
+             lambda: {(name,): 0.5 for name in ("search", "llm", "result", "chart_image")}, registry=registry)
+    return registry, metrics
+
+
+def record_request(metrics):
+    with metrics["in_flight"].labels("research").track():
+        for stage in ("analysis", "search", "extraction", "insights"):
+            metrics["stage"].labels(stage).observe(0.42)
+        for provider in ("serper", "tavily"):
+            with metrics["stage"].labels(f"search.{provider}").time():
+                pass
+        for chart in ("line", "bar", "pie"):
+            with metrics["stage"].labels(f"charts.{chart}").time():
+                pass
+        with metrics["stage"].labels("infographic").time():
+            pass
+
+
+def per_call_ns(statement: str, namespace, iterations: int, repeat: int) -> float:
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(repeat=repeat, number=iterations)) / iterations * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ns", type=float, default=1000.0)
+    args = parser.parse_args()
+
+    registry, metrics = build_registry()
+    namespace = {
+        **metrics,
+        "counter": metrics["errors"].labels("serper"),
+        "gauge": metrics["in_flight"].labels("research"),
+        "histogram": metrics["stage"].labels("search.serper"),
+        "stage_name": "search.serper",
+    }
+    operations = [
+        ("counter.inc()", "counter.inc()"),
+        ("errors.labels(p).inc()", "errors.labels('serper').inc()"),
+        ("with gauge.track()", "with gauge.track(): pass"),
+        ("histogram.observe(x)", "histogram.observe(0.42)"),
+        ("stage.labels(s).observe(x)", "stage.labels(stage_name).observe(0.42)"),
+        ("with histogram.time()", "with histogram.time(): pass"),
+    ]
+
+    baseline = per_call_ns("pass", namespace, args.iterations, args.repeat)
+    print(f"Per-call cost, best of {args.repeat} x {args.iterations:,} (empty loop {baseline:.0f} ns subtracted)")
+    over = []
+    for name, statement in operations:
+        cost = per_call_ns(statement, namespace, args.iterations, args.repeat) - baseline
+        print(f"  {name:<30} {cost:7.0f} ns")
+        if cost > args.budget_ns:
+            over.append(name)
+
+    # Everything one thorough request records: in-flight gauge, four stage
+    # timings, two provider timers, three chart timers and the infographic
+    namespace["record_request"] = lambda: record_request(metrics)
+    cost = per_call_ns("record_request()", namespace, args.iterations // 10, args.repeat) - baseline
+    print(f"  {'one request (12 updates)':<30} {cost / 1000:7.2f} us")
+
+    for stage in STAGES:
+        for i in range(100):
+            metrics["stage"].labels(stage).observe(i / 10)
+    for provider in PROVIDERS:
+        metrics["errors"].labels(provider).inc()
+    for endpoint in ("research", "stream", "batch"):
+        metrics["in_flight"].labels(endpoint).inc()
+
+    renders = []
+    for _ in range(200):
+        start = time.perf_counter()
+        text = registry.render()
+        renders.append(time.perf_counter() - start)
+    print(f"\nScrape: {len(text.splitlines())} lines, {len(text)} bytes, "
+          f"median render {statistics.median(renders) * 1e6:.0f} us")
+
+    if over:
+        print(f"\nOver the {args.budget_ns:.0f} ns budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: "thorough" (three LLM calls) vs "fast" (one combined call) research
+
+Runs the same queries through POST /research in each mode against stub
+LLM and search servers (result and LLM caches off). The stub LLM's latency
+is a per-call base plus prefill time per prompt token and decode time per
+completion token. Reports request latency and, from the LLM client's usage
+counters, calls plus prompt and completion tokens per request.
+
+Usage (from backend/):
+    python benchmarks/bench_modes.py --requests 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app, search_stub_app  # noqa: E402
+
+
+async def run_mode(app, agent, mode: str, count: int):
+    import httpx
+
+    latencies = []
+    before = dict(agent.llm.usage)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for i in range(count):
+            start = time.perf_counter()
+            response = await client.post("/api/v1/research/", json={
+                "query": f"electric vehicle market growth {2015 + i}",
+                "mode": mode,
+                "cache_control": "no-store",
+            })
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+            assert response.json()["metadata"]["mode"] == mode
+    usage = {key: (agent.llm.usage[key] - before[key]) / count for key in before}
+    return latencies, usage
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--prefill-ms", type=float, default=0.05, help="per prompt token")
+    parser.add_argument("--decode-ms", type=float, default=3.0, help="per completion token")
+    args = parser.parse_args()
+
+    llm_app = llm_stub_app(
+        args.llm_latency,
+        per_token_latency=args.prefill_ms / 1000,
+        output_token_latency=args.decode_ms / 1000
+    )
+    with StubServer(llm_app) as llm, StubServer(search_stub_app(0.1)) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "SERPER_API_KEY": "stub",
+            "TAVILY_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "TAVILY_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "CACHE_REDIS_ENABLED": "false",
+            "LLM_CACHE_ENABLED": "false",
+            "RESULT_CACHE_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        from app.main import app
+        from app.api.routes import research
+
+        asyncio.run(research.chart_pool.start())
+
+        async def compare():
+            rows = {}
+            for mode in ("thorough", "fast"):
+                rows[mode] = await run_mode(app, research.research_agent, mode, args.requests)
+            return rows
+
+        rows = asyncio.run(compare())
+        research.chart_pool.shutdown()
+
+    print(f"{args.requests} requests per mode; stub LLM {args.llm_latency * 1000:.0f} ms/call "
+          f"+ {args.prefill_ms} ms/prompt token + {args.decode_ms} ms/completion token")
+    print(f"  {'mode':<9} {'p50 s':>6} {'mean s':>7} {'LLM calls':>9} {'prompt tok':>10} {'completion tok':>14}")
+    for mode, (latencies, usage) in rows.items():
+        print(f"  {mode:<9} {statistics.median(latencies):6.2f} {statistics.mean(latencies):7.2f} "
+              f"{usage['calls']:9.1f} {usage['prompt_tokens']:10.0f} {usage['completion_tokens']:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
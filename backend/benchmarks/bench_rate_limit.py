@@ -0,0 +1,80 @@
+"""
+Benchmark: a burst of searches against a quota-limited provider, with and
+without the per-provider rate limiter
+
+The stub answers 429 once more than --quota requests arrive in a second.
+Ungoverned, the excess searches fail and (as before) degrade to empty
+results; governed, they queue behind the token bucket, back off on 429 and
+all succeed. Reports successes, 429s seen by the provider, wall clock and
+the limiter's wait metrics.
+
+Usage (from backend/):
+    python benchmarks/bench_rate_limit.py --searches 60 --quota 10
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, quota_stub_app  # noqa: E402
+
+
+async def burst(agent, searches: int):
+    from app.core.http import create_http_client
+
+    async with create_http_client() as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            agent._search_serper(client, f"rate limit query {i}") for i in range(searches)
+        ])
+        elapsed = time.perf_counter() - start
+    return sum(1 for r in results if r.get("organic")), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--searches", type=int, default=60)
+    parser.add_argument("--quota", type=int, default=10, help="Provider requests allowed per second")
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    provider = quota_stub_app(args.quota, args.latency)
+    with StubServer(provider) as stub:
+        os.environ["SERPER_API_URL"] = f"http://127.0.0.1:{stub.port}/search"
+        os.environ["SEARCH_CACHE_ENABLED"] = "false"
+
+        from app.agents.research_agent import ResearchAgent
+        from app.core import rate_limit
+        from app.core.rate_limit import RateLimiter
+
+        agent = ResearchAgent()
+        print(f"{args.searches} concurrent searches, provider quota {args.quota}/s")
+        print(f"  {'mode':<10} {'ok':>4} {'429s':>5} {'wall s':>7} {'retries':>8} "
+              f"{'avg wait ms':>12} {'max wait ms':>12}")
+
+        for mode in ("ungoverned", "governed"):
+            limiter = RateLimiter(
+                "serper",
+                rate_per_minute=args.quota * 60,
+                burst=args.quota,
+                max_in_flight=args.quota,
+                max_retries=5,
+                max_backoff=10,
+                enabled=mode == "governed",
+            )
+            rate_limit._limiters["serper"] = limiter
+            provider.state.rejected = 0
+            # Start each run with a fresh provider window
+            time.sleep(1.05)
+
+            ok, elapsed = asyncio.run(burst(agent, args.searches))
+            stats = limiter.stats()
+            print(f"  {mode:<10} {ok:4d} {provider.state.rejected:5d} {elapsed:7.2f} "
+                  f"{stats['retries']:8d} {stats['wait_avg_ms']:12.1f} {stats['wait_max_ms']:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: legacy string-encoded charts vs single-encoded chart objects
+
+Serves a typical three-chart ResearchResponse two ways through FastAPI:
+"legacy" (each figure a pre-encoded JSON string, default JSONResponse) and
+"object" (figures as objects, one orjson pass). Reports payload size,
+request latency and client-side decode time.
+
+Usage (from backend/):
+    python benchmarks/bench_response_payload.py --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.api.routes.research import (  # noqa: E402
+    ResearchResponse, research_json_response, with_chart_format
+)
+from app.engines.chart_generator import ChartGenerator  # noqa: E402
+
+
+def typical_response() -> ResearchResponse:
+    generator = ChartGenerator()
+    query = "AI startup funding trends in Europe 2024"
+    specs = [
+        ("line", [{"year": str(2018 + i), "value": 25 + i * 17} for i in range(7)], "Trend Over Time"),
+        ("bar", [{"category": f"Country {c}", "value": 10 + i * 6} for i, c in enumerate("ABCDEFGH")], "Comparison"),
+        ("pie", [{"name": f"Segment {i}", "value": v} for i, v in enumerate([35, 28, 22, 15])], "Distribution"),
+    ]
+    charts = [
+        {"type": t, "title": f"{query} - {s}", "data": generator.generate_figure(t, d, f"{query} - {s}")}
+        for t, d, s in specs
+    ]
+    return ResearchResponse(
+        query=query,
+        status="completed",
+        charts=charts,
+        infographics=[],
+        insights={
+            "summary": "European AI startups raised record funding in 2024. " * 10,
+            "key_insights": [f"Insight {i} with specific numbers" for i in range(5)],
+            "recommendations": ["Recommendation 1", "Recommendation 2"],
+        },
+        sources=[{"title": f"Source {i}", "url": f"https://example.com/{i}"} for i in range(10)],
+    )
+
+
+def build_app(result: ResearchResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy", response_model=ResearchResponse)
+    async def legacy_route():
+        # Figures encoded to strings per request, as generate_chart used to
+        return with_chart_format(result, "string")
+
+    @app.get("/object", response_model=ResearchResponse)
+    async def object_route():
+        return research_json_response(result)
+
+    return app
+
+
+def decode(body: bytes, mode: str):
+    payload = json.loads(body)
+    if mode == "legacy":
+        for chart in payload["charts"]:
+            chart["data"] = json.loads(chart["data"])
+    return payload
+
+
+async def measure(app: FastAPI, mode: str, iterations: int):
+    transport = httpx.ASGITransport(app=app)
+    latencies, decode_times = [], []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = await client.get(f"/{mode}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            decode(response.content, mode)
+            decode_times.append((time.perf_counter() - start) * 1000)
+    return len(response.content), latencies, decode_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    app = build_app(typical_response())
+
+    print(f"Three-chart response, {args.iterations} requests per mode")
+    print(f"  {'mode':<7} {'bytes':>8} {'p50 ms':>8} {'mean ms':>8} {'decode ms':>10}")
+    for mode in ("legacy", "object"):
+        size, latencies, decode_times = asyncio.run(measure(app, mode, args.iterations))
+        print(f"  {mode:<7} {size:8d} {statistics.median(latencies):8.3f} "
+              f"{statistics.mean(latencies):8.3f} {statistics.mean(decode_times):10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark: full-text search over past research vs a LIKE scan, and reuse matching
+
+Seeds a research_runs table (fresh SQLite file by default; pass
+--database-url for Postgres) with runs whose queries, summaries and
+source titles are drawn from a topic vocabulary. Times
+ResearchStore.search, which goes through the FTS5 / tsvector index,
+against the LIKE scan it replaces, where every row's text is read per
+search. Then checks ResearchStore.best_match on reworded, near and
+unrelated queries to show which ones a reuse request would be answered
+from a saved run.
+
+Usage (from backend/):
+    python benchmarks/bench_search.py --rows 50000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+SUBJECTS = [
+    "electric vehicle", "solar panel", "cloud computing", "semiconductor", "plant based meat",
+    "online education", "cybersecurity", "wind energy", "streaming video", "drone delivery",
+    "biotech", "fintech lending", "smart home", "quantum computing", "esports", "telehealth",
+]
+ASPECTS = ["market size", "adoption trends", "pricing", "revenue growth", "market share", "investment"]
+REGIONS = ["", "in Europe", "in India", "in the US", "worldwide", "in Southeast Asia"]
+YEARS = ["2022", "2023", "2024", "2025"]
+PUBLISHERS = ["Reuters", "Bloomberg", "Statista", "McKinsey", "Gartner", "TechCrunch"]
+
+# (query, expected to be reused) - seeded runs always include "electric vehicle market size in Europe 2024"
+PROBES = [
+    ("Electric vehicle market size in Europe 2024", True),
+    ("2024 Europe electric vehicle market size?", True),
+    ("electric vehicles market size in Europe 2024", True),
+    ("electric vehicle market size in India 2024", False),
+    ("history of the printing press", False),
+]
+
+
+def make_run(rng: random.Random, created_at: datetime, query: str = None):
+    subject = rng.choice(SUBJECTS)
+    aspect = rng.choice(ASPECTS)
+    query = query or " ".join(part for part in [subject, aspect, rng.choice(REGIONS), rng.choice(YEARS)] if part)
+    titles = [f"{rng.choice(PUBLISHERS)}: {subject.title()} {aspect} report" for _ in range(5)]
+    return {
+        "query": query,
+        "query_key": query.lower(),
+        "mode": "thorough",
+        "status": "completed",
+        "summary": f"The {subject} sector shows strong {aspect}, driven by falling costs and policy support.",
+        "source_titles": "\n".join(titles),
+        "structured_data": {},
+        "charts": [],
+        "insights": {"summary": f"{subject} {aspect}"},
+        "sources": [{"title": title, "url": f"https://example.com/{i}"} for i, title in enumerate(titles)],
+        "timings": {},
+        "created_at": created_at,
+    }
+
+
+async def seed(rows: int):
+    from sqlalchemy import func, insert, select
+    from app.db.models import ResearchRun
+    from app.db.session import get_sessionmaker
+
+    async with get_sessionmaker()() as session:
+        existing = (await session.execute(select(func.count()).select_from(ResearchRun))).scalar()
+        rng = random.Random(0)
+        now = datetime.now(timezone.utc)
+        for offset in range(existing, rows, 5000):
+            batch = [
+                make_run(rng, now - timedelta(days=30) + timedelta(seconds=i * 10))
+                for i in range(offset, min(rows, offset + 5000))
+            ]
+            await session.execute(insert(ResearchRun), batch)
+        # A recent run the reworded probes should be answered from
+        await session.execute(insert(ResearchRun), [
+            make_run(rng, now - timedelta(hours=1), "electric vehicle market size in Europe 2024")
+        ])
+        await session.commit()
+        return (await session.execute(select(func.count()).select_from(ResearchRun))).scalar()
+
+
+async def like_search(query: str, limit: int):
+    """The pre-index approach: substring-match every term across the text columns"""
+    from sqlalchemy import or_, select
+    from sqlalchemy.orm import load_only
+    from app.db.models import ResearchRun
+    from app.db.research import LISTING_COLUMNS
+    from app.db.search import search_terms
+    from app.db.session import get_sessionmaker
+
+    conditions = [
+        column.ilike(f"%{term}%")
+        for term in search_terms(query)
+        for column in (ResearchRun.query, ResearchRun.summary, ResearchRun.source_titles)
+    ]
+    statement = (
+        select(ResearchRun).options(load_only(*LISTING_COLUMNS))
+        .where(or_(*conditions)).order_by(ResearchRun.created_at.desc()).limit(limit)
+    )
+    async with get_sessionmaker()() as session:
+        return list((await session.execute(statement)).scalars())
+
+
+def timed_ms(samples):
+    return statistics.median(samples) * 1000
+
+
+async def run(args):
+    from app.db.research import ResearchStore
+    from app.db.session import close_db, init_db
+
+    await init_db()
+    rows = await seed(args.rows)
+    store = ResearchStore()
+    print(f"{rows} runs; {args.limit} results per search; median of {args.repeat}")
+
+    print(f"  {'query':<46} {'LIKE ms':>8} {'index ms':>9}  top result (score)")
+    for query, _ in PROBES:
+        like_times, index_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            await like_search(query, args.limit)
+            like_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            items = await store.search(query, args.limit)
+            index_times.append(time.perf_counter() - start)
+        top = f"{items[0]['query']} ({items[0]['score']})" if items else "-"
+        print(f"  {query[:46]:<46} {timed_ms(like_times):8.2f} {timed_ms(index_times):9.2f}  {top}")
+
+    print(f"\nReuse (min score {args.min_score}, max age {args.max_age}s)")
+    print(f"  {'query':<46} {'ms':>7}  {'reused run':<46} {'ok':>3}")
+    failures = 0
+    for query, expected in PROBES:
+        start = time.perf_counter()
+        match = await store.best_match(query, "thorough", args.min_score, args.max_age)
+        took = (time.perf_counter() - start) * 1000
+        ok = (match is not None) == expected
+        failures += not ok
+        reused = f"{match['query']} ({match['score']})" if match else "- (runs the pipeline)"
+        print(f"  {query[:46]:<46} {took:7.2f}  {reused[:46]:<46} {'yes' if ok else 'NO':>3}")
+
+    await close_db()
+    if failures:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-score", type=float, default=0.8)
+    parser.add_argument("--max-age", type=float, default=86400)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        path = f"{tempfile.gettempdir()}/bench_search.db"
+        if os.path.exists(path):
+            os.remove(path)
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
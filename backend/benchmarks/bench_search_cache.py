@@ -0,0 +1,140 @@
+"""
+Benchmark: the search cache's shared tier against a local Redis stand-in
+
+Checks TwoTierCache with RedisStandIn as its shared tier: a miss in one
+worker's LRU is answered from the shared tier and promoted with the
+remaining TTL, and a failing shared tier is counted, skipped for
+`redis_retry_after` seconds and picked up again afterwards, with the
+local tier working throughout. Then runs the same searches through two
+agents (two workers) sharing one stand-in, against a stub search
+server, and times a provider call, a shared-tier hit and a local hit.
+
+Usage (from backend/):
+    python benchmarks/bench_search_cache.py --queries 20 --redis-latency 0.001
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import RedisStandIn, StubServer, search_stub_app  # noqa: E402
+
+
+async def check_semantics() -> int:
+    """Shared-tier hits, TTL promotion and degradation when the stand-in fails"""
+    from app.core.cache import TwoTierCache
+
+    failures = 0
+
+    def report(name, ok):
+        nonlocal failures
+        failures += not ok
+        print(f"  {name:<46} {'ok' if ok else 'FAIL'}")
+
+    redis = RedisStandIn()
+    first = TwoTierCache("first", max_entries=8, redis_client=redis, redis_retry_after=0.2)
+    second = TwoTierCache("second", max_entries=8, redis_client=redis, redis_retry_after=0.2)
+
+    await first.set("k", {"organic": [1, 2]}, ttl=120)
+    value = await second.get("k")
+    report("L1 miss answered from the shared tier", value == {"organic": [1, 2]}
+           and second.counters["shared_hits"] == 1 and second.counters["misses"] == 0)
+    expires_at = second.local._data["k"][0] - time.monotonic()
+    report("promoted with the shared tier's remaining TTL", 110 < expires_at <= 120)
+    calls = redis.calls
+    await second.get("k")
+    report("then served locally, shared tier untouched", redis.calls == calls
+           and second.counters["local_hits"] == 1)
+    report("shared miss counts as a miss", await second.get("absent") is None
+           and second.counters["misses"] == 1)
+
+    redis.fail = True
+    await first.set("down", {"organic": [3]}, ttl=120)
+    report("failed set still fills the local tier", await first.get("down") == {"organic": [3]}
+           and first.counters["shared_errors"] == 1)
+    report("failed get is a miss, not an error", await second.get("other") is None
+           and second.counters["shared_errors"] == 1)
+    calls = redis.calls
+    await second.get("other")
+    await second.set("other", {"organic": []}, ttl=120)
+    report("shared tier skipped during redis_retry_after", redis.calls == calls)
+
+    redis.fail = False
+    await asyncio.sleep(0.25)
+    await second.set("after", {"organic": [4]}, ttl=120)
+    report("shared tier used again once retry_after ends", await first.get("after") == {"organic": [4]}
+           and first.counters["shared_hits"] == 1)
+
+    return failures
+
+
+async def compare(search_app, queries: int, redis_latency: float):
+    import httpx
+    from app.agents.research_agent import ResearchAgent
+    from app.core.cache import TwoTierCache
+
+    redis = RedisStandIn(latency=redis_latency)
+    workers = [ResearchAgent(), ResearchAgent()]
+    for agent in workers:
+        await agent.search_cache.close()
+        agent.search_cache = TwoTierCache("search", max_entries=1024, redis_client=redis)
+
+    async def timed(agent, client, query):
+        start = time.perf_counter()
+        await agent._search_serper(client, query)
+        return time.perf_counter() - start
+
+    rows = [
+        ("provider call (worker 1, cold)", workers[0]),
+        ("shared-tier hit (worker 2)", workers[1]),
+        ("local hit (worker 2 again)", workers[1]),
+    ]
+    async with httpx.AsyncClient() as client:
+        print(f"  {'lookup':<32} {'median ms':>10} {'provider calls':>15}")
+        for name, agent in rows:
+            search_app.state.calls = 0
+            samples = [await timed(agent, client, f"topic {i} market size") for i in range(queries)]
+            print(f"  {name:<32} {statistics.median(samples) * 1000:10.3f} {search_app.state.calls:15d}")
+
+    for i, agent in enumerate(workers, 1):
+        print(f"  worker {i}: {agent.search_cache.stats()}")
+        await agent.llm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--search-latency", type=float, default=0.1)
+    # Whole milliseconds: uvicorn installs uvloop, whose timers round to 1 ms
+    parser.add_argument("--redis-latency", type=float, default=0.001)
+    args = parser.parse_args()
+
+    search_app = search_stub_app(args.search_latency)
+    with StubServer(search_app) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "SERPER_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "CACHE_REDIS_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "true",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        print("TwoTierCache with a Redis stand-in:")
+        failures = asyncio.run(check_semantics())
+
+        print(f"\n{args.queries} Serper searches per row, two workers sharing one stand-in "
+              f"({args.redis_latency * 1000:.1f} ms round trip)")
+        asyncio.run(compare(search_app, args.queries, args.redis_latency))
+
+    if failures:
+        print(f"\n{failures} checks failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
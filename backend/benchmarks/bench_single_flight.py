@@ -0,0 +1,150 @@
+"""
+Benchmark: a burst of identical research requests, with and without
+single-flight coalescing
+
+Fires --requests concurrent POST /api/v1/research/ calls for the same query
+(varying only in case and punctuation) against stub LLM and search servers,
+and counts the calls the providers actually receive. Before timing, checks
+SingleFlight's error propagation and cancellation semantics.
+
+Usage (from backend/):
+    python benchmarks/bench_single_flight.py --requests 30
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import StubServer, llm_stub_app, search_stub_app  # noqa: E402
+
+
+async def check_semantics() -> int:
+    """SingleFlight behaviour: shared results, errors, cancellation"""
+    from app.core.single_flight import SingleFlight
+
+    failures = 0
+    flight = SingleFlight("check")
+    started = []
+
+    async def slow(value, fail=False):
+        started.append(value)
+        await asyncio.sleep(0.05)
+        if fail:
+            raise RuntimeError("provider down")
+        return {"value": value}
+
+    def report(name, ok):
+        nonlocal failures
+        failures += not ok
+        print(f"  {name:<42} {'ok' if ok else 'FAIL'}")
+
+    results = await asyncio.gather(*[flight.run("k", lambda: slow(1)) for _ in range(5)])
+    report("five callers, one execution", len(started) == 1 and all(r[0] == {"value": 1} for r in results))
+    report("joiners get independent copies", results[0][0] is not results[1][0])
+
+    errors = await asyncio.gather(
+        *[flight.run("err", lambda: slow(2, fail=True)) for _ in range(3)], return_exceptions=True
+    )
+    report("error reaches every caller", all(isinstance(e, RuntimeError) for e in errors))
+
+    started.clear()
+    first = asyncio.create_task(flight.run("c", lambda: slow(3)))
+    second = asyncio.create_task(flight.run("c", lambda: slow(3)))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    result, shared = await second
+    report("cancelled caller leaves others running", result == {"value": 3} and len(started) == 1)
+
+    started.clear()
+    lone = asyncio.create_task(flight.run("gone", lambda: slow(4)))
+    await asyncio.sleep(0.01)
+    lone.cancel()
+    await asyncio.gather(lone, return_exceptions=True)
+    retry, shared = await flight.run("gone", lambda: slow(5))
+    report("all callers gone cancels, next call restarts", retry == {"value": 5} and not shared)
+
+    return failures
+
+
+async def burst(app, count: int):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/api/v1/research/", json={
+                "query": "Trending topic 2024" if i % 2 else "trending TOPIC, 2024!",
+                "cache_control": "no-cache",
+            })
+            for i in range(count)
+        ])
+        elapsed = time.perf_counter() - start
+    statuses = {}
+    for response in responses:
+        response.raise_for_status()
+        status = response.headers["X-Research-Cache"]
+        statuses[status] = statuses.get(status, 0) + 1
+    return elapsed, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--search-latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    llm_app = llm_stub_app(args.llm_latency)
+    search_app = search_stub_app(args.search_latency)
+    with StubServer(llm_app) as llm, StubServer(search_app) as search:
+        os.environ.update({
+            "GROQ_API_KEY": "stub",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{llm.port}",
+            "SERPER_API_KEY": "stub",
+            "TAVILY_API_KEY": "stub",
+            "SERPER_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "TAVILY_API_URL": f"http://127.0.0.1:{search.port}/search",
+            "CACHE_REDIS_ENABLED": "false",
+            "LLM_CACHE_ENABLED": "false",
+            "SEARCH_CACHE_ENABLED": "false",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+
+        print("SingleFlight semantics:")
+        failures = asyncio.run(check_semantics())
+
+        from app.core.config import settings
+        from app.main import app
+        from app.api.routes import research
+
+        asyncio.run(research.chart_pool.start())
+
+        print(f"\n{args.requests} concurrent requests for one query (result cache read bypassed)")
+        print(f"  {'mode':<13} {'wall s':>7} {'LLM calls':>10} {'searches':>9}  statuses")
+
+        # One event loop for every mode: the provider clients are bound to it
+        async def compare():
+            for enabled in (False, True):
+                settings.SINGLE_FLIGHT_ENABLED = enabled
+                llm_app.state.calls = search_app.state.calls = 0
+                elapsed, statuses = await burst(app, args.requests)
+                mode = "single-flight" if enabled else "independent"
+                print(f"  {mode:<13} {elapsed:7.2f} {llm_app.state.calls:10d} "
+                      f"{search_app.state.calls:9d}  {statuses}")
+
+        asyncio.run(compare())
+
+        print(f"  coalesced: {research.research_flight.stats()}")
+        research.chart_pool.shutdown()
+
+    if failures:
+        print(f"\n{failures} semantics checks failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
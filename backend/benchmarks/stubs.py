@@ -0,0 +1,308 @@
+"""
+Local stub servers used by the benchmarks (no real API keys or network needed)
+"""
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+STUB_COMPLETION = {
+    "intent": "trend_analysis",
+    "data_needed": ["market size", "growth rate"],
+    "visualizations": {
+        "primary": "line_chart",
+        "secondary": ["bar_chart"],
+        "infographic_type": "statistics"
+    },
+    "key_metrics": ["market size"],
+    "trend_data": [
+        {"year": "2021", "value": 42},
+        {"year": "2022", "value": 68},
+        {"year": "2023", "value": 95}
+    ],
+    "comparison_data": [
+        {"category": "Category A", "value": 45},
+        {"category": "Category B", "value": 28}
+    ],
+    "summary": "Stub summary.",
+    "key_insights": ["Stub insight"],
+    "recommendations": ["Stub recommendation"]
+}
+
+
+# Per-prompt slices of STUB_COMPLETION, so completion sizes resemble each stage's real answer
+STUB_STAGE_KEYS = {
+    "analysis": ("intent", "data_needed", "visualizations", "key_metrics"),
+    "extraction": ("trend_data", "comparison_data"),
+    "insights": ("summary", "key_insights", "recommendations"),
+}
+
+
+def stub_completion(prompt: str, stage_content: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """The STUB_COMPLETION part a research-agent prompt asks for (or its stage_content override)"""
+
+    def pick(stage: str) -> Dict[str, Any]:
+        if stage_content and stage in stage_content:
+            return stage_content[stage]
+        return {key: STUB_COMPLETION[key] for key in STUB_STAGE_KEYS[stage]}
+
+    if '"query_analysis"' in prompt:
+        return {
+            "query_analysis": pick("analysis"),
+            "structured_data": pick("extraction"),
+            "insights": pick("insights"),
+        }
+    if prompt.startswith("Analyze this research query and determine"):
+        return pick("analysis")
+    if "extract structured data" in prompt:
+        return pick("extraction")
+    if "insightful analysis" in prompt:
+        return pick("insights")
+    return STUB_COMPLETION
+
+
+def free_port() -> int:
+    """Return an unused localhost TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def llm_stub_app(
+    latency: float,
+    content: Optional[Dict[str, Any]] = None,
+    slow_share: float = 0.0,
+    slow_latency: float = 0.0,
+    per_token_latency: float = 0.0,
+    output_token_latency: float = 0.0,
+    stage_content: Optional[Dict[str, Dict[str, Any]]] = None
+) -> FastAPI:
+    """
+    OpenAI/Groq-compatible chat completions endpoint with a fixed latency
+
+    A `slow_share` of prompts take `slow_latency` instead, to model a
+    heavy latency tail. Which ones is seeded by the prompt, so every run
+    slows the same calls.
+    `per_token_latency` adds prefill time per estimated prompt token
+    (four characters each) and `output_token_latency` decode time per
+    completion token. Without `content`, each prompt gets the part
+    of STUB_COMPLETION it asks for (see stub_completion); reported usage
+    is estimated from the prompt and completion lengths.
+
+    Requests with "stream": true get Server-Sent chunk events of one
+    estimated token each, paced by `output_token_latency`, with usage in
+    the final chunk's x_groq field (as Groq sends it). Setting
+    `app.state.stream_error` makes them fail: "reject" answers 400, as a
+    provider without JSON mode for streams does, and "drop" ends the
+    stream halfway through the completion.
+    """
+
+    app = FastAPI()
+    app.state.calls = 0
+    app.state.slow_calls = 0
+    app.state.stream_calls = 0
+    app.state.stream_error = None
+
+    @app.post("/openai/v1/chat/completions")
+    async def chat_completions(request: Request):
+        app.state.calls += 1
+        payload = await request.json()
+        prompt = "".join(m.get("content") or "" for m in payload.get("messages", []))
+        body = json.dumps(content or stub_completion(prompt, stage_content))
+        slow = slow_share and random.Random(prompt).random() < slow_share
+        app.state.slow_calls += bool(slow)
+        delay = slow_latency if slow else latency
+        usage = {
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": len(body) // 4,
+            "total_tokens": (len(prompt) + len(body)) // 4
+        }
+
+        if payload.get("stream"):
+            app.state.stream_calls += 1
+            stream_error = app.state.stream_error
+            if stream_error == "reject":
+                return JSONResponse({"error": {
+                    "message": "response_format `json_object` is not supported with stream",
+                    "type": "invalid_request_error",
+                }}, status_code=400)
+
+            async def chunks():
+                await asyncio.sleep(delay + per_token_latency * len(prompt) / 4)
+                tokens = [body[i:i + 4] for i in range(0, len(body), 4)]
+                for i, token in enumerate(tokens):
+                    if stream_error == "drop" and i == len(tokens) // 2:
+                        return
+                    last = i == len(tokens) - 1
+                    chunk = {
+                        "id": "stub",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": "stub",
+                        "choices": [{
+                            "index": 0,
+                            "delta": {"content": token},
+                            "finish_reason": "stop" if last else None
+                        }],
+                        "x_groq": {"id": "stub", "usage": usage} if last else None
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    await asyncio.sleep(output_token_latency)
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(chunks(), media_type="text/event-stream")
+
+        await asyncio.sleep(delay + (per_token_latency * len(prompt) + output_token_latency * len(body)) / 4)
+        return {
+            "id": "stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "stub",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": body},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }
+
+    return app
+
+
+def search_stub_app(latency: float, results: int = 10) -> FastAPI:
+    """Serper/Tavily-compatible /search endpoint with a fixed latency"""
+
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.post("/search")
+    async def search(request: Request):
+        app.state.calls += 1
+        payload = await request.json()
+        query = payload.get("q") or payload.get("query", "")
+        await asyncio.sleep(latency)
+        items = [
+            {
+                "title": f"{query} result {i}",
+                "link": f"https://example.com/{i}",
+                "url": f"https://example.com/{i}",
+                "snippet": f"{query} grew {10 + i}% in 2024 to ${i + 1}B.",
+                "content": f"{query} grew {10 + i}% in 2024 to ${i + 1}B."
+            }
+            for i in range(results)
+        ]
+        return {"organic": items, "results": items}
+
+    return app
+
+
+def quota_stub_app(per_second: int, latency: float = 0.0, retry_after: Optional[int] = 1) -> FastAPI:
+    """Search endpoint that answers 429 (with Retry-After) past a per-second quota"""
+
+    app = FastAPI()
+    app.state.window = 0
+    app.state.count = 0
+    app.state.rejected = 0
+    search = search_stub_app(latency)
+
+    @app.post("/search")
+    async def limited_search(request: Request):
+        window = int(time.monotonic())
+        if window != app.state.window:
+            app.state.window, app.state.count = window, 0
+        app.state.count += 1
+        if app.state.count > per_second:
+            app.state.rejected += 1
+            headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+            return JSONResponse({"error": "rate limited"}, status_code=429, headers=headers)
+        return await search.router.routes[-1].endpoint(request)
+
+    return app
+
+
+class RedisStandIn:
+    """
+    In-memory stand-in for redis.asyncio: async get / set(ex=) / ttl
+
+    Values come back as bytes, as from Redis. `latency` adds a simulated
+    round trip to each call; setting `fail` makes every call raise
+    ConnectionError, like a Redis that went away.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.fail = False
+        self.calls = 0
+        self._data: Dict[str, tuple] = {}
+
+    async def _call(self):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail:
+            raise ConnectionError("Error connecting to redis stand-in")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        await self._call()
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: str, ex: int):
+        await self._call()
+        self._data[key] = (time.monotonic() + ex, value.encode("utf-8"))
+
+    async def ttl(self, key: str) -> int:
+        await self._call()
+        entry = self._data.get(key)
+        return int(entry[0] - time.monotonic()) if entry else -2
+
+
+def self_signed_cert(directory: str) -> tuple:
+    """Create a throwaway localhost certificate; returns (certfile, keyfile)"""
+    certfile = os.path.join(directory, "stub.crt")
+    keyfile = os.path.join(directory, "stub.key")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", keyfile, "-out", certfile, "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+class StubServer:
+    """Runs an ASGI app under uvicorn on a background thread"""
+
+    def __init__(self, app: FastAPI, port: Optional[int] = None, **uvicorn_kwargs):
+        self.port = port or free_port()
+        self.config = uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level="error", **uvicorn_kwargs
+        )
+        self.server = uvicorn.Server(self.config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> "StubServer":
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join()